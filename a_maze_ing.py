@@ -1,8 +1,13 @@
 from pydantic import ValidationError
-from mazegen import MazeGenerator
+from mazegen import MazeGenerator, hexio
+from mazegen.ansi import AnsiRenderer
+from mazegen.frames import FrameScheduler
+from mazegen.solvers import make_solver
 from typing import List, Any, Optional
 import curses as cs
-import time
+import cProfile
+import os
+import pstats
 import sys
 
 
@@ -11,6 +16,8 @@ def output_maze(
     start: tuple[int, int],
     end: tuple[int, int],
     path_find: list[str],
+    filename: str = "output_maze.txt",
+    compression: Optional[str] = None,
 ) -> str:
     """
     Write maze data to an output file.
@@ -23,24 +30,22 @@ def output_maze(
         coordinates of the end position.
         path_find: A string or sequence representing
         the path solution through the maze.
+        filename: The output file (OUTPUT_FILE).
+        compression: "none", "gzip" or "lzma" (COMPRESSION); None picks
+        it from the extension of `filename`.
 
     Returns:
         list str
 
     Writes the maze grid, start position, end position,
-    and solution path to 'output_maze.txt'.
+    and solution path to `filename`, compressed row by row
+    if requested (see `mazegen.hexio`).
     """
-    with open("output_maze.txt", "w") as file:
-        for line in lines:
-            file.write(line + "\n")
-        file.write("\n")
-        file.write(f"{start[0]},{start[1]}\n")
-        file.write(f"{end[0]},{end[1]}\n")
-        file.write("".join(path_find) + "\n")
-        full_str = "\n".join(lines) + "\n\n"
-        full_str += f"{start[0]},{start[1]}\n"
-        full_str += f"{end[0]},{end[1]}\n"
-        full_str += "".join(path_find) + "\n"
+    hexio.write(filename, lines, start, end, path_find, compression)
+    full_str = "\n".join(lines) + "\n\n"
+    full_str += f"{start[0]},{start[1]}\n"
+    full_str += f"{end[0]},{end[1]}\n"
+    full_str += "".join(path_find) + "\n"
     return full_str
 
 
@@ -73,7 +78,12 @@ def update_output(
     short_path = ShortPath.shortest_path(generator, maze)
     if short_path:
         output_map = output_maze(
-            hex_map, generator.start_pos, generator.end_pos, short_path
+            hex_map,
+            generator.start_pos,
+            generator.end_pos,
+            short_path,
+            generator.output_file,
+            generator.compression,
         )
     return output_map
 
@@ -140,6 +150,10 @@ class Button:
         self.focused = not self.focused
 
 
+# How long the idle menu blocks waiting for a key, in milliseconds.
+IDLE_TIMEOUT_MS = 1000
+
+
 class Visualizer:
     """
     Manages the graphical terminal interface using the curses library.
@@ -148,13 +162,21 @@ class Visualizer:
     the maze, setting up the interactive button menu, and handling user
     inputs (keyboard events) to trigger various actions like solving or
     regenerating the maze.
+
+    Animations go through a `FrameScheduler`: while one runs, 's' or space
+    skips to its end and '+' / '-' double or halve the speed.
     """
-    def __init__(
-        self,
-    ) -> None:
-        """Initializes the curses screen and sets non-blocking input."""
+    def __init__(self, fps: float = 60.0, speed: int = 1) -> None:
+        """
+        Initializes the curses screen and sets non-blocking input.
+
+        Args:
+            fps (float): Maximum animation frame rate.
+            speed (int): Initial number of algorithm steps per frame.
+        """
         self.__screen = cs.initscr()
         self.__screen.nodelay(True)
+        self.__frames = FrameScheduler(self.__screen, fps, speed)
 
     @property
     def screen(self) -> "cs.window":
@@ -171,9 +193,14 @@ class Visualizer:
         Starts the main event loop for the maze visualizer.
 
         This method generates the initial maze, sets up the UI components
-        (buttons), and listens continuously for keyboard inputs to interact
-        with the maze (e.g., changing colors, running A* or DFS solvers,
-        clearing the board, or exiting).
+        (buttons), and waits for keyboard inputs to interact with the maze
+        (e.g., changing colors, running A* or DFS solvers, clearing the
+        board, or exiting).
+
+        The loop is event driven: it blocks in `getch` (waking up every
+        IDLE_TIMEOUT_MS), redraws the maze only after an action and only
+        the buttons whose focus changed after a move, so an idle session
+        uses no CPU.
 
         Args:
             generator (MazeGenerator): The main generator instance containing
@@ -184,8 +211,8 @@ class Visualizer:
         hide = False
         generator.setup_colors()
         try:
-            maze = generator.maze_gen(self.__screen)
-            generator.solver_astar.solve(maze, self.__screen)
+            maze = generator.maze_gen(self.__frames)
+            generator.solver_astar.solve(maze, self.__frames)
             update_output(generator, maze)
             generator.clear_path(maze)
             self.__screen.refresh()
@@ -202,24 +229,30 @@ class Visualizer:
             Button((4, 1), "regen"),
         ]
         win = cs.newwin(len(buttons) + 1, 36, len(maze), 0)
-        win.border()
         win.keypad(True)
-        win.move(0, 12)
-        try:
-            win.addstr("A-MAZE-ING")
-        except Exception:
-            pass
+        win.timeout(IDLE_TIMEOUT_MS)
+        self.draw_chrome(win)
         select = 0
         buttons[0].toggle_focus()
+        redraw_maze = True
+        redraw_buttons = list(buttons)
         while True:
-            generator.print_maze(self.__screen, maze, hide)
-            for but in buttons:
+            if redraw_maze:
+                generator.print_maze(self.__screen, maze, hide)
+                self.__screen.noutrefresh()
+                win.touchwin()
+                redraw_maze = False
+            for but in redraw_buttons:
                 try:
                     but.draw(win)
                 except Exception:
                     pass
-            self.__screen.refresh()
+            redraw_buttons = []
+            win.noutrefresh()
+            cs.doupdate()
             char = win.getch()
+            if char == -1:
+                continue
             old_select = select
             if char == cs.KEY_UP:
                 select = (select - 2) % len(buttons)
@@ -229,52 +262,49 @@ class Visualizer:
                 select = (select - 1) % len(buttons)
             elif char == cs.KEY_DOWN:
                 select = (select + 2) % len(buttons)
+            elif char == cs.KEY_RESIZE:
+                self.__screen.clear()
+                self.draw_chrome(win)
+                redraw_maze = True
+                redraw_buttons = list(buttons)
             elif char in [10, 13, cs.KEY_ENTER]:
+                redraw_maze = True
                 match select:
                     case 0:
                         break
                     case 1:
-                        generator.clear_all(maze)
+                        generator.clear_all(maze, generator.stats)
                     case 2:
                         hide = not hide
                     case 3:
                         generator.change_color(maze)
+                        redraw_buttons = list(buttons)
                     case 4:
                         try:
                             hide = False
-                            generator.clear_all(maze=maze)
-                            generator.solver_astar.solve(maze, self.__screen)
+                            generator.clear_all(maze, generator.stats)
+                            generator.solver_astar.solve(maze, self.__frames)
                             generator.clear_path(maze)
-                            self.__screen.refresh()
                         except ValueError as e:
                             print(e)
                     case 5:
                         try:
                             hide = False
-                            generator.clear_all(maze=maze)
-                            generator.solver_dfs.solve(maze, self.__screen)
+                            generator.clear_all(maze, generator.stats)
+                            generator.solver_dfs.solve(maze, self.__frames)
                             generator.clear_path(maze)
-                            self.__screen.refresh()
                         except ValueError as e:
                             print(e)
                     case 6:
                         hide = False
-                        maze = generator.maze_gen(self.__screen)
-                        generator.solver_astar.solve(maze, self.__screen)
+                        maze = generator.maze_gen(self.__frames)
+                        generator.solver_astar.solve(maze, self.__frames)
                         update_output(generator, maze)
                         generator.clear_path(maze)
             if old_select != select:
                 buttons[old_select].toggle_focus()
                 buttons[select].toggle_focus()
-            win.border()
-            win.move(0, 12)
-            try:
-                win.addstr("A-MAZE-ING")
-            except Exception:
-                pass
-            win.refresh()
-            self.__screen.refresh()
-            time.sleep(1 / 60)
+                redraw_buttons += [buttons[old_select], buttons[select]]
         print(generator.width)
         print(generator.height)
         win.keypad(False)
@@ -282,6 +312,21 @@ class Visualizer:
         win.refresh()
         update_output(generator, maze)
 
+    @staticmethod
+    def draw_chrome(win: Any) -> None:
+        """
+        Draw the static parts of the menu window: its border and title.
+
+        They are drawn once and kept in the window buffer; `touchwin` is
+        enough to repaint them after the maze has been redrawn.
+        """
+        win.border()
+        win.move(0, 12)
+        try:
+            win.addstr("A-MAZE-ING")
+        except Exception:
+            pass
+
     def close_screen(self) -> None:
         """
         Safely shuts down the curses interface.
@@ -306,10 +351,14 @@ class ShortPath:
         generator: MazeGenerator, maze: List[List[int]]
     ) -> List[str]:
         """
-        Calculates the shortest path using the A* algorithm.
+        Calculates the shortest path using the default solver.
+
+        The solver is `mazegen.solvers.DEFAULT_SOLVER` (A*); see
+        `benchmarks/solvers.py` to compare the registered solvers.
 
         Args:
-            generator (MazeGenerator): The generator containing the solver.
+            generator (MazeGenerator): The generator containing the
+                entry and exit positions.
             maze (List[List[int]]): The 2D array representation of the maze.
 
         Returns:
@@ -319,31 +368,98 @@ class ShortPath:
         """
         try:
             generator.clear_path(maze)
-            astar_path = generator.solver_astar.solve(maze)
-            shortest: List[str] = astar_path
+            solver = make_solver(generator.start_pos, generator.end_pos)
+            with generator.stats.phase("solve"):
+                path = solver.solve(maze, stats=generator.stats)
+            shortest: List[str] = path
         except ValueError:
             print("path is invalid")
         return shortest
 
 
+def render_ansi(generator: MazeGenerator) -> None:
+    """
+    Draw the maze with raw ANSI sequences instead of the curses menu.
+
+    On a terminal, the generation and the A* search are animated with an
+    `AnsiRenderer`. When stdout is redirected, a single frame of the solved
+    maze is written instead, which makes a cheap snapshot for CI. Both ways
+    write OUTPUT_FILE through `update_output`, like the curses menu.
+
+    Args:
+        generator (MazeGenerator): The generator to draw.
+    """
+    renderer = AnsiRenderer()
+    if not os.isatty(renderer.fd):
+        maze = [list(row) for row in generator.maze]
+        update_output(generator, maze)
+        generator.mark_path(maze, generator.start, generator.path)
+        os.write(renderer.fd, renderer.text(maze))
+        return
+    with renderer:
+        frames = FrameScheduler(renderer)
+        maze = generator.maze_gen(frames)
+        generator.solver_astar.solve(maze, frames)
+        update_output(generator, maze)
+
+
+def print_profile(
+    generator: MazeGenerator, profiler: cProfile.Profile
+) -> None:
+    """
+    Report the instrumentation collected during a `--profile` run.
+
+    Prints the per-phase timers and counters of the generator and the 20
+    most expensive functions seen by cProfile to stderr, and writes the
+    phase spans to 'profile_spans.json' (Chrome trace event format).
+
+    Parameters
+    ----------
+    generator : MazeGenerator
+        The profiled generator.
+    profiler : cProfile.Profile
+        The profiler that ran around the session.
+    """
+    print(generator.stats.report(), file=sys.stderr)
+    stats = pstats.Stats(profiler, stream=sys.stderr)
+    stats.sort_stats("cumulative").print_stats(20)
+    generator.stats.export_spans("profile_spans.json")
+
+
 def main() -> None:
     """
     Main entry point for the maze generator script.
 
     Validates command-line arguments, initializes the maze generation
     configuration, and starts the curses visualizer. Catches and prints
-    validation or value errors during execution.
+    validation or value errors during execution. With `--profile`, phase
+    timers, counters and a cProfile summary are reported on exit. With
+    `--ansi`, the maze is drawn by `render_ansi` instead of curses. With
+    `--debug`, every generated maze is verified (see `mazegen.verify`).
     """
-    av = sys.argv
+    flags = ("--profile", "--ansi", "--debug")
+    av = [arg for arg in sys.argv if arg not in flags]
+    profile = "--profile" in sys.argv
+    ansi = "--ansi" in sys.argv
+    debug = "--debug" in sys.argv
     ac = len(av)
     if ac != 2:
         print("error arg")
         sys.exit(1)
+    profiler = cProfile.Profile()
     try:
-        generator = MazeGenerator(av[1])
-        visu = Visualizer()
-        visu.render(generator)
-        visu.close_screen()
+        if profile:
+            profiler.enable()
+        generator = MazeGenerator(av[1], profile=profile, debug=debug)
+        if ansi:
+            render_ansi(generator)
+        else:
+            visu = Visualizer()
+            visu.render(generator)
+            visu.close_screen()
+        if profile:
+            profiler.disable()
+            print_profile(generator, profiler)
     except (ValidationError, ValueError) as e:
         if isinstance(e, ValueError):
             print(e)
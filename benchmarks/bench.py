@@ -0,0 +1,259 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+import argparse
+import curses
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from a_maze_ing import output_maze
+from mazegen import Config, MazeGenerator, __version__
+from mazegen.ansi import AnsiRenderer
+from mazegen.astar import AStar
+from mazegen.bulk import solve_many
+from mazegen.chunks import ChunkedMaze
+from mazegen.image import write_png, write_ppm
+from mazegen.verify import verify
+
+
+class FakeScreen:
+    """Stand-in for a curses window that only counts drawing calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def addstr(self, *args: Any) -> None:
+        self.calls += 1
+
+    def addch(self, *args: Any) -> None:
+        self.calls += 1
+
+    def refresh(self) -> None:
+        pass
+
+
+def make_generator(
+    size: int, perfect: bool, seed: int = 42, algorithm: str = "backtracker"
+) -> MazeGenerator:
+    """Build a seeded square maze generator of `size` x `size` cells."""
+    params: Dict[str, Any] = {
+        "WIDTH": size,
+        "HEIGHT": size,
+        "ENTRY": "0,0",
+        "EXIT": f"{size - 1},{size - 1}",
+        "PERFECT": perfect,
+        "SEED": seed,
+        "OUTPUT_FILE": "output_maze.txt",
+        "ALGORITHM": algorithm,
+    }
+    return MazeGenerator(config=Config(**params))
+
+
+def headless_print(generator: MazeGenerator) -> Callable[[], Any]:
+    """
+    Render the maze with `print_maze` on a FakeScreen.
+
+    `curses.color_pair` needs an initialized terminal, so it is replaced by
+    a pure function for the duration of the call.
+    """
+    def run() -> int:
+        screen = FakeScreen()
+        color_pair = curses.color_pair
+        curses.color_pair = lambda n: n << 8
+        try:
+            generator.print_maze(screen, generator.maze)
+        finally:
+            curses.color_pair = color_pair
+        return screen.calls
+
+    return run
+
+
+def headless_ansi(generator: MazeGenerator) -> Callable[[], Any]:
+    """Render a full frame with an `AnsiRenderer` writing to /dev/null."""
+    fd = os.open(os.devnull, os.O_WRONLY)
+    renderer = AnsiRenderer(fd)
+
+    def run() -> int:
+        renderer.invalidate()
+        return renderer.render(generator.maze)
+
+    return run
+
+
+def write_output(generator: MazeGenerator) -> Callable[[], Any]:
+    """Run `output_maze` inside a scratch directory."""
+    hex_map = generator.convert_hex_maze(generator.maze)
+
+    def run() -> str:
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                return output_maze(
+                    hex_map, generator.start_pos, generator.end_pos,
+                    generator.path,
+                )
+            finally:
+                os.chdir(cwd)
+
+    return run
+
+
+def image_export(generator: MazeGenerator, png: bool) -> Callable[[], Any]:
+    """Stream a solved PNG or PPM image (2 pixels per cell) to /dev/null."""
+    writer = write_png if png else write_ppm
+
+    def run() -> None:
+        with open(os.devnull, "wb") as file:
+            writer(
+                file, generator.maze, 2, generator.path, generator.start
+            )
+
+    return run
+
+
+def threaded_generate(generator: MazeGenerator) -> Callable[[], Any]:
+    """Generate and solve from 32 threads sharing one generator."""
+    expected = generator.generate()
+
+    def run() -> None:
+        with ThreadPoolExecutor(32) as pool:
+            results = list(pool.map(lambda _: generator.generate(), range(32)))
+        if any(result != expected for result in results):
+            raise RuntimeError("concurrent generate() results differ")
+
+    return run
+
+
+def exit_candidates(generator: MazeGenerator, bulk: bool) -> Callable[[], Any]:
+    """Solve from the entry to every cell of the last row."""
+    pairs = [
+        (generator.start_pos, (x, generator.height - 1))
+        for x in range(generator.width)
+    ]
+    if bulk:
+        return lambda: solve_many(generator.maze, pairs)
+    return lambda: [AStar(*pair).solve(generator.maze) for pair in pairs]
+
+
+Case = Callable[[MazeGenerator, MazeGenerator], Callable[[], Any]]
+
+CASES: Dict[str, Case] = {
+    "maze_gen_perfect": lambda p, i: p.maze_gen,
+    "maze_gen_imperfect": lambda p, i: i.maze_gen,
+    "maze_gen_tiled": lambda p, i: make_generator(
+        p.width, True, algorithm="tiled"
+    ).maze_gen,
+    "astar_solve": lambda p, i: lambda: i.solver_astar.solve(i.maze),
+    "dfs_solve": lambda p, i: lambda: i.solver_dfs.solve(i.maze),
+    "exit_candidates_astar": lambda p, i: exit_candidates(i, False),
+    "exit_candidates_bulk": lambda p, i: exit_candidates(i, True),
+    "verify": lambda p, i: lambda: verify(i.maze),
+    "convert_hex_maze": lambda p, i: lambda: i.convert_hex_maze(i.maze),
+    "output_maze": lambda p, i: write_output(i),
+    "print_maze": lambda p, i: headless_print(i),
+    "ansi_render": lambda p, i: headless_ansi(i),
+    "export_ppm": lambda p, i: image_export(i, False),
+    "export_png": lambda p, i: image_export(i, True),
+    "generate_32_threads": lambda p, i: threaded_generate(i),
+    "chunked_region": lambda p, i: lambda: ChunkedMaze(42).region(
+        -p.width // 2, -p.height // 2, p.width, p.height
+    ),
+}
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Time `func` and record its peak traced memory.
+
+    The best of `repeat` untraced runs gives the time; one extra run under
+    tracemalloc gives the peak number of bytes allocated.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def import_time() -> int:
+    """Return the cumulative `import mazegen` time in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mazegen"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == "mazegen":
+            return int(fields[1])
+    return -1
+
+
+def run(sizes: List[int], cases: List[str], repeat: int) -> Dict[str, Any]:
+    """Run the selected cases for every size and collect the results."""
+    results = []
+    for size in sizes:
+        perfect = make_generator(size, True)
+        imperfect = make_generator(size, False)
+        for name in cases:
+            func = CASES[name](perfect, imperfect)
+            stats = measure(func, repeat)
+            results.append({"case": name, "size": size, **stats})
+            print(
+                f"{name:>20} {size:>5}x{size:<5} {stats['seconds']:.6f}s "
+                f"{stats['peak_bytes'] / 1024:.0f} KiB",
+                file=sys.stderr,
+            )
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "import_us": import_time(),
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Entry point of `python -m benchmarks.bench` (see `make bench`)."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench")
+    parser.add_argument(
+        "--sizes",
+        default="10,50,100",
+        help="comma separated maze sizes, e.g. 10,100,1000,4000",
+    )
+    parser.add_argument(
+        "--cases", default=",".join(CASES), help="comma separated case names"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="-", help="JSON file or '-'")
+    args = parser.parse_args()
+    cases = args.cases.split(",")
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+    sizes = [int(size) for size in args.sizes.split(",")]
+    report = json.dumps(run(sizes, cases, args.repeat), indent=2)
+    if args.output == "-":
+        print(report)
+    else:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
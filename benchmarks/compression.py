@@ -0,0 +1,92 @@
+from typing import Any, Dict, List
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench import make_generator
+from mazegen import MazeGenerator
+from mazegen.hexio import EXTENSIONS, read, write
+
+
+def compare(
+    generator: MazeGenerator, compression: str, directory: str
+) -> Dict[str, Any]:
+    """
+    Write and read back the hex output of `generator` with one compression.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Raw and written sizes, compression ratio, and write and read
+        throughput in raw megabytes per second.
+    """
+    rows = generator.convert_hex_maze(generator.maze)
+    filename = os.path.join(directory, "maze.txt" + EXTENSIONS[compression])
+    start = time.perf_counter()
+    write(
+        filename, rows, generator.start_pos, generator.end_pos,
+        generator.path, compression,
+    )
+    written = time.perf_counter() - start
+    start = time.perf_counter()
+    loaded = read(filename)
+    loaded_in = time.perf_counter() - start
+    if loaded[0] != rows:
+        raise RuntimeError(f"{compression} round trip differs")
+    raw = sum(len(row) + 1 for row in rows) + len(generator.path) + 16
+    size = os.path.getsize(filename)
+    return {
+        "raw_bytes": raw,
+        "file_bytes": size,
+        "ratio": raw / size,
+        "write_mb_s": raw / written / 1e6,
+        "read_mb_s": raw / loaded_in / 1e6,
+    }
+
+
+def main() -> None:
+    """Entry point of `python -m benchmarks.compression`."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compression")
+    parser.add_argument("--sizes", default="50,200,1000")
+    parser.add_argument("--codecs", default=",".join(EXTENSIONS))
+    parser.add_argument("--output", default="-", help="JSON file or '-'")
+    args = parser.parse_args()
+    results: List[Dict[str, Any]] = []
+    print(
+        f"{'codec':>6} {'size':>6} {'ratio':>8} {'write MB/s':>11} "
+        f"{'read MB/s':>10}",
+        file=sys.stderr,
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (int(size) for size in args.sizes.split(",")):
+            for perfect in (True, False):
+                generator = make_generator(size, perfect)
+                for codec in args.codecs.split(","):
+                    result = compare(generator, codec, directory)
+                    results.append(
+                        {
+                            "codec": codec,
+                            "size": size,
+                            "perfect": perfect,
+                            **result,
+                        }
+                    )
+                    print(
+                        f"{codec:>6} {size:>6} {result['ratio']:>8.2f} "
+                        f"{result['write_mb_s']:>11.1f} "
+                        f"{result['read_mb_s']:>10.1f}",
+                        file=sys.stderr,
+                    )
+    report = json.dumps({"results": results}, indent=2)
+    if args.output == "-":
+        print(report)
+    else:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
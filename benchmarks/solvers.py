@@ -0,0 +1,184 @@
+from collections import deque
+from typing import Any, Dict, List, Sequence, Tuple
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+from benchmarks.bench import make_generator
+from mazegen import MazeGenerator
+from mazegen.solvers import SOLVERS, make_solver
+from mazegen.stats import Stats
+
+MOVES = {"N": (-1, 0), "S": (1, 0), "W": (0, -1), "E": (0, 1)}
+
+
+def shortest_length(
+    maze: Sequence[Sequence[int]], start: Tuple[int, int], end: Tuple[int, int]
+) -> int:
+    """
+    Reference shortest path length, by breadth-first search.
+
+    Parameters
+    ----------
+    maze : Sequence[Sequence[int]]
+        The maze grid.
+    start : Tuple[int, int]
+        Entry position in grid units (row, col).
+    end : Tuple[int, int]
+        Exit position in grid units (row, col).
+
+    Returns
+    -------
+    int
+        The number of moves of a shortest path, or -1 if there is none.
+    """
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == end:
+            return dist[end]
+        for d_x, d_y in MOVES.values():
+            nxt = (x + 2 * d_x, y + 2 * d_y)
+            if (
+                0 <= nxt[0] < len(maze)
+                and 0 <= nxt[1] < len(maze[0])
+                and maze[x + d_x][y + d_y] != 0
+                and maze[nxt[0]][nxt[1]] != 0
+                and nxt not in dist
+            ):
+                dist[nxt] = dist[(x, y)] + 1
+                queue.append(nxt)
+    return -1
+
+
+def grid_steps(
+    maze: Sequence[Sequence[int]],
+    start: Tuple[int, int],
+    end: Tuple[int, int],
+    path: List[str],
+) -> int:
+    """
+    Replay `path` from `start` and measure it in grid steps.
+
+    Solvers disagree on the unit of a move: AStar moves from cell to cell
+    (two grid positions) while DFS moves one grid position at a time. Both
+    interpretations are tried.
+
+    Returns
+    -------
+    int
+        The path length in grid positions, or -1 if the path crosses a wall
+        or does not end on the exit under either interpretation.
+    """
+    for step in (2, 1):
+        x, y = start
+        for move in path:
+            d_x, d_y = MOVES[move]
+            if any(
+                maze[x + d_x * k][y + d_y * k] == 0 for k in range(1, step + 1)
+            ):
+                break
+            x, y = x + step * d_x, y + step * d_y
+        else:
+            if (x, y) == end:
+                return len(path) * step
+    return -1
+
+
+def compare(generator: MazeGenerator, name: str) -> Dict[str, Any]:
+    """
+    Run one registered solver on the maze of `generator`.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Wall-clock seconds, tracemalloc peak bytes, expanded nodes, path
+        length in grid steps, and whether the path is valid and optimal.
+    """
+    maze = generator.maze
+    solver = make_solver(generator.start_pos, generator.end_pos, name)
+    stats = Stats(enabled=True)
+    start = time.perf_counter()
+    path = solver.solve(maze, stats=stats)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        solver.solve(maze)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    best = shortest_length(maze, generator.start, generator.end)
+    steps = grid_steps(maze, generator.start, generator.end, path)
+    return {
+        "seconds": seconds,
+        "peak_bytes": peak,
+        "nodes_expanded": stats.counters.get("solve.nodes_expanded", 0),
+        "path_grid_steps": steps,
+        "shortest_grid_steps": 2 * best,
+        "valid": steps != -1,
+        "optimal": steps == 2 * best,
+    }
+
+
+def summarize(results: List[Dict[str, Any]]) -> None:
+    """Print mean metrics per solver and size to stderr."""
+    groups: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+    for result in results:
+        groups.setdefault((result["solver"], result["size"]), []).append(
+            result
+        )
+    print(
+        f"{'solver':>8} {'size':>6} {'ms':>10} {'KiB':>10} {'nodes':>10} "
+        f"{'optimal':>8}",
+        file=sys.stderr,
+    )
+    for (solver, size), group in sorted(groups.items()):
+        count = len(group)
+        print(
+            f"{solver:>8} {size:>6} "
+            f"{sum(r['seconds'] for r in group) / count * 1000:>10.3f} "
+            f"{sum(r['peak_bytes'] for r in group) / count / 1024:>10.1f} "
+            f"{sum(r['nodes_expanded'] for r in group) / count:>10.1f} "
+            f"{sum(r['optimal'] for r in group) / count:>8.0%}",
+            file=sys.stderr,
+        )
+
+
+def main() -> None:
+    """Entry point of `python -m benchmarks.solvers`."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.solvers")
+    parser.add_argument("--sizes", default="10,25,50,100")
+    parser.add_argument("--seeds", type=int, default=5)
+    parser.add_argument("--solvers", default=",".join(SOLVERS))
+    parser.add_argument("--output", default="-", help="JSON file or '-'")
+    args = parser.parse_args()
+    results = []
+    for size in (int(size) for size in args.sizes.split(",")):
+        for perfect in (True, False):
+            for seed in range(args.seeds):
+                generator = make_generator(size, perfect, seed)
+                for name in args.solvers.split(","):
+                    result = compare(generator, name)
+                    results.append(
+                        {
+                            "solver": name,
+                            "size": size,
+                            "perfect": perfect,
+                            "seed": seed,
+                            **result,
+                        }
+                    )
+    summarize(results)
+    report = json.dumps({"results": results}, indent=2)
+    if args.output == "-":
+        print(report)
+    else:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
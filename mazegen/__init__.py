@@ -1,76 +1,39 @@
-from typing import Any, List, Tuple, Callable
-from pydantic import BaseModel, Field, field_validator
+from typing import TYPE_CHECKING, Any, List, Tuple, Callable, Iterator
+from typing import Deque, Sequence, cast
 from .dfs_path import DFS
 from constant import CELL
-from .astar import AStar
-import curses as cs
+from .astar import AStar, MOVE_NAMES
+from .stats import Stats
+from .frames import FrameScheduler
 import random
-import time
-import dotenv
 import sys
-import os
 
+if TYPE_CHECKING:
+    from .cache import ResultCache
+    from .checkpoint import Checkpointer, State
+    from .config import Config as Config
+    from .mask import Mask
 
-class Config(BaseModel):
-    """
-    Configuration model for maze generation settings.
+__version__ = "0.1.0"
 
-    Attributes:
-        height (int): The height of the maze. Must be >= 2. Defaults to 2.
-            Alias: HEIGHT
-        width (int): The width of the maze. Must be >= 2. Defaults to 2.
-            Alias: WIDTH
-        start_pos (tuple[int, int]): The entry point coordinates for the maze.
-            Defaults to (0, 0). Alias: ENTRY
-        end_pos (tuple[int, int]): The exit point coordinates for the maze.
-            Defaults to (1, 1). Alias: EXIT
-        perfect (bool): Flag indicating whether to generate a perfect maze.
-            Alias: PERFECT
-        seed (int | None): Optional seed value
-                for maze generation reproducibility.
-            Defaults to None. Alias: SEED
-        out_put (str): The output file path for the generated maze.
-            Must have minimum length of 1. Alias: OUTPUT_FILE
-
-    Methods:
-        tupl_valid(value: str) -> list[str]: Validator that converts string
-            representation of tuples into a list of string coordinates.
-            Removes parentheses and splits by comma.
-    """
+_NO_STATS = Stats()
 
-    height: int = Field(alias="HEIGHT", ge=2, default=2)
-    width: int = Field(alias="WIDTH", ge=2, default=2)
-    start_pos: tuple[int, int] = Field(alias="ENTRY", default=(0, 0))
-    end_pos: tuple[int, int] = Field(alias="EXIT", default=(1, 1))
-    perfect: bool = Field(alias="PERFECT")
-    seed: int | None = Field(default=None, alias="SEED")
-    out_put: str = Field(alias="OUTPUT_FILE", min_length=1)
+# Half-steps (from a cell to the wall in between) of each move name.
+STEPS = {name: (r // 2, c // 2) for (r, c), name in MOVE_NAMES.items()}
 
-    @field_validator("start_pos", "end_pos", mode="before")
-    @staticmethod
-    def tupl_valid(value: str) -> list[str]:
-        """
-        Parses a string representation of a tuple by
-                removing empty parentheses and splitting by commas.
 
-        Args:
-            value (str): A string containing tuple-like
-                data, potentially with parentheses.
+def __getattr__(name: str) -> Any:
+    """
+    Load the pydantic `Config` model on first access.
 
-        Returns:
-            list[str]: A list of string elements split
-                by commas after removing empty parentheses.
+    Keeping pydantic out of `import mazegen` lets short-lived workers that
+    only generate, solve and encode start without paying for it.
+    """
+    if name == "Config":
+        from .config import Config
 
-        Example:
-            >>> tupl_valid("(1, 2, 3)")
-            ['1', ' 2', ' 3']
-            >>> tupl_valid("a,b,c")
-            ['a', 'b', 'c']
-        """
-        if not value:
-            raise ValueError("EXIT or ENTRY is empty")
-        value = value.replace("()", "")
-        return value.split(",")
+        return Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class MazeGenerator:
@@ -87,6 +50,14 @@ class MazeGenerator:
     Attributes:
         start_pos (tuple[int, int]): Entry point coordinates in grid units.
         end_pos (tuple[int, int]): Exit point coordinates in grid units.
+        auto_entry (bool): ENTRY is "auto": `maze_gen` moves the entry to
+            the far end of the longest path (see `place_endpoints`).
+        auto_exit (bool): EXIT is "auto", likewise for the exit.
+        origin_pos (tuple[int, int]): The entry as configured (the first
+            open cell for an "auto" entry), in cell units. Carving starts
+            from it on every call, so "auto" endpoints placed by a previous
+            call never change the next maze.
+        origin (tuple[int, int]): `origin_pos` in maze array units.
         width (int): Width of the maze in grid units.
         height (int): Height of the maze in grid units.
         start (tuple[int, int]): Entry point coordinates
@@ -96,12 +67,47 @@ class MazeGenerator:
         seed (int, optional): Random seed for maze generation reproducibility.
         perfect (bool): Flag indicating whether to
             generate a perfect maze (no loops).
+        grid_file (str, optional): When set, `maze_gen` builds the grid in
+            this memory-mapped file (see `mazegen.grid.MappedGrid`).
+        algorithm (str): Carving algorithm, "backtracker" or "tiled".
+        tile_size (int): Tile side of the "tiled" algorithm, in cells.
+        max_frontier (int): Frontier bound of the "tiled" algorithm.
+        output_file (str): The OUTPUT_FILE of the configuration.
+        compression (str, optional): Compression of `output_file` (see
+            `mazegen.hexio.codec`).
+        checkpoint (str, optional): When set, `maze_gen` saves its state to
+            this file every `checkpoint_interval` seconds and resumes from
+            it (see `mazegen.checkpoint.Checkpointer`).
+        checkpoint_interval (float): Seconds between two checkpoints.
+        checkpoint_key (bytes): Key of the configuration, stored in every
+            checkpoint so another configuration cannot resume from it.
         solver_astar (AStar): A* pathfinding solver instance.
         solver_dfs (DFS): Depth-first search solver instance.
         maze (list[list[int]]): 2D list representing
             the generated maze structure.
         path (list): Solution path from start
             to end position found by A* solver.
+        cache (ResultCache, optional): When given and the configuration has
+            a seed, a cached grid and path are reused instead of running
+            `maze_gen` and the solver, and fresh results are stored.
+        stats (Stats): Instrumentation of the generator: per-phase timers
+            (mask, carve, imperfect, diameter, solve, clear_all,
+            encode) and
+            counters (carve.cells_written, carve.max_stack,
+            carve.max_frontier, imperfect.cells_written,
+            solve.nodes_expanded). It only records when `profile=True` and
+            is meant for single-threaded use.
+        debug (bool): When set, `maze_gen` checks every maze it generates
+            with `mazegen.verify.check` (timed as the "verify" phase) and
+            raises ValueError if it is disconnected, or has loops while
+            PERFECT.
+
+    Generation and solving keep all their working state local to the call
+    (grid, RNG, solver scratch buffers), so one instance can be shared by
+    several threads as long as they go through `generate` or `maze_gen`
+    and only read the attributes above. The exceptions are `grid_file`,
+    as every call reuses the same file, and "auto" endpoints, which every
+    call moves: such generators must not be shared.
 
         ValueError: If neither filename nor config is provided,
             or if configuration parameters are
@@ -111,64 +117,329 @@ class MazeGenerator:
     def __init__(
         self,
         filename: str | None = None,
-        config: Config | None = None,
+        config: "Config | None" = None,
+        cache: "ResultCache | None" = None,
+        profile: bool = False,
+        debug: bool = False,
     ):
         if filename:
+            from .config import Config
+
             parsed = self.parse_config(filename)
             config = Config(**parsed)
         if not config:
             raise ValueError("Invalid config")
-        self.start_pos = config.start_pos
-        self.end_pos = config.end_pos
         self.width = config.width
         self.height = config.height
-        self.start = (config.start_pos[1] * 2 + 1, config.start_pos[0] * 2 + 1)
-        self.end = (config.end_pos[1] * 2 + 1, config.end_pos[0] * 2 + 1)
+        self.mask, self.mask_offset = self.load_mask(
+            config.mask, config.mask_offset
+        )
+        blocked = bytearray(self.width * self.height)
+        if self.mask is not None:
+            blocked = self.mask.blocked(
+                self.height, self.width, self.mask_offset
+            )
+        self.auto_entry = config.start_pos == "auto"
+        self.auto_exit = config.end_pos == "auto"
+        first = blocked.index(0) if 0 in blocked else 0
+        last = blocked.rindex(0) if 0 in blocked else 0
+        self.set_endpoints(
+            (
+                divmod(first, self.width)[::-1]
+                if config.start_pos == "auto"
+                else config.start_pos
+            ),
+            (
+                divmod(last, self.width)[::-1]
+                if config.end_pos == "auto"
+                else config.end_pos
+            ),
+        )
+        self.check_endpoints(blocked)
+        self.origin_pos = self.start_pos
+        self.origin = self.start
+        self.auto_path: list[str] | None = None
         self.seed = config.seed
         self.perfect = config.perfect
-        self.solver_astar = AStar(config.start_pos, config.end_pos)
-        self.solver_dfs = DFS(config.start_pos, config.end_pos)
-        self.maze: list[list[int]] = self.maze_gen()
-        self.path = self.solver_astar.solve(self.maze)
-        self.clear_all(self.maze)
+        self.grid_file = config.grid_file
+        self.algorithm = config.algorithm
+        self.tile_size = config.tile_size
+        self.max_frontier = config.max_frontier
+        self.output_file = config.out_put
+        self.compression = config.compression
+        self.stats = Stats(profile)
+        self.debug = debug
+        self.checkpoint = config.checkpoint
+        self.checkpoint_interval = config.checkpoint_interval
+        self.checkpoint_key = b""
+        if self.checkpoint is not None:
+            from .checkpoint import config_key
+
+            self.checkpoint_key = config_key(config)
+        key = None
+        if cache is not None and self.seed is not None:
+            key = cache.key(config)
+            entry = cache.get(key)
+            if entry is not None:
+                self.maze: list[list[int]] = [list(row) for row in entry.maze]
+                self.path = list(entry.path)
+                if self.auto_entry or self.auto_exit:
+                    self.locate_endpoints(self.maze)
+                return
+        self.maze = self.maze_gen()
+        if self.auto_path is not None:
+            self.path = self.auto_path
+        else:
+            with self.stats.phase("solve"):
+                self.path = self.solver_astar.solve(
+                    self.maze, stats=self.stats
+                )
+        if cache is not None and key is not None:
+            hex_rows = self.convert_hex_maze(self.maze)
+            cache.put(key, self.maze, hex_rows, self.path)
+
+    def set_endpoints(
+        self, start_pos: Tuple[int, int], end_pos: Tuple[int, int]
+    ) -> None:
+        """
+        Move the entry and the exit, and rebind the solvers to them.
+
+        Args:
+            start_pos (Tuple[int, int]): The entry as (x, y) in cell units.
+            end_pos (Tuple[int, int]): The exit as (x, y) in cell units.
+        """
+        self.start_pos = start_pos
+        self.end_pos = end_pos
+        self.start = (start_pos[1] * 2 + 1, start_pos[0] * 2 + 1)
+        self.end = (end_pos[1] * 2 + 1, end_pos[0] * 2 + 1)
+        self.solver_astar = AStar(start_pos, end_pos)
+        self.solver_dfs = DFS(start_pos, end_pos)
+
+    def load_mask(
+        self, mask: str | None, offset: Tuple[int, int] | None
+    ) -> Tuple["Mask | None", Tuple[int, int]]:
+        """
+        Resolve the MASK and MASK_OFFSET settings.
+
+        Args:
+            mask (str | None): A mask file, "none", or None for the "42".
+            offset (Tuple[int, int] | None): The (x, y) offset, or None to
+                center the mask.
+
+        Returns:
+            Tuple[Mask | None, Tuple[int, int]]: The mask (None when there is
+                nothing to stamp) and its offset.
+
+        Raises:
+            ValueError: If the mask cannot be read or does not fit in the
+                maze at the given offset.
+        """
+        from .mask import FORTY_TWO, Mask
+
+        if mask is not None and mask.lower() == "none":
+            return None, (0, 0)
+        if mask is None:
+            # The "42" keeps its historical rule: skipped on small mazes.
+            if self.width * 2 + 1 <= 15 or self.height * 2 + 1 <= 11:
+                print("too small", file=sys.stderr)
+                return None, (0, 0)
+            pattern = FORTY_TWO
+        else:
+            pattern = Mask.load(mask)
+        if offset is None:
+            offset = pattern.centered(self.height, self.width)
+        if not pattern.fits(self.height, self.width, offset):
+            raise ValueError("The mask does not fit in the maze")
+        return pattern, offset
+
+    def check_endpoints(self, blocked: bytearray) -> None:
+        """
+        Validate the entry and the exit against the bounds and the mask.
+
+        This runs once, before any carving: both endpoints must be inside
+        the maze and on open cells, and the open cells must form a single
+        region (see `mazegen.mask.check`), so the exit is always reachable.
+
+        Args:
+            blocked (bytearray): The rasterized mask, one byte per cell.
+
+        Raises:
+            ValueError: If an endpoint is out of bounds or blocked, or if the
+                mask disconnects the maze.
+        """
+        from .mask import check
+
+        for (x, y), name in ((self.end_pos, "end"), (self.start_pos, "start")):
+            if not (0 <= x < self.width and 0 <= y < self.height):
+                raise ValueError(f"Invalid {name} coordinate")
+        for (x, y), name in ((self.start_pos, "start"), (self.end_pos, "end")):
+            if blocked[y * self.width + x]:
+                raise ValueError(f"Invalid {name} coordinate")
+        check(blocked, self.height, self.width, ())
+
+    def place_endpoints(self, maze: list[list[int]]) -> None:
+        """
+        Put the "auto" entry and/or exit at the ends of the longest path.
+
+        Uses `mazegen.diameter.longest_path`: two breadth-first sweeps on a
+        perfect maze (exact), up to four on an imperfect one (a lower
+        bound). The path between the new endpoints is kept in `auto_path`,
+        so no solver has to run afterwards.
+
+        Args:
+            maze (list[list[int]]): The carved grid, before the endpoints
+                are marked.
+        """
+        from .diameter import longest_path
+
+        start, end, path = longest_path(
+            maze,
+            None if self.auto_entry else self.start_pos,
+            None if self.auto_exit else self.end_pos,
+            sweeps=2 if self.perfect else 4,
+            origin=self.origin_pos,
+        )
+        self.set_endpoints(start, end)
+        self.auto_path = list(path.decode())
+
+    def locate_endpoints(self, maze: Sequence[Sequence[int]]) -> None:
+        """
+        Restore "auto" endpoints from the START and EXIT marks of a grid.
+
+        Args:
+            maze (Sequence[Sequence[int]]): A grid returned by `maze_gen`.
+        """
+        start, end = self.start_pos, self.end_pos
+        for x in range(1, len(maze), 2):
+            row = maze[x]
+            for y in range(1, len(row), 2):
+                if row[y] == CELL.START.value:
+                    start = (y // 2, x // 2)
+                elif row[y] == CELL.EXIT.value:
+                    end = (y // 2, x // 2)
+        self.set_endpoints(start, end)
+
+    def new_rng(self) -> random.Random:
+        """
+        Create the random stream used by a single generation call.
+
+        Every call gets a fresh `random.Random` seeded from `seed`, so a fixed
+        SEED always produces the same maze, concurrent calls never share
+        RNG state and the global `random` module is never touched. Without a
+        SEED the stream is seeded from the OS entropy source.
+
+        Returns:
+            random.Random: A new, independently seeded random stream.
+        """
+        return random.Random(self.seed)
+
+    def checkpointer(self) -> "Checkpointer | None":
+        """
+        Create the checkpoint writer of a single generation call.
+
+        Returns:
+            Checkpointer | None: A writer bound to `checkpoint`, or None
+                when checkpoints are disabled.
+        """
+        if self.checkpoint is None:
+            return None
+        from .checkpoint import Checkpointer
+
+        return Checkpointer(
+            self.checkpoint, self.checkpoint_key, self.checkpoint_interval
+        )
+
+    def generate(self) -> Tuple[Tuple[Tuple[int, ...], ...], List[str]]:
+        """
+        Generate and solve a new maze without touching the generator state.
+
+        This is the reentrant entry point: the grid and the solver buffers
+        only live for the duration of the call, so several threads may call
+        it concurrently on the same instance.
+
+        Returns:
+            Tuple[Tuple[Tuple[int, ...], ...], List[str]]: A read-only
+                snapshot of the maze grid and the A* solution path.
+        """
+        maze = self.maze_gen()
+        path = self.solver_astar.solve(maze)
+        return self.snapshot(maze), path
+
+    @staticmethod
+    def snapshot(maze: Sequence[Sequence[int]]) -> Tuple[Tuple[int, ...], ...]:
+        """
+        Freeze a maze grid into an immutable tuple of tuples.
+
+        Args:
+            maze (Sequence[Sequence[int]]): The grid to copy.
+
+        Returns:
+            Tuple[Tuple[int, ...], ...]: A read-only copy that can be shared
+                freely between threads.
+        """
+        return tuple(tuple(row) for row in maze)
+
+    @staticmethod
+    def derive_seed(seed: int, *index: int) -> int:
+        """
+        Derive an independent child seed from a base seed and an index.
+
+        Use this to give every maze of a batch (or every worker thread or
+        process) its own reproducible seed: the child seed depends only on
+        its inputs, never on scheduling order or on shared state.
+
+        The derivation is the first 8 bytes of the BLAKE2b digest of the
+        decimal values joined with ',' (e.g. b"42,0,3"), read as a
+        big-endian unsigned integer.
+
+        Args:
+            seed (int): The base seed (e.g. the SEED config value).
+            *index (int): One or more integers identifying the child,
+                such as a job number or a (worker, job) pair.
+
+        Returns:
+            int: A 64-bit seed suitable for `Config.seed`.
+
+        Example:
+            >>> MazeGenerator.derive_seed(42, 0) != MazeGenerator.derive_seed(
+            ...     42, 1)
+            True
+        """
+        import hashlib
+
+        data = ",".join(str(e) for e in (seed, *index)).encode()
+        digest = hashlib.blake2b(data, digest_size=8).digest()
+        return int.from_bytes(digest, "big")
 
     @staticmethod
     def parse_config(filename: str) -> dict[str, Any]:
         """
         Parse a configuration file and extract maze parameters.
-        Loads environment variables from a .env file and validates them.
-        Extracts and converts configuration values for maze height, width,
-        entry/exit positions, seed, and perfect maze flag.
+
+        The file is read with the lightweight KEY=VALUE parser from
+        `mazegen.parser`; the process environment is neither read nor
+        modified, so several configurations can be loaded in one process.
+
         Args:
-            filename (str): Path to the .env configuration file to load.
+            filename (str): Path to the configuration file to load.
         Returns:
             dict[str, Any]:
-            A dictionary containing parsed configuration with keys:
-                - 'height' (int): Height of the maze
-                - 'width' (int): Width of the maze
-                - 'start_pos' (tuple[int, int]): Entry point coordinates
-                - 'end_pos' (tuple[int, int]): Exit point coordinates
-                - 'perfect' (bool): Whether to generate a perfect maze
-                - 'seed' (int, optional): Random seed if specified in config
-        Raises:
-            ValueError: If HEIGHT or WIDTH are not valid integers
-            ValueError:
-            If ENTRY or EXIT coordinates cannot be parsed as integers
-            ValueError: If PERFECT field is not 'True' or 'False'
+            A dictionary mapping each of HEIGHT, WIDTH, ENTRY, EXIT, PERFECT,
+            SEED and OUTPUT_FILE to its raw string value (None when the key
+            is missing), plus the optional keys of `OPTIONAL_KEYS` that are
+            present, ready to be validated by `Config`. It is empty if the
+            file cannot be read or contains no keys.
         """
-        if not dotenv.load_dotenv(filename):
+        from .parser import CONFIG_KEYS, OPTIONAL_KEYS, parse_config_file
+
+        parsed = parse_config_file(filename)
+        if not parsed:
             return {}
-        key = [
-            "HEIGHT",
-            "WIDTH",
-            "ENTRY",
-            "EXIT",
-            "PERFECT",
-            "SEED",
-            "OUTPUT_FILE",
-        ]
-        read_file = {j: os.getenv(j) for j in key}
-        return read_file
+        return {
+            key: parsed.get(key)
+            for key in CONFIG_KEYS
+            if key in parsed or key not in OPTIONAL_KEYS
+        }
 
     def break_wall(
         self,
@@ -222,6 +493,8 @@ class MazeGenerator:
         Returns:
             None
         """
+        import curses as cs
+
         cs.start_color()
         cs.use_default_colors()
         cs.init_pair(1, 8, -1)
@@ -233,7 +506,7 @@ class MazeGenerator:
         cs.init_pair(7, 11, -1)
 
     @staticmethod
-    def clear_all(maze: list[list[int]]) -> None:
+    def clear_all(maze: list[list[int]], stats: Stats | None = None) -> None:
         """
         Clear all path and find markers from the maze.
 
@@ -247,14 +520,17 @@ class MazeGenerator:
             maze (list[list[int]]): A 2D list representing the
                 maze where each cell contains an integer value corresponding
                     to a CELL type.
+            stats (Stats, optional): Records the time spent under the
+                "clear_all" phase.
 
         Returns:
             None: Modifies the maze in-place.
         """
-        for i, row in enumerate(maze):
-            for j, col in enumerate(row):
-                if col == CELL.FIND.value or col == CELL.PATH.value:
-                    maze[i][j] = CELL.EMPTY.value
+        with (stats or _NO_STATS).phase("clear_all"):
+            for i, row in enumerate(maze):
+                for j, col in enumerate(row):
+                    if col == CELL.FIND.value or col == CELL.PATH.value:
+                        maze[i][j] = CELL.EMPTY.value
 
     @staticmethod
     def clear_path(maze: list[list[int]]) -> None:
@@ -277,15 +553,37 @@ class MazeGenerator:
                 if col == CELL.PATH.value:
                     maze[i][j] = CELL.EMPTY.value
 
+    @staticmethod
+    def mark_path(
+        maze: list[list[int]], start: Tuple[int, int], path: Sequence[str]
+    ) -> None:
+        """
+        Draw a solution on the maze like the animated solvers do.
+
+        Args:
+            maze (list[list[int]]): The grid to draw on.
+            start (Tuple[int, int]): The (row, col) grid position the path
+                starts from.
+            path (Sequence[str]): The moves, as returned by the solvers.
+        """
+        row, col = start
+        for move in path:
+            d_row, d_col = STEPS[move]
+            maze[row + d_row][col + d_col] = CELL.FIND.value
+            row += 2 * d_row
+            col += 2 * d_col
+            if maze[row][col] not in (CELL.START.value, CELL.EXIT.value):
+                maze[row][col] = CELL.FIND.value
+
     def set_fourty_two(self, maze: list[list[int]]) -> List[List[int]]:
         """
         Embeds a predefined 42-shaped pattern into the center of the maze.
 
-        This method takes a maze and overlays a hardcoded pattern (represented
-            by 5s)
-        at the center of the maze. The pattern is only applied if the maze
-            dimensions are large enough to accommodate it without going out of
-                bounds.
+        This method takes a maze and overlays the `mazegen.mask.FORTY_TWO`
+            pattern (represented by 5s) at the center of the maze. The
+            pattern is only applied if the maze dimensions are large enough
+            to accommodate it without going out of bounds. `maze_gen` uses
+            the configured mask instead, which is this pattern by default.
 
         Args:
             maze (list[list[int]]): A 2D list representing the maze where the
@@ -297,40 +595,17 @@ class MazeGenerator:
                 fit the pattern.
 
         Note:
-            - The pattern is a 11x15 grid containing 0s and 5s.
-            - If a seed is set, it is applied before processing.
+            - The pattern covers 5x7 cells (11x15 grid positions).
             - The method returns the original maze unmodified if its height or
                 width is insufficient to accommodate the pattern.
         """
-        fourty_two = [
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 5, 0, 0, 0, 0, 0, 0, 0, 5, 0, 5, 0, 5, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 5, 0, 5, 0, 5, 0, 0, 0, 5, 0, 5, 0, 5, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 5, 0, 0, 0, 5, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 5, 0, 0, 0, 5, 0, 5, 0, 5, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        ]
-        height = self.height * 2 + 1
-        width = self.width * 2 + 1
-        if self.seed is not None:
-            random.seed(self.seed)
-        ft_height = len(fourty_two)
-        ft_width = len(fourty_two[0])
-        start = [
-            int(self.height - (ft_height - self.height % 2) / 2),
-            int(self.width - (ft_width - self.width % 2) / 2),
-        ]
-        if width <= ft_width or height <= ft_height:
+        from .mask import FORTY_TWO
+
+        if self.width * 2 + 1 <= 15 or self.height * 2 + 1 <= 11:
             print("too small", file=sys.stderr)
             return maze
-        for i, lst in enumerate(fourty_two):
-            for j, val in enumerate(lst):
-                maze[start[0] + i][start[1] + j] = val
+        offset = FORTY_TWO.centered(self.height, self.width)
+        FORTY_TWO.stamp(maze, offset)
         return maze
 
     @staticmethod
@@ -350,6 +625,8 @@ class MazeGenerator:
         Returns:
             None
         """
+        import curses as cs
+
         cs.start_color()
         cs.use_default_colors()
         func: dict[str, Callable[[int], None]] = {
@@ -430,6 +707,8 @@ class MazeGenerator:
             character width.
         - A newline character is appended after each row.
         """
+        import curses as cs
+
         for y, row in enumerate(maze):
             for x, char in enumerate(row):
                 if char == 0:
@@ -484,6 +763,32 @@ class MazeGenerator:
                 except Exception:
                     pass
 
+    def new_grid(self, height: int, width: int) -> list[list[int]]:
+        """
+        Allocate a grid of walls for `maze_gen`.
+
+        Parameters
+        ----------
+        height : int
+            Number of rows, in grid units.
+        width : int
+            Number of columns, in grid units.
+
+        Returns
+        -------
+        list[list[int]]
+            A list of rows, or a `MappedGrid` backed by `grid_file` when it
+            is set. Both support `maze[x][y]` reads and writes. Every call
+            creates a new `grid_file`: the grids of earlier calls stay
+            valid, but only the last one can be reopened from that path.
+        """
+        if self.grid_file is None:
+            return [[0 for j in range(width)] for i in range(height)]
+        from .grid import MappedGrid
+
+        grid = MappedGrid.create(self.grid_file, height, width)
+        return cast(list[list[int]], grid)
+
     def maze_gen(self, screen: Any = None) -> list[list[int]]:
         """
         Generate a maze using depth-first search algorithm with optional
@@ -497,8 +802,10 @@ class MazeGenerator:
         Parameters
         ----------
         screen : Any, optional
-            A screen object for rendering the maze in real-time. If provided,
-            the maze is displayed at 60 FPS during generation. Default is None.
+            A screen object for rendering the maze in real-time, or a
+            `FrameScheduler` wrapping one. If provided, the generation is
+            animated at most at the scheduler's frame rate (60 FPS by
+            default), and the final maze is drawn. Default is None.
 
         Returns
         -------
@@ -506,7 +813,7 @@ class MazeGenerator:
             A 2D list representing the generated maze where:
             - 0 represents walls
             - 1 represents paths
-            - 5 represents obstacles (set by set_fourty_two)
+            - 5 represents obstacles (the mask, by default the "42")
             - 6 represents the start position
             - CELL.EXIT.value represents the end position
 
@@ -517,6 +824,8 @@ class MazeGenerator:
             obstacle.
         ValueError
             If the end coordinate is outside the maze bounds or on an obstacle.
+        ValueError
+            In debug mode, if the maze fails `mazegen.verify.check`.
 
         Notes
         -----
@@ -528,95 +837,395 @@ class MazeGenerator:
 
         The algorithm uses a depth-first search with backtracking to ensure
         all cells are reachable, creating a spanning tree structure for
-        perfect mazes.
+        perfect mazes. With `algorithm="tiled"`, `carve_tiled` is used
+        instead, which bounds the carving memory.
+
+        Every call works on a fresh grid and RNG stream (see `new_rng`) and
+        leaves the generator untouched, so concurrent calls are safe, unless
+        ENTRY or EXIT is "auto": the endpoints then depend on the maze and
+        are moved by `place_endpoints`.
         """
         height = self.height * 2 + 1
         width = self.width * 2 + 1
-        self.maze = [[0 for j in range(width)] for i in range(height)]
-        direc = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        maze = self.new_grid(height, width)
         x, y = self.end
         if (x >= height or y >= width) or (x < 0 or y < 0):
             raise ValueError("Invalid end coordinate")
         x, y = self.start
         if (x >= height or y >= width) or (x < 0 or y < 0):
             raise ValueError("Invalid start coordinate")
+        rng = self.new_rng()
+        if screen is not None:
+            screen = FrameScheduler.of(screen)
+        from .checkpoint import CARVE, CARVED, IMPERFECT
+
+        saver = self.checkpointer()
+        state = saver.load(maze) if saver is not None else None
+        phase = 0
+        if state is not None:
+            rng.setstate(state.rng)
+            phase = state.phase
+            if phase != CARVE:
+                state = None
+        elif self.mask is not None:
+            with self.stats.phase("mask"):
+                self.mask.stamp(maze, self.mask_offset)
+        if phase < CARVED:
+            with self.stats.phase("carve"):
+                if self.algorithm == "tiled":
+                    self.carve_tiled(maze, rng, screen)
+                else:
+                    self.carve(maze, rng, screen, saver, state)
+            if saver is not None and saver.due():
+                saver.save(CARVED, maze, rng)
+        if not self.perfect and phase < IMPERFECT:
+            with self.stats.phase("imperfect"):
+                self.add_imperfections(maze, rng, screen)
+            if saver is not None and saver.due():
+                saver.save(IMPERFECT, maze, rng)
+        if self.auto_entry or self.auto_exit:
+            with self.stats.phase("diameter"):
+                self.place_endpoints(maze)
+        y, x = self.start
+        maze[y][x] = 6
+        maze[self.end[0]][self.end[1]] = CELL.EXIT.value
+        if saver is not None:
+            saver.clear()
+        if self.debug:
+            from .verify import check
+
+            with self.stats.phase("verify"):
+                check(maze, self.perfect)
+        if screen is not None:
+            screen.flush(maze)
+        return maze
+
+    def carve(
+        self,
+        maze: list[list[int]],
+        rng: random.Random,
+        screen: Any = None,
+        saver: "Checkpointer | None" = None,
+        state: "State | None" = None,
+    ) -> None:
+        """
+        Carve a spanning tree with the recursive backtracker.
+
+        Starting from `origin`, the configured entry cell, walls are broken
+        towards random unvisited neighbours; dead ends pop the `prev` stack
+        until every reachable cell has been visited.
+
+        With a checkpoint writer, the grid, the current cell, the `prev`
+        stack and the RNG state are saved at the top of the loop whenever
+        the writer is due (checked every 4096 steps); given the `state`
+        read back from such a checkpoint, the loop resumes at that very
+        step and carves the same maze as an uninterrupted run.
+
+        Parameters
+        ----------
+        maze : list[list[int]]
+            The grid to carve, modified in place.
+        rng : random.Random
+            The random stream of the current generation call.
+        screen : Any, optional
+            A curses screen or `FrameScheduler` used to animate the
+            carving. Default is None.
+        saver : Checkpointer, optional
+            Writes periodic checkpoints. Default is None.
+        state : State, optional
+            A CARVE checkpoint to resume from; `maze` and `rng` must already
+            hold its grid and RNG state. Default is None.
+        """
+        from .checkpoint import CARVE
+
+        height = len(maze)
+        width = len(maze[0])
+        direc = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        frames = FrameScheduler.of(screen) if screen is not None else None
+        track = self.stats.enabled
+        depth = 0
+        carved = 0
+        steps = 0
         end = False
         prev: List[Tuple[int, int]] = []
-        self.set_fourty_two(self.maze)
-        if self.maze[x][y] == 5:
-            raise ValueError("Invalid start coordinate")
-        x, y = self.end
-        if self.maze[x][y] == 5:
-            raise ValueError("Invalid end coordinate")
-        curr = self.start
-        x, y = curr
-        self.maze[x][y] = 1
+        curr = self.origin
+        if state is not None:
+            curr, prev = state.curr, state.prev
+            carved, depth = state.carved, state.depth
+        else:
+            x, y = curr
+            maze[x][y] = 1
         while not end:
+            if saver is not None:
+                steps += 1
+                if not steps & 0xFFF and saver.due():
+                    saver.save(CARVE, maze, rng, curr, prev, carved, depth)
             valid_pos = []
             for i, j in direc:
                 if (
                     i != 0
                     and curr[0] + i * 2 > 0
                     and curr[0] + i * 2 < height
-                    and self.maze[curr[0] + i * 2][curr[1]] == CELL.WALL.value
+                    and maze[curr[0] + i * 2][curr[1]] == CELL.WALL.value
                 ):
                     valid_pos.append((i, j))
                 if (
                     j != 0
                     and curr[1] + j * 2 > 0
                     and curr[1] + j * 2 < width
-                    and self.maze[curr[0]][curr[1] + j * 2] == CELL.WALL.value
+                    and maze[curr[0]][curr[1] + j * 2] == CELL.WALL.value
                 ):
                     valid_pos.append((i, j))
             if len(valid_pos) == 0:
                 curr = prev.pop()
             else:
                 prev.append(curr)
-                curr = self.break_wall(
-                    self.maze, curr, random.choice(valid_pos)
-                )
+                carved += 1
+                if track and len(prev) > depth:
+                    depth = len(prev)
+                curr = self.break_wall(maze, curr, rng.choice(valid_pos))
             if prev == []:
                 end = True
-            if screen is not None:
-                self.print_maze(screen, self.maze)
-                time.sleep(1 / 60)
-                screen.refresh()
-        if not self.perfect:
-            for i in range(1, len(self.maze), 2):
-                for j in range(1, len(self.maze[i]), 2):
-                    if self.maze[i][j] == 1:
-                        if (
-                            height - 2 > i > 1
-                            and 1 < j < width - 2
-                            and random.randint(0, 100) <= 15
-                        ):
-                            y, x = random.choice(direc)
-                            if (
-                                self.maze[i + y * 2][j + x * 2]
-                                == CELL.EMPTY.value
-                            ):
-                                self.maze[i + y][j + x] = 1
-            for i, row in enumerate(self.maze):
-                for j, col in enumerate(row):
-                    if height - 2 > i > 1 and 1 < j < width - 2:
-                        if (
-                            col == 0
-                            and self.maze[i - 1][j] == CELL.EMPTY.value
-                            and self.maze[i + 1][j] == CELL.EMPTY.value
-                            and self.maze[i][j - 1] == CELL.EMPTY.value
-                            and self.maze[i][j + 1] == CELL.EMPTY.value
-                        ):
-                            self.maze[i][j] = CELL.EMPTY.value
-            if screen is not None:
-                self.print_maze(screen, self.maze)
-                time.sleep(1 / 60)
-                screen.refresh()
-        y, x = self.start
-        self.maze[y][x] = 6
-        self.maze[self.end[0]][self.end[1]] = CELL.EXIT.value
-        return self.maze
+            if frames is not None:
+                frames.step(maze)
+        self.stats.count("carve.cells_written", 1 + 2 * carved)
+        self.stats.peak("carve.max_stack", depth)
+
+    def carve_tiled(
+        self, maze: list[list[int]], rng: random.Random, screen: Any = None
+    ) -> None:
+        """
+        Carve a spanning tree tile by tile with a bounded frontier.
+
+        The grid is split into `tile_size` x `tile_size` cell tiles, carved
+        one after the other in row-major order so the working set stays
+        within a few rows of the grid. Inside a tile, a growing tree always
+        extends its newest frontier cell; the frontier is a deque holding at
+        most `max_frontier` cells, the oldest being dropped when it is full.
+        When it runs dry, a hunt scans the tile for an uncarved cell next to
+        a carved one and resumes from there (hunt-and-kill), so dropped cells
+        never leave holes. Cells the hunt cannot reach (cut off by the 42
+        pattern) start a new component.
 
-    def convert_hex_maze(self, maze: list[list[int]]) -> list[str]:
+        Tiles are joined with Kruskal's algorithm, one row of tiles at a
+        time: once a row is carved, the walls between its tiles and those
+        towards the row above are shuffled, and each one between two still
+        disconnected components is broken, which keeps the maze a spanning
+        tree.
+
+        Parameters
+        ----------
+        maze : list[list[int]]
+            The grid to carve, modified in place.
+        rng : random.Random
+            The random stream of the current generation call.
+        screen : Any, optional
+            A curses screen or `FrameScheduler` used to animate the carving,
+            one step per tile. Default is None.
+
+        Notes
+        -----
+        The frontier and the border walls being joined are bounded, by
+        `max_frontier` and by about 2 * `width` walls per row of tiles. The
+        rest of the state grows with the grid: one 32-bit component label
+        per cell, allocated with `mazegen.grid.scratch` (on disk for a
+        `MappedGrid`, so only the pages in use stay in memory), and one
+        union-find entry per component. The largest frontier reached is
+        reported as the `carve.max_frontier` counter.
+        """
+        from collections import deque
+        from .grid import MappedGrid, scratch
+
+        rows = self.height
+        cols = self.width
+        size = self.tile_size
+        direc = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        label = scratch(rows * cols, "i", isinstance(maze, MappedGrid))
+        frontier: Deque[Tuple[int, int]] = deque(maxlen=self.max_frontier)
+        frames = FrameScheduler.of(screen) if screen is not None else None
+        components = 0
+        parent = [0]
+        carved = 0
+        peak = 0
+        for top in range(0, rows, size):
+            bottom = min(top + size, rows)
+            for left in range(0, cols, size):
+                right = min(left + size, cols)
+                hunt = top
+                while True:
+                    while frontier:
+                        r, c = frontier[-1]
+                        valid_pos = [
+                            (i, j)
+                            for i, j in direc
+                            if top <= r + i < bottom
+                            and left <= c + j < right
+                            and maze[2 * (r + i) + 1][2 * (c + j) + 1]
+                            == CELL.WALL.value
+                        ]
+                        if not valid_pos:
+                            frontier.pop()
+                            continue
+                        i, j = rng.choice(valid_pos)
+                        self.break_wall(maze, (2 * r + 1, 2 * c + 1), (i, j))
+                        label[(r + i) * cols + c + j] = label[r * cols + c]
+                        frontier.append((r + i, c + j))
+                        carved += 1
+                        if len(frontier) > peak:
+                            peak = len(frontier)
+                    root = None
+                    joined = None
+                    for r in range(hunt, bottom):
+                        line = maze[2 * r + 1]
+                        for c in range(left, right):
+                            if line[2 * c + 1] != CELL.WALL.value:
+                                continue
+                            if root is None:
+                                root = (r, c)
+                                hunt = r
+                            for i, j in direc:
+                                if (
+                                    top <= r + i < bottom
+                                    and left <= c + j < right
+                                    and label[(r + i) * cols + c + j]
+                                ):
+                                    joined = (r, c, i, j)
+                                    break
+                            if joined is not None:
+                                break
+                        if joined is not None:
+                            break
+                    if root is None:
+                        break
+                    if joined is not None:
+                        r, c, i, j = joined
+                        maze[2 * r + 1 + i][2 * c + 1 + j] = CELL.EMPTY.value
+                        label[r * cols + c] = label[(r + i) * cols + c + j]
+                    else:
+                        r, c = root
+                        components += 1
+                        label[r * cols + c] = components
+                    maze[2 * r + 1][2 * c + 1] = CELL.EMPTY.value
+                    frontier.append((r, c))
+                    carved += 1
+                    peak = max(peak, 1)
+                if frames is not None:
+                    frames.step(maze)
+            parent.extend(range(len(parent), components + 1))
+            walls = [(r, c - 1, 0, 1) for r in range(top, bottom)
+                     for c in range(size, cols, size)]
+            if top:
+                walls += [(top - 1, c, 1, 0) for c in range(cols)]
+            rng.shuffle(walls)
+            for r, c, i, j in walls:
+                a = label[r * cols + c]
+                b = label[(r + i) * cols + c + j]
+                if not a or not b:
+                    continue
+                while parent[a] != a:
+                    parent[a] = parent[parent[a]]
+                    a = parent[a]
+                while parent[b] != b:
+                    parent[b] = parent[parent[b]]
+                    b = parent[b]
+                if a != b:
+                    parent[a] = b
+                    maze[2 * r + 1 + i][2 * c + 1 + j] = CELL.EMPTY.value
+                    carved += 1
+        self.stats.count("carve.cells_written", carved * 2)
+        self.stats.peak("carve.max_frontier", peak)
+
+    def add_imperfections(
+        self, maze: list[list[int]], rng: random.Random, screen: Any = None
+    ) -> None:
+        """
+        Turn a perfect maze into an imperfect one.
+
+        About 15% of the inner cells open one extra wall towards an already
+        carved neighbour, creating loops, then isolated wall pillars
+        surrounded by four empty cells are removed.
+
+        Parameters
+        ----------
+        maze : list[list[int]]
+            The carved grid, modified in place.
+        rng : random.Random
+            The random stream of the current generation call.
+        screen : Any, optional
+            A curses screen or `FrameScheduler` used to display the result.
+            Default is None.
+        """
+        height = len(maze)
+        width = len(maze[0])
+        direc = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        written = 0
+        for i in range(1, len(maze), 2):
+            for j in range(1, len(maze[i]), 2):
+                if maze[i][j] == 1:
+                    if (
+                        height - 2 > i > 1
+                        and 1 < j < width - 2
+                        and rng.randint(0, 100) <= 15
+                    ):
+                        y, x = rng.choice(direc)
+                        if maze[i + y * 2][j + x * 2] == CELL.EMPTY.value:
+                            maze[i + y][j + x] = 1
+                            written += 1
+        for i, row in enumerate(maze):
+            for j, col in enumerate(row):
+                if height - 2 > i > 1 and 1 < j < width - 2:
+                    if (
+                        col == 0
+                        and maze[i - 1][j] == CELL.EMPTY.value
+                        and maze[i + 1][j] == CELL.EMPTY.value
+                        and maze[i][j - 1] == CELL.EMPTY.value
+                        and maze[i][j + 1] == CELL.EMPTY.value
+                    ):
+                        maze[i][j] = CELL.EMPTY.value
+                        written += 1
+        self.stats.count("imperfect.cells_written", written)
+        if screen is not None:
+            FrameScheduler.of(screen).step(maze)
+
+    @staticmethod
+    def iter_hex_maze(maze: Sequence[Sequence[int]]) -> Iterator[str]:
+        """
+        Lazily convert a maze to hexadecimal format, one row at a time.
+
+        This is the streaming form of `convert_hex_maze`: each row is encoded
+        only when requested, so callers can write or send it before the next
+        one is computed. The three grid rows a cell row depends on are
+        fetched once, so a memory-mapped grid is read strictly in order.
+
+        Parameters
+        ----------
+        maze : Sequence[Sequence[int]]
+            A 2D grid representing the maze where 0 indicates a wall.
+
+        Yields
+        ------
+        str
+            The hexadecimal string of the next row of cells.
+        """
+        for x in range(1, len(maze), 2):
+            above = maze[x - 1]
+            line = maze[x]
+            below = maze[x + 1]
+            row = []
+            for y in range(1, len(line), 2):
+                value = 0
+                if above[y] == 0:
+                    value |= 1
+                if line[y + 1] == 0:
+                    value |= 2
+                if below[y] == 0:
+                    value |= 4
+                if line[y - 1] == 0:
+                    value |= 8
+                row.append(format(value, "X"))
+            yield "".join(row)
+
+    def convert_hex_maze(self, maze: Sequence[Sequence[int]]) -> list[str]:
         """
         Convert a maze representation to hexadecimal format.
 
@@ -626,8 +1235,8 @@ class MazeGenerator:
 
         Parameters
         ----------
-        maze : list[list[int]]
-            A 2D list representing the maze where 0 indicates an open passage
+        maze : Sequence[Sequence[int]]
+            A 2D grid representing the maze where 0 indicates an open passage
             and non-zero values indicate walls.
 
         Returns
@@ -646,23 +1255,7 @@ class MazeGenerator:
         -----
         The method iterates through odd-indexed positions in the maze to
         extract cell connectivity information and encodes it as hexadecimal
-        values.
+        values. See `iter_hex_maze` for the row-by-row streaming variant.
         """
-        height = self.height * 2 + 1
-        width = self.width * 2 + 1
-        convert_line: List[str] = []
-        for x in range(1, height, 2):
-            row = []
-            for y in range(1, width, 2):
-                value = 0
-                if maze[x - 1][y] == 0:
-                    value |= 1
-                if maze[x][y + 1] == 0:
-                    value |= 2
-                if maze[x + 1][y] == 0:
-                    value |= 4
-                if maze[x][y - 1] == 0:
-                    value |= 8
-                row.append(format(value, "X"))
-            convert_line.append("".join(row))
-        return convert_line
+        with self.stats.phase("encode"):
+            return list(self.iter_hex_maze(maze))
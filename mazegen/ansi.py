@@ -0,0 +1,156 @@
+from typing import Any, List, Sequence
+import os
+import re
+
+from constant import CELL
+
+BLOCK = "██".encode()
+RESET = b"\x1b[0m"
+# A run of equal cells in a row converted to bytes.
+RUNS = re.compile(rb"(.)\1*", re.DOTALL)
+
+# Foreground color of every CELL value, numbered like the curses colors of
+# `MazeGenerator.setup_colors` (0-7 normal, 8-15 bright).
+DEFAULT_COLORS = {
+    CELL.WALL.value: 8,
+    CELL.EMPTY.value: 7,
+    CELL.FIND.value: 9,
+    CELL.PATH.value: 6,
+    5: 2,
+    CELL.START.value: 4,
+    CELL.EXIT.value: 11,
+}
+OTHER_COLOR = 9
+
+
+def sgr(color: int, bold: bool = False) -> bytes:
+    """Return the escape sequence selecting a 16-color foreground."""
+    code = 30 + color if color < 8 else 90 + color - 8
+    return f"\x1b[{'1;' if bold else '0;'}{code}m".encode()
+
+
+def glyph_table(hide: bool = False) -> List[bytes]:
+    """
+    Build the 16-entry lookup table used by `AnsiRenderer`.
+
+    Entry `value` holds the pre-encoded color sequence of a cell holding
+    `value`, styled like `MazeGenerator.print_maze`: empty cells (and
+    found-path cells when `hide` is set) are bold white, unknown values use
+    the found-path color.
+
+    Parameters
+    ----------
+    hide : bool, optional
+        Draw found-path cells as empty cells. Default is False.
+
+    Returns
+    -------
+    List[bytes]
+        One escape sequence per cell value from 0 to 15.
+    """
+    table = []
+    for value in range(16):
+        if value == CELL.EMPTY.value or (hide and value == CELL.FIND.value):
+            table.append(sgr(DEFAULT_COLORS[CELL.EMPTY.value], bold=True))
+        else:
+            table.append(sgr(DEFAULT_COLORS.get(value, OTHER_COLOR)))
+    return table
+
+
+class AnsiRenderer:
+    """
+    Draws mazes with raw ANSI escape sequences instead of curses.
+
+    A frame is composed as bytes: each row is split into runs of equal
+    cells, and every run costs one color sequence from a 16-entry table
+    plus the repeated block glyph. Only the rows that changed since the
+    previous frame are sent, each preceded by a cursor move, and the whole
+    update goes out in a single `os.write`.
+
+    It can be used as a context manager (clears the screen and hides the
+    cursor, then restores it), passed to `FrameScheduler` in place of a
+    curses screen, or used headless through `snapshot`.
+
+    Attributes
+    ----------
+    fd : int
+        The file descriptor frames are written to.
+    """
+
+    def __init__(self, fd: int = 1) -> None:
+        self.fd = fd
+        self.__tables = {False: glyph_table(False), True: glyph_table(True)}
+        self.__previous: List[bytes] = []
+
+    def encode_row(self, row: Sequence[int], hide: bool = False) -> bytes:
+        """Encode one maze row as color runs, without a line terminator."""
+        table = self.__tables[hide]
+        parts = []
+        for run in RUNS.finditer(bytes(row)):
+            parts.append(table[run[0][0] & 15])
+            parts.append(BLOCK * len(run[0]))
+        return b"".join(parts)
+
+    def frame(
+        self, maze: Sequence[Sequence[int]], hide: bool = False
+    ) -> List[bytes]:
+        """Encode every row of `maze`."""
+        return [self.encode_row(row, hide) for row in maze]
+
+    def render(self, maze: Sequence[Sequence[int]], hide: bool = False) -> int:
+        """
+        Draw `maze`, sending only the rows that changed.
+
+        Parameters
+        ----------
+        maze : Sequence[Sequence[int]]
+            The grid to draw.
+        hide : bool, optional
+            Draw found-path cells as empty cells. Default is False.
+
+        Returns
+        -------
+        int
+            The number of bytes written.
+        """
+        rows = self.frame(maze, hide)
+        previous = self.__previous
+        parts = []
+        for y, row in enumerate(rows):
+            if y < len(previous) and previous[y] == row:
+                continue
+            parts.append(b"\x1b[%d;1H" % (y + 1))
+            parts.append(row)
+            parts.append(RESET)
+        self.__previous = rows
+        if not parts:
+            return 0
+        return os.write(self.fd, b"".join(parts))
+
+    def invalidate(self) -> None:
+        """Forget the previous frame so the next one is drawn in full."""
+        self.__previous = []
+
+    def text(self, maze: Sequence[Sequence[int]], hide: bool = False) -> bytes:
+        """
+        Encode a full frame as text, one line per row.
+
+        The result has color sequences but no cursor moves, so `cat` shows
+        the maze and two frames can be compared byte by byte.
+        """
+        return b"".join(row + RESET + b"\n" for row in self.frame(maze, hide))
+
+    def snapshot(
+        self, maze: Sequence[Sequence[int]], filename: str, hide: bool = False
+    ) -> None:
+        """Write `text(maze, hide)` to a file, for CI snapshots."""
+        with open(filename, "wb") as file:
+            file.write(self.text(maze, hide))
+
+    def __enter__(self) -> "AnsiRenderer":
+        os.write(self.fd, b"\x1b[?25l\x1b[2J")
+        self.invalidate()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        os.write(self.fd, RESET + b"\x1b[?25h\n")
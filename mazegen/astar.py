@@ -1,7 +1,11 @@
 from typing import Protocol, Tuple, List, Any, Optional
 from constant import CELL
+from .stats import Stats
+from .frames import FrameScheduler
 import heapq
-import time
+
+DIRECTIONS = [(-2, 0), (2, 0), (0, -2), (0, 2)]
+MOVE_NAMES = {(-2, 0): "N", (2, 0): "S", (0, -2): "W", (0, 2): "E"}
 
 
 class MazeSolver(Protocol):
@@ -13,7 +17,7 @@ class MazeSolver(Protocol):
 
     Methods
     -------
-    solve(maze : list[list[int]]) -> list[list[int]]
+    solve(maze, screen=None, stats=None) -> list[str]
         Solves the given maze and returns the solution path.
 
         Parameters
@@ -21,14 +25,24 @@ class MazeSolver(Protocol):
         maze : list[list[int]]
             A 2D list representing the maze structure where each integer
             represents a cell type or state.
+        screen : Optional[Any]
+            A curses screen used to animate the search.
+        stats : Optional[Stats]
+            Receives the number of expanded nodes under
+            "solve.nodes_expanded".
 
         Returns
         -------
-        list[list[int]]
-            A 2D list representing the solution path through the maze.
+        list[str]
+            The moves (N, S, E, W) from start to end, empty if unreachable.
     """
 
-    def solve(self, maze: list[list[int]]) -> list[list[int]]:
+    def solve(
+        self,
+        maze: list[list[int]],
+        screen: Optional[Any] = None,
+        stats: Optional[Stats] = None,
+    ) -> list[str]:
         pass
 
 
@@ -57,33 +71,6 @@ class AStar:
         self.start = (temp_start[1], temp_start[0])
         self.end = (temp_end[1], temp_end[0])
 
-    class Cells:
-        """
-        A class to represent a cell in the A* pathfinding algorithm.
-
-        Attributes
-        ----------
-        parent_i : int
-            The row index of the parent cell in the path. Initialized to -1.
-        parent_j : int
-            The column index of the parent cell in the path. Initialized to -1.
-        f : float
-            The total cost (f = g + h). Initialized to infinity.
-        g : float
-            The cost from the start node to the current cell. Initialized to
-                infinity.
-        h : float
-            The heuristic estimated cost from the current cell to the goal.
-            Initialized to 0.0.
-        """
-
-        def __init__(self) -> None:
-            self.parent_i = -1
-            self.parent_j = -1
-            self.f = float("inf")
-            self.g = float("inf")
-            self.h = 0.0
-
     def calculate_h_value(self, row: int, col: int) -> float:
         """
         Calculate the heuristic value for A* pathfinding using Euclidean
@@ -185,23 +172,24 @@ class AStar:
         return row == self.end[0] and col == self.end[1]
 
     def trace_path(
-        self, screen: Any, cell_tab: list[list[Cells]], maze: list[list[int]]
+        self, screen: Any, parent: memoryview, maze: list[list[int]]
     ) -> List[str]:
         """
         Trace the path from start to end cell and mark it in the maze.
 
         This method reconstructs the path by following parent pointers from
             the end cell back to the start cell, then converts the path into
-            directional moves (N, S, E, W). The path is marked in the maze and
-            optionally visualized on screen.
+            directional moves (N, S, E, W). When a screen is given, the path
+            is marked in the maze and visualized.
 
         Parameters
         ----------
         screen : Any
-            The screen object for visualization. If None, visualization is
-                skipped.
-        cell_tab : list[list[Cells]]
-            A 2D list of Cells representing the grid with parent pointers.
+            The screen object for visualization. If None, visualization and
+                marking are skipped.
+        parent : memoryview
+            One byte per cell (row-major, cell units): 1 + the index in
+            `DIRECTIONS` of the move that reached the cell, 0 if unreached.
         maze : list[list[int]]
             A 2D list representing the maze where path cells will be marked
             with CELL.FIND.value.
@@ -214,102 +202,126 @@ class AStar:
 
         Notes
         -----
-        The method updates the maze in-place, marking the path with
-        CELL.FIND.value.
-        If a screen is provided, the maze is rendered at 60 FPS during path
-            tracing.
+        If a screen is provided, the maze is updated in-place, marking the
+            path with CELL.FIND.value, and animated through a
+            `FrameScheduler` during path tracing.
         """
-        from mazegen import MazeGenerator
-
-        path = []
-        row = self.end[0]
-        col = self.end[1]
-        moove_matrix = {(-2, 0): "N", (2, 0): "S", (0, -2): "W", (0, 2): "E"}
-        while not (
-            cell_tab[row][col].parent_i == row
-            and cell_tab[row][col].parent_j == col
-        ):
-            path.append((row, col))
-            temp_row = cell_tab[row][col].parent_i
-            temp_col = cell_tab[row][col].parent_j
-            row = temp_row
-            col = temp_col
-        path.append((row, col))
-        path.reverse()
+        cols = len(maze[0]) // 2
+        row, col = self.end
+        moves = []
+        while (row, col) != self.start:
+            d_row, d_col = DIRECTIONS[parent[row // 2 * cols + col // 2] - 1]
+            moves.append((d_row, d_col))
+            row -= d_row
+            col -= d_col
+        moves.reverse()
         path_coord = []
-        for i in range(len(path) - 1):
-            x1, y1 = path[i]
-            x2, y2 = path[i + 1]
-            move = (x2 - x1, y2 - y1)
-            if move in moove_matrix:
-                path_coord.append(moove_matrix[move])
-                pos_x = (x1 + x2) // 2
-                pos_y = (y1 + y2) // 2
-                maze[pos_x][pos_y] = CELL.FIND.value
-                if maze[x2][y2] == CELL.PATH.value:
-                    maze[x2][y2] = CELL.FIND.value
+        for d_row, d_col in moves:
+            path_coord.append(MOVE_NAMES[(d_row, d_col)])
             if screen is not None:
-                MazeGenerator.print_maze(screen, maze, hide=False)
-                time.sleep(1 / 60)
-                screen.refresh()
+                maze[row + d_row // 2][col + d_col // 2] = CELL.FIND.value
+                row += d_row
+                col += d_col
+                if maze[row][col] == CELL.PATH.value:
+                    maze[row][col] = CELL.FIND.value
+                screen.step(maze)
+        if screen is not None:
+            screen.flush(maze)
         return path_coord
 
     def solve(
-        self, maze: list[list[int]], screen: Optional[Any] = None
+        self,
+        maze: list[list[int]],
+        screen: Optional[Any] = None,
+        stats: Optional[Stats] = None,
     ) -> list[str]:
-        from mazegen import MazeGenerator
+        """
+        Find the shortest path from start to end with the A* algorithm.
+
+        Parameters
+        ----------
+        maze : list[list[int]]
+            A 2D list representing the maze grid.
+        screen : Optional[Any], optional
+            A curses screen, or a `FrameScheduler` wrapping one, used to
+            animate the search. Default is None.
+        stats : Optional[Stats], optional
+            Receives the number of expanded nodes under
+            "solve.nodes_expanded". Default is None.
+
+        Returns
+        -------
+        list[str]
+            The moves (N, S, E, W) from start to end, or an empty list if the
+            end cannot be reached.
 
+        Notes
+        -----
+        Exploration and path markers are only written into `maze` when a
+        screen is given, so they can be displayed. Without a screen `maze` is
+        only read, which makes concurrent solves over a shared grid safe.
+
+        The search state lives in three flat, zero-initialized scratch
+        buffers indexed by cell: the parent move (1 byte), the cost from the
+        start plus one (4 bytes) and the closed flag (1 byte). For a
+        `MappedGrid` they are backed by temporary files instead of RAM.
+        """
+        from .grid import MappedGrid, scratch
+
+        if screen is not None:
+            screen = FrameScheduler.of(screen)
         height = len(maze)
         width = len(maze[0])
-        direc = [(-2, 0), (2, 0), (0, -2), (0, 2)]
-        closed_cell = [[False for j in range(width)] for i in range(height)]
-        cell_tab = [
-            [self.Cells() for j in range(width)] for i in range(height)
-        ]
+        cols = width // 2
+        count = (height // 2) * cols
+        on_disk = isinstance(maze, MappedGrid)
+        parent = scratch(count, "B", on_disk)
+        cost = scratch(count, "i", on_disk)
+        closed = scratch(count, "B", on_disk)
         i, j = self.start
-        cell_tab[i][j].parent_i = i
-        cell_tab[i][j].parent_j = j
-        cell_tab[i][j].g = 0
-        cell_tab[i][j].f = 0
-        cell_tab[i][j].h = 0
+        cost[i // 2 * cols + j // 2] = 1
         cell_open: List[Tuple[float, int, int]] = []
         heapq.heappush(cell_open, (0.0, i, j))
+        expanded = 0
         while len(cell_open) > 0:
             p = heapq.heappop(cell_open)
+            expanded += 1
             i = p[1]
             j = p[2]
-            closed_cell[i][j] = True
-            for vis in direc:
+            index = i // 2 * cols + j // 2
+            closed[index] = 1
+            for code, vis in enumerate(DIRECTIONS, 1):
                 new_i = i + vis[0]
                 new_j = j + vis[1]
+                new_index = new_i // 2 * cols + new_j // 2
                 if (
                     self.is_valid(new_i, new_j, (height, width))
                     and self.is_unblocked((new_i, new_j), maze, vis)
-                    and not closed_cell[new_i][new_j]
+                    and not closed[new_index]
                 ):
-                    maze[i + vis[0] // 2][j + vis[1] // 2] = CELL.PATH.value
-                    if maze[new_i][new_j] != CELL.EXIT.value:
-                        maze[new_i][new_j] = CELL.PATH.value
+                    if screen is not None:
+                        wall = (i + vis[0] // 2, j + vis[1] // 2)
+                        maze[wall[0]][wall[1]] = CELL.PATH.value
+                        if maze[new_i][new_j] != CELL.EXIT.value:
+                            maze[new_i][new_j] = CELL.PATH.value
                     if self.is_destination(new_i, new_j):
-                        cell_tab[new_i][new_j].parent_i = i
-                        cell_tab[new_i][new_j].parent_j = j
-                        return self.trace_path(screen, cell_tab, maze)
+                        parent[new_index] = code
+                        if stats is not None:
+                            stats.count("solve.nodes_expanded", expanded)
+                        return self.trace_path(screen, parent, maze)
                     else:
-                        g_new = cell_tab[i][j].g + 1.0
-                        h_new = self.calculate_h_value(new_i, new_j)
-                        f_new = g_new + h_new
-                        if (
-                            cell_tab[new_i][new_j].f == float("inf")
-                            or cell_tab[new_i][new_j].f > f_new
-                        ):
+                        g_new = cost[index]
+                        old = cost[new_index]
+                        if old == 0 or old > g_new + 1:
+                            h_new = self.calculate_h_value(new_i, new_j)
+                            f_new = g_new + h_new
                             heapq.heappush(cell_open, (f_new, new_i, new_j))
-                            cell_tab[new_i][new_j].f = f_new
-                            cell_tab[new_i][new_j].g = g_new
-                            cell_tab[new_i][new_j].h = h_new
-                            cell_tab[new_i][new_j].parent_i = i
-                            cell_tab[new_i][new_j].parent_j = j
+                            cost[new_index] = g_new + 1
+                            parent[new_index] = code
                     if screen is not None:
-                        MazeGenerator.print_maze(screen, maze, hide=False)
-                        time.sleep(1 / 60)
-                        screen.refresh()
+                        screen.step(maze)
+        if stats is not None:
+            stats.count("solve.nodes_expanded", expanded)
+        if screen is not None:
+            screen.flush(maze)
         return []
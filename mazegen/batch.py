@@ -0,0 +1,245 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Container, Deque, Dict, Iterator, Optional, Tuple
+import argparse
+import json
+import os
+import sys
+
+
+def build_one(
+    name: str,
+    params: Dict[str, Any],
+    directory: str,
+    seed: Optional[int],
+    checkpoints: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Generate, solve and grade one maze of a batch.
+
+    Parameters
+    ----------
+    name : str
+        The configuration name, used for the output file name.
+    params : Dict[str, Any]
+        The configuration keys, as yielded by `load_configs`.
+    directory : str
+        The output directory.
+    seed : Optional[int]
+        Used as SEED when the configuration has none.
+    checkpoints : Optional[str], optional
+        A directory in which the maze is checkpointed as '<name>.ckpt',
+        unless the configuration sets CHECKPOINT. Default is None.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The metadata record of the maze: name, output file, configuration,
+        entry, exit, metrics and structure (see `mazegen.verify.verify`),
+        or name and error if it failed.
+    """
+    from pydantic import ValidationError
+    from mazegen import Config, MazeGenerator
+    from .hexio import EXTENSIONS, write
+    from .metrics import compute
+    from .verify import verify
+
+    if seed is not None and params.get("SEED") in (None, ""):
+        params = {**params, "SEED": seed}
+    params = {"OUTPUT_FILE": "-", **params}
+    injected = False
+    if checkpoints is not None and not params.get("CHECKPOINT"):
+        injected = True
+        stem = os.path.splitext(name)[0]
+        checkpoint = os.path.join(checkpoints, stem + ".ckpt")
+        params = {**params, "CHECKPOINT": checkpoint}
+    try:
+        config = Config(**params)
+        generator = MazeGenerator(config=config)
+    except ValidationError as e:
+        message = "; ".join(error["msg"] for error in e.errors())
+        return {"name": name, "error": message}
+    except ValueError as e:
+        return {"name": name, "error": str(e)}
+    # The checkpoint file of the batch is an artifact of the run.
+    recorded = config
+    if injected:
+        recorded = config.model_copy(update={"checkpoint": None})
+    compression = config.compression or "none"
+    filename = os.path.splitext(name)[0] + ".txt" + EXTENSIONS[compression]
+    start, end = generator.start_pos, generator.end_pos
+    write(
+        os.path.join(directory, filename),
+        generator.iter_hex_maze(generator.maze),
+        start,
+        end,
+        generator.path,
+        compression,
+    )
+    return {
+        "name": name,
+        "file": filename,
+        "config": recorded.model_dump(mode="json", by_alias=True),
+        "entry": list(start),
+        "exit": list(end),
+        "metrics": compute(generator.maze, generator.path),
+        "structure": verify(generator.maze),
+    }
+
+
+def finished(directory: str, metadata: str) -> Dict[str, str]:
+    """
+    Find the mazes that a previous run of a batch completed.
+
+    Parameters
+    ----------
+    directory : str
+        The output directory of the batch.
+    metadata : str
+        Its metadata file.
+
+    Returns
+    -------
+    Dict[str, str]
+        The metadata line of every maze with a record (not an error) whose
+        output file exists, by name. Lines cut short by a crash are
+        ignored.
+    """
+    done: Dict[str, str] = {}
+    try:
+        file = open(metadata)
+    except FileNotFoundError:
+        return done
+    with file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(record, dict) or "file" not in record:
+                continue
+            if os.path.exists(os.path.join(directory, record["file"])):
+                done[record["name"]] = line.rstrip("\n") + "\n"
+    return done
+
+
+def run(
+    source: str,
+    directory: str,
+    workers: int = 1,
+    seed: Optional[int] = None,
+    checkpoint_dir: Optional[str] = None,
+    skip: Container[str] = (),
+) -> Iterator[Dict[str, Any]]:
+    """
+    Build every configuration of `source` into `directory`.
+
+    Parameters
+    ----------
+    source : str
+        A directory of config files, a JSONL file or '-' (see
+        `mazegen.parser.load_configs`).
+    directory : str
+        The output directory, created if needed.
+    workers : int, optional
+        Number of worker processes; 1 builds in the current process.
+        Default is 1. At most 4 jobs per worker are in flight, so the
+        configurations are read from `source` as the batch progresses.
+    seed : Optional[int], optional
+        Base seed: configuration number i without SEED gets
+        `MazeGenerator.derive_seed(seed, i)`. Default is None.
+    checkpoint_dir : Optional[str], optional
+        Directory of the per-maze checkpoints, created if needed. Running
+        the same batch again after an interruption resumes the mazes that
+        were being generated (see `mazegen.checkpoint`). Default is None.
+    skip : Container[str], optional
+        Names of configurations not to build, e.g. from `finished`. They
+        keep their index, hence their derived seed. Default is empty.
+
+    Yields
+    ------
+    Dict[str, Any]
+        The metadata record of each maze built, in source order.
+    """
+    from mazegen import MazeGenerator
+    from .parser import load_configs
+
+    os.makedirs(directory, exist_ok=True)
+    if checkpoint_dir is not None:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+    Job = Tuple[str, Dict[str, Any], str, Optional[int], Optional[str]]
+
+    def jobs() -> Iterator[Job]:
+        for index, (name, params) in enumerate(load_configs(source)):
+            if name in skip:
+                continue
+            child = None
+            if seed is not None:
+                child = MazeGenerator.derive_seed(seed, index)
+            yield name, params, directory, child, checkpoint_dir
+
+    if workers <= 1:
+        for job in jobs():
+            yield build_one(*job)
+        return
+    window = 4 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Future[Dict[str, Any]]] = deque()
+        for job in jobs():
+            pending.append(pool.submit(build_one, *job))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def main() -> None:
+    """
+    Entry point of `python -m mazegen.batch`.
+
+    With `--checkpoint-dir` the run is resumable: the mazes whose output
+    file and metadata record exist are skipped, the records of the others
+    are dropped from `metadata.jsonl`, and new records are appended to it.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m mazegen.batch",
+        description="Generate many mazes and write their metadata.",
+    )
+    parser.add_argument("source", help="config directory, .jsonl file or -")
+    parser.add_argument("output", help="output directory")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--checkpoint-dir", default=None, help="resumable checkpoints"
+    )
+    args = parser.parse_args()
+    failed = 0
+    metadata = os.path.join(args.output, "metadata.jsonl")
+    os.makedirs(args.output, exist_ok=True)
+    done: Dict[str, str] = {}
+    if args.checkpoint_dir is not None:
+        done = finished(args.output, metadata)
+        temporary = metadata + ".tmp"
+        with open(temporary, "w") as file:
+            file.writelines(done.values())
+        os.replace(temporary, metadata)
+    with open(metadata, "a" if done else "w") as file:
+        for record in run(
+            args.source,
+            args.output,
+            args.workers,
+            args.seed,
+            args.checkpoint_dir,
+            done,
+        ):
+            if "error" in record:
+                failed += 1
+                print(f"{record['name']}: {record['error']}", file=sys.stderr)
+            file.write(json.dumps(record) + "\n")
+            file.flush()
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, cast
+
+from .stats import Stats
+
+Point = Tuple[int, int]
+Pair = Tuple[Point, Point]
+
+MOVES = b"NSWE"
+
+
+class BulkResult(NamedTuple):
+    """
+    Shortest paths for a batch of (start, end) pairs, in query order.
+
+    Attributes:
+        lengths (array): Path length in moves for each pair, or -1 when the
+            end cannot be reached.
+        paths (List[bytes]): The moves of each path, one ASCII letter
+            (N, S, W, E) per move; empty when unreachable or not requested.
+    """
+
+    lengths: "array[int]"
+    paths: List[bytes]
+
+
+def flatten(maze: Sequence[Sequence[int]]) -> bytes:
+    """Pack a maze grid into one byte per position, row after row."""
+    return b"".join(bytes(row) for row in maze)
+
+
+def flood(grid: Sequence[int], width: int, source: Point) -> bytearray:
+    """
+    Breadth-first flood of every cell reachable from `source`.
+
+    Args:
+        grid (Sequence[int]): The flattened maze (see `flatten`).
+        width (int): Number of grid columns.
+        source (Point): The source cell in maze (row, col) cell units.
+
+    Returns:
+        bytearray: One byte per cell, row-major: 1 + the index in `MOVES` of
+            the move that first reached the cell, 5 for the source and 0 for
+            unreachable cells.
+    """
+    return sweep(grid, width, source)[0]
+
+
+def sweep(
+    grid: Sequence[int], width: int, source: Point
+) -> Tuple[bytearray, Point]:
+    """
+    Flood from `source` like `flood` and also return the farthest cell.
+
+    The last cell dequeued by a breadth-first search is one of the cells
+    farthest from the source, so it comes for free.
+
+    Returns:
+        Tuple[bytearray, Point]: The parent moves (see `flood`) and the
+            farthest cell in (row, col) cell units.
+    """
+    rows = len(grid) // width // 2
+    cols = width // 2
+    parent = bytearray(rows * cols)
+    cell = source[0] * cols + source[1]
+    parent[cell] = 5
+    queue = deque([cell])
+    while queue:
+        cell = queue.popleft()
+        r, c = divmod(cell, cols)
+        pos = (2 * r + 1) * width + 2 * c + 1
+        if r > 0 and grid[pos - width] and not parent[cell - cols]:
+            parent[cell - cols] = 1
+            queue.append(cell - cols)
+        if r < rows - 1 and grid[pos + width] and not parent[cell + cols]:
+            parent[cell + cols] = 2
+            queue.append(cell + cols)
+        if c > 0 and grid[pos - 1] and not parent[cell - 1]:
+            parent[cell - 1] = 3
+            queue.append(cell - 1)
+        if c < cols - 1 and grid[pos + 1] and not parent[cell + 1]:
+            parent[cell + 1] = 4
+            queue.append(cell + 1)
+    return parent, divmod(cell, cols)
+
+
+def trace(parent: bytearray, cols: int, target: Point) -> Optional[bytes]:
+    """
+    Read the path to `target` back from a flood.
+
+    Returns:
+        Optional[bytes]: The moves from the flood source to `target`, or
+            None if `target` was not reached.
+    """
+    cell = target[0] * cols + target[1]
+    if not parent[cell]:
+        return None
+    step = (-cols, cols, -1, 1)
+    moves = bytearray()
+    while parent[cell] != 5:
+        code = parent[cell] - 1
+        moves.append(MOVES[code])
+        cell -= step[code]
+    moves.reverse()
+    return bytes(moves)
+
+
+def solve_group(
+    grid: Sequence[int], width: int, source: Point, targets: List[Point]
+) -> List[Optional[bytes]]:
+    """Flood once from `source` and trace the path to every target."""
+    parent = flood(grid, width, source)
+    return [trace(parent, width // 2, target) for target in targets]
+
+
+def _solve_shared(
+    name: str, size: int, width: int, source: Point, targets: List[Point]
+) -> List[Optional[bytes]]:
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(name=name)
+    grid = cast(memoryview, block.buf)[:size]
+    try:
+        return solve_group(grid, width, source, targets)
+    finally:
+        grid.release()
+        block.close()
+
+
+def solve_many(
+    maze: Sequence[Sequence[int]],
+    pairs: Sequence[Pair],
+    workers: int = 0,
+    paths: bool = True,
+    stats: Optional[Stats] = None,
+) -> BulkResult:
+    """
+    Find shortest paths for many (start, end) pairs on one maze.
+
+    Pairs are grouped by start and each group is answered by a single
+    breadth-first flood, so evaluating every exit candidate of an entry
+    costs one traversal instead of one A* search per candidate. Paths are
+    exact shortest paths in number of moves; they can be shorter than those
+    of `AStar`, whose heuristic is measured in grid units and may
+    overestimate.
+
+    Args:
+        maze (Sequence[Sequence[int]]): The maze grid, as produced by
+            `MazeGenerator.maze_gen`; it is only read.
+        pairs (Sequence[Pair]): (start, end) pairs in cell units, given as
+            (x, y) like ENTRY and EXIT in the configuration file.
+        workers (int, optional): When greater than 1, groups are spread over
+            that many worker processes which read the maze from shared
+            memory instead of receiving a copy each. Defaults to 0.
+        paths (bool, optional): Also return the moves, not only the
+            lengths. Defaults to True.
+        stats (Stats, optional): Receives the number of floods under
+            "bulk.floods". Defaults to None.
+
+    Returns:
+        BulkResult: Lengths and paths, in the order of `pairs`.
+
+    Raises:
+        ValueError: If a start or end lies outside the maze.
+    """
+    height = len(maze)
+    width = len(maze[0])
+    groups: Dict[Point, List[int]] = {}
+    for index, (start, end) in enumerate(pairs):
+        for x, y in (start, end):
+            if not (0 <= x < width // 2 and 0 <= y < height // 2):
+                raise ValueError(f"Invalid coordinate {(x, y)}")
+        groups.setdefault((start[1], start[0]), []).append(index)
+    grid = flatten(maze)
+    jobs = [
+        (source, [(pairs[i][1][1], pairs[i][1][0]) for i in indices])
+        for source, indices in groups.items()
+    ]
+    if workers > 1 and len(jobs) > 1:
+        from multiprocessing import shared_memory
+
+        block = shared_memory.SharedMemory(create=True, size=len(grid))
+        try:
+            cast(memoryview, block.buf)[:len(grid)] = grid
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        _solve_shared,
+                        block.name,
+                        len(grid),
+                        width,
+                        source,
+                        targets,
+                    )
+                    for source, targets in jobs
+                ]
+                found = [future.result() for future in futures]
+        finally:
+            block.close()
+            block.unlink()
+    else:
+        found = [
+            solve_group(grid, width, source, targets)
+            for source, targets in jobs
+        ]
+    if stats is not None:
+        stats.count("bulk.floods", len(jobs))
+    lengths = array("i", [-1]) * len(pairs)
+    moves = [b""] * len(pairs)
+    for indices, results in zip(groups.values(), found):
+        for index, result in zip(indices, results):
+            if result is not None:
+                lengths[index] = len(result)
+                if paths:
+                    moves[index] = result
+    return BulkResult(lengths, moves)
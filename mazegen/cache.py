@@ -0,0 +1,307 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Tuple
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+if TYPE_CHECKING:
+    from mazegen import Config
+
+MAGIC = b"MZC1"
+HEADER = struct.Struct("<4sIIII")
+
+
+class CacheEntry(NamedTuple):
+    """
+    A cached maze result.
+
+    Attributes
+    ----------
+    maze : Tuple[bytes, ...]
+        The maze grid, one read-only `bytes` row per grid line. Rows index
+        like lists: `maze[x][y]` is the CELL value of a grid position.
+    hex_rows : List[str]
+        The hexadecimal encoding produced by `convert_hex_maze`.
+    path : str
+        The solution path (N, E, S, W moves).
+    """
+
+    maze: Tuple[bytes, ...]
+    hex_rows: List[str]
+    path: str
+
+    def size(self) -> int:
+        """Return the approximate memory footprint in bytes."""
+        grid = sum(map(len, self.maze))
+        return grid + sum(map(len, self.hex_rows)) + len(self.path)
+
+
+class ResultCache:
+    """
+    Two-level (memory and disk) cache of generated and solved mazes.
+
+    Entries are keyed by a hash of the full configuration, the solver name
+    and the library version, so a hit is always safe to reuse: a seeded
+    configuration is deterministic. Configurations without a SEED are never
+    cached.
+
+    On disk each entry is one file: a fixed header followed by the packed
+    grid (one byte per cell), the hex rows and the path. Files are read
+    through `mmap`, and the least recently used ones are deleted once the
+    directory grows past `max_bytes`. The directory is scanned once, when
+    the cache is created; from then on an LRU index of the file sizes is
+    kept up to date, so storing an entry does not list the directory. The
+    in-memory level is an LRU bounded by `memory_bytes`.
+
+    Attributes
+    ----------
+    directory : str
+        Where cache files are stored. Created on demand.
+    max_bytes : int
+        Size bound of the on-disk cache.
+    memory_bytes : int
+        Size bound of the in-memory cache.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        memory_bytes: int = 32 * 1024 * 1024,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_bytes = memory_bytes
+        self.__memory: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.__memory_used = 0
+        self.__files: OrderedDict[str, int] = OrderedDict()
+        self.__disk_used = 0
+        self.scan()
+
+    def scan(self) -> None:
+        """Rebuild the on-disk LRU index from the cache directory."""
+        files = []
+        try:
+            with os.scandir(self.directory) as it:
+                for item in it:
+                    if item.name.endswith(".mzc"):
+                        info = item.stat()
+                        key = os.path.splitext(item.name)[0]
+                        files.append((info.st_mtime, key, info.st_size))
+        except FileNotFoundError:
+            pass
+        files.sort()
+        self.__files = OrderedDict((key, size) for _, key, size in files)
+        self.__disk_used = sum(self.__files.values())
+
+    @staticmethod
+    def key(config: "Config", algorithm: str = "astar") -> str:
+        """
+        Compute the cache key of a configuration.
+
+        Parameters
+        ----------
+        config : Config
+            The maze configuration; every field takes part in the key, and
+            so does the content of the MASK file, if any.
+        algorithm : str, optional
+            Name of the solver producing the path. Default is "astar".
+
+        Returns
+        -------
+        str
+            A hexadecimal SHA-256 digest.
+        """
+        from mazegen import __version__
+
+        mask = None
+        if config.mask is not None and config.mask.lower() != "none":
+            try:
+                with open(config.mask, "rb") as file:
+                    mask = hashlib.sha256(file.read()).hexdigest()
+            except OSError:
+                pass
+        data = json.dumps(
+            {
+                "config": config.model_dump(mode="json"),
+                "mask": mask,
+                "algorithm": algorithm,
+                "version": __version__,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def filename(self, key: str) -> str:
+        """Return the path of the on-disk entry for `key`."""
+        return os.path.join(self.directory, key + ".mzc")
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look an entry up, first in memory, then on disk.
+
+        Parameters
+        ----------
+        key : str
+            A key returned by `key`.
+
+        Returns
+        -------
+        Optional[CacheEntry]
+            The cached result, or None on a miss or an unreadable file.
+        """
+        entry = self.__memory.get(key)
+        if entry is not None:
+            self.__memory.move_to_end(key)
+            if key in self.__files:
+                self.__files.move_to_end(key)
+            return entry
+        path = self.filename(key)
+        try:
+            with open(path, "rb") as file, mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                entry = self.unpack(mm)
+            os.utime(path)
+        except (OSError, ValueError, struct.error):
+            return None
+        if key in self.__files:
+            self.__files.move_to_end(key)
+        self.__remember(key, entry)
+        return entry
+
+    def put(
+        self,
+        key: str,
+        maze: Sequence[Sequence[int]],
+        hex_rows: List[str],
+        path: Sequence[str],
+    ) -> CacheEntry:
+        """
+        Store a result in both cache levels.
+
+        Parameters
+        ----------
+        key : str
+            A key returned by `key`.
+        maze : Sequence[Sequence[int]]
+            The maze grid.
+        hex_rows : List[str]
+            The hexadecimal encoding of the maze.
+        path : Sequence[str]
+            The solution moves.
+
+        Returns
+        -------
+        CacheEntry
+            The stored entry.
+        """
+        entry = CacheEntry(
+            tuple(bytes(row) for row in maze), list(hex_rows), "".join(path)
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        target = self.filename(key)
+        temp = f"{target}.{os.getpid()}.tmp"
+        data = self.pack(entry)
+        with open(temp, "wb") as file:
+            file.write(data)
+        os.replace(temp, target)
+        self.__disk_used += len(data) - self.__files.pop(key, 0)
+        self.__files[key] = len(data)
+        self.__remember(key, entry)
+        self.evict()
+        return entry
+
+    def __remember(self, key: str, entry: CacheEntry) -> None:
+        if key in self.__memory:
+            self.__memory_used -= self.__memory.pop(key).size()
+        self.__memory[key] = entry
+        self.__memory_used += entry.size()
+        while self.__memory_used > self.memory_bytes and self.__memory:
+            _, old = self.__memory.popitem(last=False)
+            self.__memory_used -= old.size()
+
+    def evict(self) -> None:
+        """Delete least recently used files until under `max_bytes`."""
+        while self.__disk_used > self.max_bytes and self.__files:
+            key, size = self.__files.popitem(last=False)
+            self.__disk_used -= size
+            try:
+                os.remove(self.filename(key))
+            except OSError:
+                continue
+
+    @staticmethod
+    def pack(entry: CacheEntry) -> bytes:
+        """
+        Serialize an entry to the on-disk format.
+
+        The layout is a little-endian header (magic, height, width, hex size,
+        path size), the grid bytes row by row, the hex rows joined by
+        newlines and the path, all ASCII.
+        """
+        hex_data = "\n".join(entry.hex_rows).encode()
+        path_data = entry.path.encode()
+        height = len(entry.maze)
+        width = len(entry.maze[0]) if height else 0
+        header = HEADER.pack(
+            MAGIC, height, width, len(hex_data), len(path_data)
+        )
+        return b"".join([header, *entry.maze, hex_data, path_data])
+
+    @staticmethod
+    def unpack(data: "bytes | mmap.mmap") -> CacheEntry:
+        """
+        Deserialize an entry written by `pack`.
+
+        Raises
+        ------
+        ValueError
+            If the data does not start with the cache file magic.
+        """
+        magic, height, width, hex_size, path_size = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Invalid cache file")
+        offset = HEADER.size
+        maze = tuple(
+            data[offset + i * width:offset + (i + 1) * width]
+            for i in range(height)
+        )
+        offset += height * width
+        hex_data = data[offset:offset + hex_size].decode()
+        offset += hex_size
+        path = data[offset:offset + path_size].decode()
+        return CacheEntry(maze, hex_data.split("\n") if hex_data else [], path)
+
+    def build(self, config: "Config") -> CacheEntry:
+        """
+        Return the cached result of a configuration, computing it on a miss.
+
+        Parameters
+        ----------
+        config : Config
+            The maze configuration. Without a seed nothing is cached.
+
+        Returns
+        -------
+        CacheEntry
+            The maze grid, its hex encoding and the A* path.
+        """
+        from mazegen import MazeGenerator
+
+        key = self.key(config) if config.seed is not None else None
+        if key is not None:
+            entry = self.get(key)
+            if entry is not None:
+                return entry
+        generator = MazeGenerator(config=config)
+        hex_rows = generator.convert_hex_maze(generator.maze)
+        if key is not None:
+            return self.put(key, generator.maze, hex_rows, generator.path)
+        return CacheEntry(
+            tuple(bytes(row) for row in generator.maze),
+            hex_rows,
+            "".join(generator.path),
+        )
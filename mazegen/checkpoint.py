@@ -0,0 +1,229 @@
+from array import array
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Sequence
+from typing import Tuple
+import gzip
+import hashlib
+import json
+import os
+import random
+import struct
+import time
+
+MAGIC = b"AMZK"
+VERSION = 1
+# Generation phases, in order: a checkpoint records the last one reached.
+CARVE = 1
+CARVED = 2
+IMPERFECT = 3
+# magic, version, phase, config key, height, width, current cell (row,
+# col), cells carved, deepest stack, stack length.
+HEADER = struct.Struct("<4sBB16sIIIIQQQ")
+# Mersenne Twister state: version, 625 words, pending gauss value.
+RNG = struct.Struct("<i625I?d")
+GZIP_LEVEL = 1
+# Settings that do not change the grid, left out of the configuration key.
+UNKEYED = {
+    "out_put",
+    "grid_file",
+    "compression",
+    "checkpoint",
+    "checkpoint_interval",
+}
+
+if TYPE_CHECKING:
+    from .config import Config
+
+
+class State(NamedTuple):
+    """The generation state read back from a checkpoint."""
+
+    phase: int
+    curr: Tuple[int, int]
+    prev: List[Tuple[int, int]]
+    carved: int
+    depth: int
+    rng: Tuple[Any, ...]
+
+
+def config_key(config: "Config") -> bytes:
+    """Return the 16-byte key of the settings that shape the grid."""
+    fields = config.model_dump(mode="json", exclude=UNKEYED)
+    data = json.dumps(fields, sort_keys=True).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def pack_rng(rng: random.Random) -> bytes:
+    """Serialize the state of `rng`."""
+    version, words, gauss = rng.getstate()
+    return RNG.pack(version, *words, gauss is not None, gauss or 0.0)
+
+
+def unpack_rng(data: bytes) -> Tuple[Any, ...]:
+    """Rebuild a `random.Random.setstate` argument from `pack_rng`."""
+    fields = RNG.unpack(data)
+    gauss = fields[-1] if fields[-2] else None
+    return (fields[0], tuple(fields[1:-2]), gauss)
+
+
+class Checkpointer:
+    """
+    Periodically save the state of a `maze_gen` call, and resume from it.
+
+    A checkpoint is a gzip stream (level 1) holding a fixed header, the RNG
+    state, the backtracker's `prev` stack as 32-bit (row, col) pairs and
+    the grid, one byte per position. Everything the remaining generation
+    reads is in it, so a resumed run draws the same random numbers at the
+    same points and yields a bit-identical maze. Files are written to a
+    temporary name and renamed, so a crash during a save keeps the
+    previous checkpoint.
+
+    Attributes
+    ----------
+    filename : str
+        The checkpoint file.
+    key : bytes
+        16 bytes identifying the configuration; a checkpoint written for
+        another configuration is rejected.
+    interval : float
+        Minimum number of seconds between two saves.
+    saves : int
+        Checkpoints written so far.
+    """
+
+    def __init__(self, filename: str, key: bytes, interval: float) -> None:
+        self.filename = filename
+        self.key = key
+        self.interval = interval
+        self.saves = 0
+        self.last = time.monotonic()
+
+    def due(self) -> bool:
+        """Return True when `interval` seconds passed since the last save."""
+        return time.monotonic() - self.last >= self.interval
+
+    def save(
+        self,
+        phase: int,
+        maze: Sequence[Sequence[int]],
+        rng: random.Random,
+        curr: Tuple[int, int] = (0, 0),
+        prev: Sequence[Tuple[int, int]] = (),
+        carved: int = 0,
+        depth: int = 0,
+    ) -> None:
+        """
+        Write a checkpoint of the current generation state.
+
+        Parameters
+        ----------
+        phase : int
+            CARVE while the backtracker runs, CARVED or IMPERFECT once that
+            phase is complete.
+        maze : Sequence[Sequence[int]]
+            The grid being generated.
+        rng : random.Random
+            The random stream of the generation call.
+        curr, prev : optional
+            The backtracker's current cell and stack (CARVE only).
+        carved, depth : int, optional
+            The carving counters, restored into the stats on resume.
+        """
+        stack = array("I")
+        for row, col in prev:
+            stack.append(row)
+            stack.append(col)
+        temporary = self.filename + ".tmp"
+        with gzip.open(temporary, "wb", compresslevel=GZIP_LEVEL) as file:
+            file.write(
+                HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    phase,
+                    self.key,
+                    len(maze),
+                    len(maze[0]),
+                    curr[0],
+                    curr[1],
+                    carved,
+                    depth,
+                    len(prev),
+                )
+            )
+            file.write(pack_rng(rng))
+            file.write(stack.tobytes())
+            for line in maze:
+                file.write(bytes(line))
+        os.replace(temporary, self.filename)
+        self.saves += 1
+        self.last = time.monotonic()
+
+    def load(self, maze: Sequence[Any]) -> Optional[State]:
+        """
+        Read the checkpoint back, if there is one.
+
+        Parameters
+        ----------
+        maze : Sequence[Any]
+            A grid of the configured size, overwritten with the saved one.
+
+        Returns
+        -------
+        Optional[State]
+            The saved state, or None when there is no checkpoint file.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a checkpoint, is truncated, or was written
+            for another configuration.
+        """
+        if not os.path.exists(self.filename):
+            return None
+        try:
+            with gzip.open(self.filename, "rb") as file:
+                header = file.read(HEADER.size)
+                if len(header) != HEADER.size:
+                    raise ValueError("truncated header")
+                (
+                    magic,
+                    version,
+                    phase,
+                    key,
+                    height,
+                    width,
+                    row,
+                    col,
+                    carved,
+                    depth,
+                    size,
+                ) = HEADER.unpack(header)
+                if magic != MAGIC or version != VERSION:
+                    raise ValueError("unknown format")
+                if key != self.key:
+                    raise ValueError("written for another configuration")
+                if (height, width) != (len(maze), len(maze[0])):
+                    raise ValueError("grid size mismatch")
+                state = unpack_rng(self.exact(file, RNG.size))
+                stack = array("I")
+                stack.frombytes(self.exact(file, 2 * size * stack.itemsize))
+                for line in maze:
+                    line[:] = self.exact(file, width)
+        except (OSError, EOFError, struct.error, ValueError) as e:
+            raise ValueError(
+                f"Invalid checkpoint {self.filename}: {e}"
+            ) from e
+        prev = list(zip(stack[0::2], stack[1::2]))
+        return State(phase, (row, col), prev, carved, depth, state)
+
+    @staticmethod
+    def exact(file: Any, size: int) -> bytes:
+        """Read exactly `size` bytes from `file`."""
+        data = file.read(size)
+        if len(data) != size:
+            raise ValueError("truncated file")
+        return bytes(data)
+
+    def clear(self) -> None:
+        """Remove the checkpoint file once the generation is complete."""
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
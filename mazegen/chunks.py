@@ -0,0 +1,201 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+import random
+
+from mazegen import MazeGenerator
+
+Chunk = Tuple[bytes, ...]
+
+
+class ChunkedMaze:
+    """
+    An unbounded maze generated lazily, one square chunk at a time.
+
+    The plane of cells is split into `chunk_size` x `chunk_size` chunks.
+    Chunk (cx, cy) is carved on its own by `MazeGenerator.carve` (or
+    `carve_tiled`) with the RNG seeded by `derive_seed(seed, cx, cy)`, so
+    it only depends on the seed and its coordinates, never on which chunks
+    were generated before. Each border between two neighbouring chunks gets
+    one opening, whose position is derived the same way from the seed and
+    the coordinates of the border: both chunks compute the same opening,
+    and every cell can reach every other one.
+
+    Each chunk is a perfect maze; the whole plane has loops at the chunk
+    scale, as the chunks form a grid. Generated chunks are kept in an LRU
+    cache of `cache_size` chunks, so querying a region costs only the
+    chunks it touches. Instances are not thread safe.
+
+    Attributes
+    ----------
+    seed : int
+        The base seed.
+    chunk_size : int
+        Side of a chunk, in cells.
+    cache_size : int
+        Maximum number of chunks kept in memory.
+    generated : int
+        Chunks generated so far, including regenerated evicted chunks.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        chunk_size: int = 32,
+        cache_size: int = 64,
+        algorithm: str = "backtracker",
+    ) -> None:
+        from mazegen import Config
+
+        if chunk_size < 2:
+            raise ValueError("chunk_size must be at least 2")
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.cache_size = cache_size
+        self.generated = 0
+        self.__chunks: OrderedDict[Tuple[int, int], Chunk] = OrderedDict()
+        params: Dict[str, Any] = {
+            "WIDTH": chunk_size,
+            "HEIGHT": chunk_size,
+            "ENTRY": "0,0",
+            "EXIT": f"{chunk_size - 1},{chunk_size - 1}",
+            "PERFECT": True,
+            "SEED": seed,
+            "OUTPUT_FILE": "-",
+            "ALGORITHM": algorithm,
+            "MASK": "none",
+        }
+        self.__carver = MazeGenerator(config=Config(**params))
+
+    def opening(self, cx: int, cy: int, axis: int) -> int:
+        """
+        Return the cell of a chunk border that is left open.
+
+        Parameters
+        ----------
+        cx, cy : int
+            The chunk on the west (axis 0) or north (axis 1) side of the
+            border.
+        axis : int
+            0 for the east border of the chunk, 1 for its south border.
+
+        Returns
+        -------
+        int
+            The row (axis 0) or column (axis 1) of the opening, in cells
+            from the chunk's corner.
+        """
+        digest = MazeGenerator.derive_seed(self.seed, cx, cy, axis)
+        return digest % self.chunk_size
+
+    def build(self, cx: int, cy: int) -> Chunk:
+        """
+        Generate chunk (cx, cy), without caching it.
+
+        Returns
+        -------
+        Chunk
+            The chunk grid, 2 * chunk_size + 1 rows of bytes in grid units:
+            its border rows and columns are shared with its neighbours.
+        """
+        side = 2 * self.chunk_size
+        maze = [[0] * (side + 1) for _ in range(side + 1)]
+        rng = random.Random(MazeGenerator.derive_seed(self.seed, cx, cy))
+        if self.__carver.algorithm == "tiled":
+            self.__carver.carve_tiled(maze, rng)
+        else:
+            self.__carver.carve(maze, rng)
+        maze[2 * self.opening(cx, cy, 0) + 1][side] = 1
+        maze[2 * self.opening(cx - 1, cy, 0) + 1][0] = 1
+        maze[side][2 * self.opening(cx, cy, 1) + 1] = 1
+        maze[0][2 * self.opening(cx, cy - 1, 1) + 1] = 1
+        self.generated += 1
+        return tuple(bytes(row) for row in maze)
+
+    def chunk(self, cx: int, cy: int) -> Chunk:
+        """Return chunk (cx, cy), from the cache or freshly generated."""
+        key = (cx, cy)
+        chunk = self.__chunks.get(key)
+        if chunk is not None:
+            self.__chunks.move_to_end(key)
+            return chunk
+        chunk = self.build(cx, cy)
+        self.__chunks[key] = chunk
+        if len(self.__chunks) > self.cache_size:
+            self.__chunks.popitem(last=False)
+        return chunk
+
+    def value(self, row: int, col: int) -> int:
+        """Return the CELL value at a global grid position (row, col)."""
+        side = 2 * self.chunk_size
+        cy, y = divmod(row, side)
+        cx, x = divmod(col, side)
+        return self.chunk(cx, cy)[y][x]
+
+    def region(
+        self, x: int, y: int, width: int, height: int, closed: bool = True
+    ) -> List[List[int]]:
+        """
+        Assemble a rectangle of cells into an ordinary grid.
+
+        Parameters
+        ----------
+        x, y : int
+            The top left cell, possibly negative.
+        width, height : int
+            Size of the rectangle, in cells.
+        closed : bool, optional
+            Wall off the outer border of the region. Default is True.
+
+        Returns
+        -------
+        List[List[int]]
+            A (2 * height + 1) x (2 * width + 1) grid in the layout of
+            `maze_gen`. When `closed`, `iter_hex_maze`, `print_maze`, the
+            renderers and every solver accept it; cells that the chunks only
+            connect through the outside of the region are then unreachable
+            from the rest of it (a region aligned on chunk borders stays
+            connected). Otherwise the border is the chunks' content
+            and may have openings to the cells around the region, which
+            suits stitching regions together, but the solvers that step
+            through openings without bounds checks (`wall_follower`,
+            `dead_end`) may then index outside the grid.
+
+        Notes
+        -----
+        The region is assembled one band of chunks at a time, so each chunk
+        it touches is looked up once, even when the cache is smaller than
+        a band.
+        """
+        if width < 1 or height < 1:
+            raise ValueError("A region needs at least one cell")
+        side = 2 * self.chunk_size
+        top = 2 * y
+        bottom = 2 * (y + height) + 1
+        left = 2 * x
+        right = 2 * (x + width) + 1
+        grid = []
+        row = top
+        while row < bottom:
+            cy, first = divmod(row, side)
+            last = min(side + 1, first + bottom - row)
+            pieces = []
+            col = left
+            while col < right:
+                cx, start = divmod(col, side)
+                stop = min(side + 1, start + right - col)
+                pieces.append((self.chunk(cx, cy), start, stop))
+                col += stop - start
+            for local in range(first, last):
+                line: List[int] = []
+                for chunk, start, stop in pieces:
+                    line.extend(chunk[local][start:stop])
+                grid.append(line)
+            row += last - first
+        if closed:
+            grid[0] = [0] * len(grid[0])
+            grid[-1] = [0] * len(grid[-1])
+            for line in grid:
+                line[0] = line[-1] = 0
+        return grid
@@ -0,0 +1,124 @@
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+class Config(BaseModel):
+    """
+    Configuration model for maze generation settings.
+
+    Attributes:
+        height (int): The height of the maze. Must be >= 2. Defaults to 2.
+            Alias: HEIGHT
+        width (int): The width of the maze. Must be >= 2. Defaults to 2.
+            Alias: WIDTH
+        start_pos (tuple[int, int] | "auto"): The entry point coordinates
+            for the maze, or "auto" to place it as far as possible from the
+            exit. Defaults to (0, 0). Alias: ENTRY
+        end_pos (tuple[int, int] | "auto"): The exit point coordinates for
+            the maze, or "auto" to place it as far as possible from the
+            entry. Defaults to (1, 1). Alias: EXIT
+        perfect (bool): Flag indicating whether to generate a perfect maze.
+            Alias: PERFECT
+        seed (int | None): Optional seed value
+                for maze generation reproducibility.
+            Defaults to None. Alias: SEED
+        out_put (str): The output file path for the generated maze.
+            Must have minimum length of 1. Alias: OUTPUT_FILE
+        grid_file (str | None): Optional file in which the grid is built
+            as a memory map instead of a list of lists, for mazes that do
+            not fit in RAM. Defaults to None. Alias: GRID_FILE
+        algorithm (str): The carving algorithm, "backtracker" (default) or
+            "tiled". Alias: ALGORITHM
+        tile_size (int): Side of the square tiles of the "tiled" algorithm,
+            in cells. Must be >= 2. Defaults to 32. Alias: TILE_SIZE
+        max_frontier (int): Maximum number of cells held by the "tiled"
+            algorithm's frontier. Must be >= 1. Defaults to 64.
+            Alias: MAX_FRONTIER
+        mask (str | None): A text or PBM file of cells to block instead of
+            the "42" pattern, or "none" for no pattern at all. Defaults to
+            None (the "42"). Alias: MASK
+        mask_offset (tuple[int, int] | None): Position (x, y) of the mask's
+            top left cell. Defaults to None (centered). Alias: MASK_OFFSET
+        compression (str | None): Compression of the output file, "none",
+            "gzip" or "lzma". Defaults to None (from the OUTPUT_FILE
+            extension: .gz, .xz or .lzma). Alias: COMPRESSION
+        checkpoint (str | None): Optional file in which `maze_gen` saves
+            its state periodically, and from which it resumes when the file
+            exists (see `mazegen.checkpoint`). Defaults to None.
+            Alias: CHECKPOINT
+        checkpoint_interval (float): Minimum number of seconds between two
+            checkpoints. Must be > 0. Defaults to 60. Alias:
+            CHECKPOINT_INTERVAL
+
+    The model is frozen: a Config can be shared between threads and
+    generators without any of them being able to alter it.
+
+    Methods:
+        tupl_valid(value: str) -> list[str]: Validator that converts string
+            representation of tuples into a list of string coordinates.
+            Removes parentheses and splits by comma.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    height: int = Field(alias="HEIGHT", ge=2, default=2)
+    width: int = Field(alias="WIDTH", ge=2, default=2)
+    start_pos: tuple[int, int] | Literal["auto"] = Field(
+        alias="ENTRY", default=(0, 0)
+    )
+    end_pos: tuple[int, int] | Literal["auto"] = Field(
+        alias="EXIT", default=(1, 1)
+    )
+    perfect: bool = Field(alias="PERFECT")
+    seed: int | None = Field(default=None, alias="SEED")
+    out_put: str = Field(alias="OUTPUT_FILE", min_length=1)
+    grid_file: str | None = Field(default=None, alias="GRID_FILE")
+    algorithm: Literal["backtracker", "tiled"] = Field(
+        default="backtracker", alias="ALGORITHM"
+    )
+    tile_size: int = Field(default=32, ge=2, alias="TILE_SIZE")
+    max_frontier: int = Field(default=64, ge=1, alias="MAX_FRONTIER")
+    mask: str | None = Field(default=None, alias="MASK")
+    mask_offset: tuple[int, int] | None = Field(
+        default=None, alias="MASK_OFFSET"
+    )
+    compression: Literal["none", "gzip", "lzma"] | None = Field(
+        default=None, alias="COMPRESSION"
+    )
+    checkpoint: str | None = Field(default=None, alias="CHECKPOINT")
+    checkpoint_interval: float = Field(
+        default=60.0, gt=0, alias="CHECKPOINT_INTERVAL"
+    )
+
+    @field_validator("start_pos", "end_pos", "mask_offset", mode="before")
+    @staticmethod
+    def tupl_valid(value: str) -> list[str] | str:
+        """
+        Parses a string representation of a tuple by
+                removing empty parentheses and splitting by commas.
+                "auto" (in any case) is passed through, and so are tuples
+                and lists (an already parsed value, e.g. from model_dump).
+
+        Args:
+            value (str): A string containing tuple-like
+                data, potentially with parentheses.
+
+        Returns:
+            list[str] | str: A list of string elements split
+                by commas after removing empty parentheses, or "auto".
+
+        Example:
+            >>> tupl_valid("(1, 2, 3)")
+            ['1', ' 2', ' 3']
+            >>> tupl_valid("a,b,c")
+            ['a', 'b', 'c']
+        """
+        if not value:
+            raise ValueError("EXIT or ENTRY is empty")
+        if isinstance(value, str) and value.strip().lower() == "auto":
+            return "auto"
+        if isinstance(value, (tuple, list)):
+            return [str(item) for item in value]
+        value = value.replace("()", "")
+        return value.split(",")
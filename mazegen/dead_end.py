@@ -0,0 +1,207 @@
+from collections import deque
+from typing import Any, List, Optional, Sequence, Tuple
+from constant import CELL
+from .stats import Stats
+from .frames import FrameScheduler
+
+# Maps every cell value to 1 when open, 0 for walls.
+OPEN = bytes([0] + [1] * 255)
+# Move names and (row, col) cell offsets, in parent code order (code 1..4).
+MOVES = (("N", -1, 0), ("S", 1, 0), ("W", 0, -1), ("E", 0, 1))
+STEPS = {name: (d_r, d_c) for name, d_r, d_c in MOVES}
+
+
+def degrees(maze: Sequence[Sequence[int]]) -> bytearray:
+    """
+    Count the open walls around every cell.
+
+    Each grid row is converted to bytes and reduced to 0/1 with one
+    `translate`; the four neighbour counts of a whole cell row are then
+    added as big integers, one byte per cell (the sums never exceed 4, so
+    no carry crosses a byte). The per-cell work therefore runs in C.
+
+    Parameters
+    ----------
+    maze : Sequence[Sequence[int]]
+        The maze grid.
+
+    Returns
+    -------
+    bytearray
+        One byte per cell, row-major, in cell units: its number of openings.
+    """
+    rows = len(maze) // 2
+    cols = len(maze[0]) // 2
+    counts = bytearray()
+    below = bytes(maze[0]).translate(OPEN)
+    for r in range(rows):
+        above = below
+        line = bytes(maze[2 * r + 1]).translate(OPEN)
+        below = bytes(maze[2 * r + 2]).translate(OPEN)
+        total = 0
+        for part in (above[1::2], below[1::2], line[0:-1:2], line[2::2]):
+            total += int.from_bytes(part, "big")
+        counts += total.to_bytes(cols, "big")
+    return counts
+
+
+class DeadEndFiller:
+    start: Tuple[int, int]
+    end: Tuple[int, int]
+
+    def __init__(self, start: Tuple[int, int], end: Tuple[int, int]) -> None:
+        """
+        Initialize the dead-end filling solver.
+
+        Parameters
+        ----------
+        start : Tuple[int, int]
+            Entry coordinates (x, y) in cell units.
+        end : Tuple[int, int]
+            Exit coordinates (x, y) in cell units.
+
+        Notes
+        -----
+        The coordinates are stored in grid units as (row, col), like
+        `AStar`.
+        """
+        self.start = (start[1] * 2 + 1, start[0] * 2 + 1)
+        self.end = (end[1] * 2 + 1, end[0] * 2 + 1)
+
+    def solve(
+        self,
+        maze: list[list[int]],
+        screen: Optional[Any] = None,
+        stats: Optional[Stats] = None,
+    ) -> list[str]:
+        """
+        Find the shortest path by filling every dead end of the maze.
+
+        The openings of all cells are counted at once (see `degrees`), then
+        every cell with a single opening, other than the entry and the exit,
+        is filled and its neighbour's count decremented, until no dead end
+        is left. In a perfect maze the remaining cells are exactly the
+        solution; in an imperfect one they are the solution and the loops
+        around it, and a breadth-first search over them picks the shortest
+        path. The cost is linear and independent of where the endpoints
+        are, which suits solving whole grids in batch.
+
+        Parameters
+        ----------
+        maze : list[list[int]]
+            A 2D list representing the maze grid.
+        screen : Optional[Any], optional
+            A curses screen, or a `FrameScheduler` wrapping one: filled cells
+            are marked as explored and the path as found, and both are
+            animated. Default is None.
+        stats : Optional[Stats], optional
+            Receives the number of filled and searched cells under
+            "solve.nodes_expanded". Default is None.
+
+        Returns
+        -------
+        list[str]
+            The moves (N, S, E, W) from start to end, or an empty list if the
+            end cannot be reached.
+
+        Notes
+        -----
+        Without a screen `maze` is only read.
+        """
+        if screen is not None:
+            screen = FrameScheduler.of(screen)
+        cols = len(maze[0]) // 2
+        degree = degrees(maze)
+        source = self.start[0] // 2 * cols + self.start[1] // 2
+        goal = self.end[0] // 2 * cols + self.end[1] // 2
+        filled = bytearray(len(degree))
+        filled[source] = filled[goal] = 2
+        queue = deque(
+            cell for cell, count in enumerate(degree) if count == 1
+        )
+        expanded = 0
+        while queue:
+            cell = queue.popleft()
+            if filled[cell]:
+                continue
+            filled[cell] = 1
+            expanded += 1
+            r, c = divmod(cell, cols)
+            y, x = 2 * r + 1, 2 * c + 1
+            if screen is not None:
+                if maze[y][x] == CELL.EMPTY.value:
+                    maze[y][x] = CELL.PATH.value
+                screen.step(maze)
+            for _, d_r, d_c in MOVES:
+                near = cell + d_r * cols + d_c
+                if maze[y + d_r][x + d_c] != 0 and filled[near] != 1:
+                    degree[near] -= 1
+                    if degree[near] == 1:
+                        queue.append(near)
+        path, searched = self.search(maze, filled, source, goal)
+        if stats is not None:
+            stats.count("solve.nodes_expanded", expanded + searched)
+        if screen is not None:
+            self.mark(maze, path, screen)
+        return path
+
+    def search(
+        self,
+        maze: Sequence[Sequence[int]],
+        filled: bytearray,
+        source: int,
+        goal: int,
+    ) -> Tuple[List[str], int]:
+        """
+        Breadth-first search over the cells left unfilled.
+
+        Returns
+        -------
+        Tuple[List[str], int]
+            The moves from `source` to `goal` (empty if unreachable) and the
+            number of cells expanded.
+        """
+        cols = len(maze[0]) // 2
+        parent = bytearray(len(filled))
+        parent[source] = 255
+        queue = deque([source])
+        searched = 0
+        while queue and not parent[goal]:
+            cell = queue.popleft()
+            searched += 1
+            r, c = divmod(cell, cols)
+            y, x = 2 * r + 1, 2 * c + 1
+            for code, (_, d_r, d_c) in enumerate(MOVES, 1):
+                near = cell + d_r * cols + d_c
+                if (
+                    maze[y + d_r][x + d_c] != 0
+                    and filled[near] != 1
+                    and not parent[near]
+                ):
+                    parent[near] = code
+                    queue.append(near)
+        if not parent[goal] or source == goal:
+            return [], searched
+        moves = []
+        cell = goal
+        while cell != source:
+            name, d_r, d_c = MOVES[parent[cell] - 1]
+            moves.append(name)
+            cell -= d_r * cols + d_c
+        moves.reverse()
+        return moves, searched
+
+    def mark(
+        self, maze: list[list[int]], path: List[str], screen: Any
+    ) -> None:
+        """Draw the found path on the maze and animate it."""
+        row, col = self.start
+        for move in path:
+            d_r, d_c = STEPS[move]
+            maze[row + d_r][col + d_c] = CELL.FIND.value
+            row += 2 * d_r
+            col += 2 * d_c
+            if maze[row][col] == CELL.PATH.value:
+                maze[row][col] = CELL.FIND.value
+            screen.step(maze)
+        screen.flush(maze)
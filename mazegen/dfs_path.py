@@ -1,6 +1,7 @@
 from typing import List, Tuple, Set, Optional, Any
 from constant import CELL
-import time
+from .stats import Stats
+from .frames import FrameScheduler
 
 
 class DFS:
@@ -29,7 +30,10 @@ class DFS:
         self.end = (temp_end[1], temp_end[0])
 
     def find_path_dfs(
-        self, maze_matrix: List[List[int]], screen: Optional[Any] = None
+        self,
+        maze_matrix: List[List[int]],
+        screen: Optional[Any] = None,
+        stats: Optional[Stats] = None,
     ) -> List[str]:
         """
         Find a path from start to end in a maze using Depth-First Search.
@@ -46,8 +50,12 @@ class DFS:
             denote different cell types (walls, empty cells, path markers, etc)
         screen : Optional[Any], optional
             A screen object for real-time visualization of the maze exploration
-            If provided, the maze state is printed and the screen is refreshed
-            at each step. Default is None.
+            If provided (or a `FrameScheduler` wrapping one), every step is
+            passed to the scheduler, which draws the maze when a frame is
+            due. Default is None.
+        stats : Optional[Stats], optional
+            Receives the number of expanded nodes under
+            "solve.nodes_expanded". Default is None.
 
         Returns
         -------
@@ -60,23 +68,26 @@ class DFS:
         -----
         The method modifies maze_matrix in-place to mark visited cells and the
         path. Cell values are checked against CELL enum values (WALL, EMPTY,
-        FIND, PATH). The visualization updates at 60 FPS (1/60 second sleep
-        between updates). Uses a stack data structure to maintain the frontier
-        of unexplored cells.
+        FIND, PATH). The visualization is paced by the scheduler (60 FPS by
+        default). Uses a stack data structure to maintain the frontier of
+        unexplored cells.
         """
-        from mazegen import MazeGenerator
+        if screen is not None:
+            screen = FrameScheduler.of(screen)
 
         stack: List[Tuple[Tuple[int, int], List[str]]] = [((self.start), [])]
         is_visit: Set[Tuple[int, int]] = {self.start}
         moove_matrix = {(-1, 0): "N", (1, 0): "S", (0, -1): "W", (0, 1): "E"}
+        expanded = 0
         while stack:
             current_node, current_path = stack.pop()
+            expanded += 1
             if current_node == self.end:
+                if stats is not None:
+                    stats.count("solve.nodes_expanded", expanded)
                 return current_path
             if screen is not None:
-                MazeGenerator.print_maze(screen, maze_matrix)
-                time.sleep(1 / 60)
-                screen.refresh()
+                screen.step(maze_matrix)
             for (m_x, m_y), direction in moove_matrix.items():
                 pos_x = current_node[0] + m_x
                 pos_y = current_node[1] + m_y
@@ -99,10 +110,15 @@ class DFS:
                             maze_matrix[pos_x][pos_y] = CELL.PATH.value
                         coord_path = current_path + [direction]
                         stack.append(((pos_x, pos_y), coord_path))
+        if stats is not None:
+            stats.count("solve.nodes_expanded", expanded)
         return []
 
     def solve(
-        self, maze: List[List[int]], screen: Optional[Any] = None
+        self,
+        maze: List[List[int]],
+        screen: Optional[Any] = None,
+        stats: Optional[Stats] = None,
     ) -> List[str]:
         """
         Solve the maze using depth-first search pathfinding.
@@ -117,8 +133,12 @@ class DFS:
             A 2D list representing the maze where each cell contains an integer
             value indicating the cell type (empty, wall, start, end, etc.).
         screen : Optional[Any], optional
-            Optional screen object for visualization. If provided, the maze is
-            redrawn after each move at 60 FPS. Default is None.
+            Optional screen object, or `FrameScheduler`, for visualization.
+            If provided, the search and each move of the path are animated.
+            Default is None.
+        stats : Optional[Stats], optional
+            Receives the number of expanded nodes under
+            "solve.nodes_expanded". Default is None.
 
         Returns
         -------
@@ -135,11 +155,14 @@ class DFS:
 
         Notes
         -----
-        This method modifies the input maze in-place, marking visited cells and
-        the found path.
+        When a screen is given, this method modifies the input maze in-place,
+        marking visited cells and the found path. Without a screen it works on
+        a private scratch copy and leaves `maze` untouched.
         """
-        from mazegen import MazeGenerator
-
+        if screen is None:
+            maze = [list(row) for row in maze]
+        else:
+            screen = FrameScheduler.of(screen)
         height = len(maze)
         width = len(maze[0])
         maze[self.start[0]][self.start[1]] = CELL.START.value
@@ -155,7 +178,7 @@ class DFS:
             # return maze
             return []
         maze[x][y] = 7
-        path_dfs = self.find_path_dfs(maze, screen)
+        path_dfs = self.find_path_dfs(maze, screen, stats)
         x, y = self.start
         moove_matrix = {"N": (-1, 0), "S": (1, 0), "W": (0, -1), "E": (0, 1)}
         for coord in path_dfs:
@@ -165,7 +188,7 @@ class DFS:
             x += d_x
             y += d_y
             if screen is not None:
-                MazeGenerator.print_maze(screen, maze)
-                time.sleep(1 / 60)
-                screen.refresh()
+                screen.step(maze)
+        if screen is not None:
+            screen.flush(maze)
         return path_dfs
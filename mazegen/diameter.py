@@ -0,0 +1,69 @@
+from typing import Optional, Sequence, Tuple
+
+from .bulk import flatten, sweep, trace
+
+Point = Tuple[int, int]
+
+REVERSE = bytes.maketrans(b"NSWE", b"SNEW")
+
+
+def longest_path(
+    maze: Sequence[Sequence[int]],
+    entry: Optional[Point] = None,
+    exit: Optional[Point] = None,
+    sweeps: int = 2,
+    origin: Point = (0, 0),
+) -> Tuple[Point, Point, bytes]:
+    """
+    Place the entry and/or exit as far apart as possible.
+
+    With both ends free this is the double sweep: a breadth-first search
+    from any cell reaches an end of a longest shortest path (exactly, when
+    the maze is a tree), and a second search from there reaches the other
+    end. On mazes with loops the result is only a lower bound, so further
+    sweeps bounce from the last end found, keeping the longest pair, up to
+    `sweeps` searches in total. With one end fixed, a single search from it
+    finds the farthest cell. Every search is linear in the number of cells,
+    and the path is read from the parent moves of the last one, so no
+    solver has to run afterwards.
+
+    Args:
+        maze (Sequence[Sequence[int]]): A carved maze grid.
+        entry (Point, optional): A fixed entry as (x, y) in cell units, or
+            None to choose it.
+        exit (Point, optional): A fixed exit as (x, y) in cell units, or
+            None to choose it.
+        sweeps (int, optional): Maximum number of searches when both ends
+            are free; 2 is exact on perfect mazes. Defaults to 2.
+        origin (Point, optional): An open cell, as (x, y), to start the
+            first search from when both ends are free. Defaults to (0, 0).
+
+    Returns:
+        Tuple[Point, Point, bytes]: The entry and the exit as (x, y), and
+            the moves (N, S, W, E) of a shortest path between them.
+
+    Raises:
+        ValueError: If both ends are fixed.
+    """
+    grid = flatten(maze)
+    width = len(maze[0])
+    cols = width // 2
+    if entry is not None and exit is not None:
+        raise ValueError("ENTRY and EXIT are both fixed")
+    fixed = entry if entry is not None else exit
+    if fixed is not None:
+        x, y = fixed
+        parent, (r, c) = sweep(grid, width, (y, x))
+        path = trace(parent, cols, (r, c)) or b""
+        if entry is not None:
+            return entry, (c, r), path
+        return (c, r), (x, y), path[::-1].translate(REVERSE)
+    _, source = sweep(grid, width, (origin[1], origin[0]))
+    best: Tuple[Point, Point, bytes] = ((0, 0), (0, 0), b"")
+    for _ in range(max(sweeps - 1, 1)):
+        parent, target = sweep(grid, width, source)
+        path = trace(parent, cols, target) or b""
+        if len(path) > len(best[2]):
+            best = ((source[1], source[0]), (target[1], target[0]), path)
+        source = target
+    return best
@@ -0,0 +1,114 @@
+from typing import Any, List
+import time
+
+SKIP_KEYS = (ord("s"), ord(" "))
+FASTER_KEYS = (ord("+"), ord("="))
+SLOWER_KEYS = (ord("-"),)
+
+
+class FrameScheduler:
+    """
+    Paces the animation of the generator and the solvers.
+
+    The animated algorithms call `step` after every elementary step instead
+    of drawing and sleeping themselves. Only every `speed`-th step can
+    produce a frame, and a frame is only drawn once `1 / fps` seconds have
+    passed since the previous one ended. The scheduler never sleeps: the
+    algorithm runs at full speed and the steps in between frames are
+    dropped, so the animation lasts about as long as the algorithm plus
+    at most `fps` frames per second of drawing, whatever the grid size.
+    The algorithm itself always runs the same code path as without a
+    screen and produces the same maze.
+
+    While animating, the scheduler polls the screen for keys: 's' or space
+    skips to the end of the current animation, '+' doubles the speed and
+    '-' halves it.
+
+    Attributes
+    ----------
+    screen : Any
+        The curses window (in nodelay mode, as keys are polled from it) or
+        the `AnsiRenderer` drawn on.
+    fps : float
+        Maximum number of frames per second.
+    speed : int
+        Algorithm steps per frame (speed multiplier), at least 1.
+    skipping : bool
+        Whether the rest of the current animation is skipped.
+    frames : int
+        Frames drawn so far, for diagnostics.
+    """
+
+    def __init__(self, screen: Any, fps: float = 60.0, speed: int = 1) -> None:
+        self.screen = screen
+        self.fps = fps
+        self.speed = max(speed, 1)
+        self.skipping = False
+        self.frames = 0
+        self.__pending = 0
+        self.__deadline = 0.0
+
+    @classmethod
+    def of(cls, screen: Any) -> "FrameScheduler":
+        """Return `screen` if it is a scheduler, else a default one for it."""
+        if isinstance(screen, cls):
+            return screen
+        return cls(screen)
+
+    def reset(self) -> None:
+        """Start a new animation: stop skipping and forget pending steps."""
+        self.skipping = False
+        self.__pending = 0
+
+    def step(self, maze: List[List[int]], hide: bool = False) -> None:
+        """
+        Record one algorithm step and draw a frame if one is due.
+
+        Parameters
+        ----------
+        maze : List[List[int]]
+            The grid being animated.
+        hide : bool, optional
+            Passed to `MazeGenerator.print_maze`. Default is False.
+        """
+        self.__pending += 1
+        if self.skipping or self.__pending < self.speed:
+            return
+        self.poll()
+        if self.skipping:
+            return
+        if time.perf_counter() < self.__deadline:
+            return
+        self.draw(maze, hide)
+        self.__deadline = time.perf_counter() + 1 / self.fps
+
+    def flush(self, maze: List[List[int]], hide: bool = False) -> None:
+        """Draw the final state of an animation, even when skipping."""
+        self.draw(maze, hide)
+        self.reset()
+
+    def draw(self, maze: List[List[int]], hide: bool = False) -> None:
+        """Render `maze` now, with curses or with an `AnsiRenderer`."""
+        from mazegen import MazeGenerator
+        from .ansi import AnsiRenderer
+
+        self.__pending = 0
+        self.frames += 1
+        if isinstance(self.screen, AnsiRenderer):
+            self.screen.render(maze, hide)
+            return
+        MazeGenerator.print_maze(self.screen, maze, hide)
+        self.screen.refresh()
+
+    def poll(self) -> None:
+        """Handle the keys typed since the last frame, without blocking."""
+        getch = getattr(self.screen, "getch", None)
+        if getch is None:
+            return
+        while (key := getch()) != -1:
+            if key in SKIP_KEYS:
+                self.skipping = True
+            elif key in FASTER_KEYS:
+                self.speed *= 2
+            elif key in SLOWER_KEYS:
+                self.speed = max(self.speed // 2, 1)
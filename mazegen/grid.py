@@ -0,0 +1,178 @@
+from typing import Any, Iterator, Literal
+import mmap
+import os
+import struct
+
+MAGIC = b"MZG1"
+HEADER = struct.Struct("<4sII")
+
+
+class MappedGrid:
+    """
+    A maze grid stored in a memory-mapped file, one byte per position.
+
+    The grid behaves like the usual list of rows: `grid[x][y]` reads or
+    writes a CELL value, `len(grid)` is the height and iterating yields the
+    rows, so `maze_gen`, the solvers and the hex encoder work on it
+    unchanged. Rows are `memoryview` slices of the mapping, so only the
+    pages actually touched are loaded and the operating system can evict
+    them, which allows grids larger than RAM. Row-major traversals (the hex
+    encoder, `clear_all`, the imperfection pass) read the file sequentially.
+
+    The file is a 12-byte header (magic, height, width) followed by the raw
+    rows, so `open` can reuse a grid without any parsing.
+
+    Attributes
+    ----------
+    filename : str
+        The backing file.
+    height : int
+        Number of rows.
+    width : int
+        Number of columns.
+    """
+
+    def __init__(
+        self, filename: str, height: int, width: int, writable: bool
+    ) -> None:
+        self.filename = filename
+        self.height = height
+        self.width = width
+        with open(filename, "r+b" if writable else "rb") as file:
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            self.__mm = mmap.mmap(file.fileno(), 0, access=access)
+        self.__view = memoryview(self.__mm)[HEADER.size:]
+
+    @classmethod
+    def create(cls, filename: str, height: int, width: int) -> "MappedGrid":
+        """
+        Create a grid file filled with walls (0).
+
+        The file is extended with `truncate`, so on most file systems it is
+        sparse and creating even a huge grid is instantaneous. It is built
+        under a temporary name and renamed over `filename`, so a grid still
+        mapped from an earlier file of that name keeps its own data (the
+        old file is freed once that grid is closed) instead of being
+        truncated under it.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the grid file, replaced if it exists.
+        height : int
+            Number of rows.
+        width : int
+            Number of columns.
+
+        Returns
+        -------
+        MappedGrid
+            A writable grid.
+        """
+        temporary = f"{filename}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(HEADER.pack(MAGIC, height, width))
+            file.truncate(HEADER.size + height * width)
+        os.replace(temporary, filename)
+        return cls(filename, height, width, writable=True)
+
+    @classmethod
+    def open(cls, filename: str, writable: bool = False) -> "MappedGrid":
+        """
+        Map an existing grid file.
+
+        Parameters
+        ----------
+        filename : str
+            Path of a file written by `create`.
+        writable : bool, optional
+            Map the file for writing. Default is False.
+
+        Returns
+        -------
+        MappedGrid
+            The mapped grid.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a grid file or is truncated.
+        """
+        with open(filename, "rb") as file:
+            header = file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise ValueError("Invalid grid file")
+        magic, height, width = HEADER.unpack(header)
+        expected = HEADER.size + height * width
+        if magic != MAGIC or os.path.getsize(filename) != expected:
+            raise ValueError("Invalid grid file")
+        return cls(filename, height, width, writable)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, index: int) -> memoryview:
+        if index < 0:
+            index += self.height
+        if not 0 <= index < self.height:
+            raise IndexError("grid row out of range")
+        start = index * self.width
+        return self.__view[start:start + self.width]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for index in range(self.height):
+            yield self[index]
+
+    def flush(self) -> None:
+        """Write dirty pages back to the file."""
+        self.__mm.flush()
+
+    def close(self) -> None:
+        """
+        Flush and unmap the grid.
+
+        Row views handed out earlier must have been released, otherwise the
+        mapping cannot be closed and a BufferError is raised.
+        """
+        self.__view.release()
+        if not self.__mm.closed:
+            self.__mm.close()
+
+    def __enter__(self) -> "MappedGrid":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def scratch(
+    count: int, fmt: Literal["B", "i"], on_disk: bool = False
+) -> memoryview:
+    """
+    Allocate a zero-filled scratch buffer of `count` items.
+
+    Parameters
+    ----------
+    count : int
+        Number of items.
+    fmt : {"B", "i"}
+        "B" for unsigned bytes, "i" for 32-bit ints.
+    on_disk : bool, optional
+        Back the buffer with an unlinked temporary file instead of RAM, so
+        solving a `MappedGrid` does not need memory proportional to the
+        maze. Default is False.
+
+    Returns
+    -------
+    memoryview
+        A writable view of `count` items of type `fmt`.
+    """
+    size = count * struct.calcsize(fmt)
+    if not on_disk:
+        return memoryview(bytearray(size)).cast(fmt)
+    import tempfile
+
+    with tempfile.TemporaryFile() as file:
+        file.truncate(max(size, 1))
+        mm = mmap.mmap(file.fileno(), 0)
+    return memoryview(mm)[:size].cast(fmt)
@@ -0,0 +1,133 @@
+from typing import IO, Iterable, List, Optional, Sequence, Tuple
+import gzip
+import lzma
+import os
+
+Point = Tuple[int, int]
+
+# Compression selected by the output file extension.
+SUFFIXES = {".gz": "gzip", ".xz": "lzma", ".lzma": "lzma"}
+# Canonical extension of each compression.
+EXTENSIONS = {"none": "", "gzip": ".gz", "lzma": ".xz"}
+# Leading bytes of the compressed formats, used by the loader.
+MAGIC = {b"\x1f\x8b": "gzip", b"\xfd7zXZ\x00": "lzma"}
+# Hex rows only use 16 symbols: gzip beyond level 3 costs 4x the time for
+# 4% smaller files, so it stays fast and lzma is the archival choice.
+GZIP_LEVEL = 3
+LZMA_PRESET = 6
+
+
+def codec(filename: str, compression: Optional[str] = None) -> str:
+    """
+    Return the compression to write `filename` with.
+
+    Args:
+        filename (str): The output file.
+        compression (str, optional): "none", "gzip" or "lzma"; None picks
+            it from the extension (.gz, .xz or .lzma). Defaults to None.
+
+    Returns:
+        str: "none", "gzip" or "lzma".
+
+    Raises:
+        ValueError: If `compression` is unknown.
+    """
+    if compression is None:
+        return SUFFIXES.get(os.path.splitext(filename)[1].lower(), "none")
+    if compression not in EXTENSIONS:
+        raise ValueError(f"Unknown compression: {compression}")
+    return compression
+
+
+def open_output(filename: str, compression: Optional[str] = None) -> IO[str]:
+    """
+    Open a text file for writing, compressing on the fly if requested.
+
+    The compressed streams are fed as the text is written, so a maze is
+    compressed row by row and never held whole in memory.
+    """
+    kind = codec(filename, compression)
+    if kind == "gzip":
+        return gzip.open(
+            filename, "wt", compresslevel=GZIP_LEVEL, encoding="ascii"
+        )
+    if kind == "lzma":
+        return lzma.open(filename, "wt", preset=LZMA_PRESET, encoding="ascii")
+    return open(filename, "w", encoding="ascii")
+
+
+def open_input(filename: str) -> IO[str]:
+    """
+    Open a hex file for reading, decompressing it if needed.
+
+    The format is recognized from the first bytes of the file, whatever
+    its name.
+    """
+    with open(filename, "rb") as file:
+        head = file.read(6)
+    for magic, kind in MAGIC.items():
+        if head.startswith(magic):
+            if kind == "gzip":
+                return gzip.open(filename, "rt", encoding="ascii")
+            return lzma.open(filename, "rt", encoding="ascii")
+    return open(filename, "r", encoding="ascii")
+
+
+def write(
+    filename: str,
+    rows: Iterable[str],
+    start: Point,
+    end: Point,
+    path: Sequence[str],
+    compression: Optional[str] = None,
+) -> None:
+    """
+    Write a maze in the hexadecimal output format.
+
+    Args:
+        filename (str): The output file.
+        rows (Iterable[str]): The hex rows, e.g. from `iter_hex_maze`;
+            consumed lazily.
+        start (Point): The entry, written as "x,y".
+        end (Point): The exit, written as "x,y".
+        path (Sequence[str]): The solution moves.
+        compression (str, optional): See `codec`. Defaults to None.
+    """
+    with open_output(filename, compression) as file:
+        for row in rows:
+            file.write(row + "\n")
+        file.write(f"\n{start[0]},{start[1]}\n{end[0]},{end[1]}\n")
+        file.write("".join(path) + "\n")
+
+
+def read(filename: str) -> Tuple[List[str], Point, Point, str]:
+    """
+    Load a file written by `write` or `output_maze`, compressed or not.
+
+    Returns:
+        Tuple[List[str], Point, Point, str]: The hex rows, the entry, the
+            exit and the solution moves.
+
+    Raises:
+        ValueError: If the file cannot be read or is not a maze.
+    """
+    try:
+        with open_input(filename) as file:
+            rows = []
+            for line in file:
+                line = line.rstrip("\n")
+                if not line:
+                    break
+                rows.append(line)
+            tail = [line.rstrip("\n") for line in file]
+    except (OSError, EOFError, lzma.LZMAError) as e:
+        raise ValueError(f"Cannot read maze {filename}: {e}") from e
+    if len(tail) < 2 or not rows:
+        raise ValueError(f"Invalid maze file {filename}")
+    try:
+        x, y = (int(v) for v in tail[0].split(","))
+        end_x, end_y = (int(v) for v in tail[1].split(","))
+    except ValueError:
+        raise ValueError(f"Invalid maze file {filename}") from None
+    path = tail[2] if len(tail) > 2 else ""
+    return rows, (x, y), (end_x, end_y), path
@@ -0,0 +1,361 @@
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import heapq
+
+from .astar import AStar
+from .dead_end import DeadEndFiller
+from .stats import Stats
+
+# Cell offsets and names of the four moves.
+MOVES = (("N", -1, 0), ("S", 1, 0), ("W", 0, -1), ("E", 0, 1))
+# Mazes with at most this many cells are solved by DeadEndFiller directly.
+FALLBACK_CELLS = 64 * 64
+
+SOURCE = -1
+GOAL = -2
+
+
+class ClusterGraph:
+    """
+    Abstract graph of a maze for hierarchical path planning (HPA*).
+
+    The cells are partitioned into `cluster_size` x `cluster_size` square
+    clusters. Every open wall between two cells of different clusters is a
+    crossing, and the cells on both sides are portals. Within a cluster,
+    the distances from a portal to the others are found by one
+    breadth-first search restricted to the cluster, the first time a search
+    expands the portal, and kept: later queries over the same maze only pay
+    for the portals they have not expanded yet.
+
+    As every crossing is a portal and the intra-cluster distances are
+    exact, a shortest path on the abstract graph refines into a shortest
+    path of the maze.
+
+    The graph only reads walls, so path markers written into the maze do
+    not invalidate it; a maze whose walls change needs a new graph.
+
+    Attributes
+    ----------
+    maze : Sequence[Sequence[int]]
+        The grid the graph was built for.
+    cluster_size : int
+        Side of a cluster, in cells.
+    rows, cols : int
+        Size of the maze, in cells.
+    """
+
+    def __init__(
+        self, maze: Sequence[Sequence[int]], cluster_size: int = 16
+    ) -> None:
+        if cluster_size < 2:
+            raise ValueError("cluster_size must be at least 2")
+        self.maze = maze
+        self.cluster_size = cluster_size
+        self.rows = len(maze) // 2
+        self.cols = len(maze[0]) // 2
+        self.__stride = -(-self.cols // cluster_size)
+        self.__portals: Dict[int, List[int]] = {}
+        self.__distances: Dict[int, Dict[int, int]] = {}
+
+    def cluster(self, cell: int) -> int:
+        """Return the cluster of a cell (row-major index, cell units)."""
+        r, c = divmod(cell, self.cols)
+        size = self.cluster_size
+        return r // size * self.__stride + c // size
+
+    def bounds(self, cluster: int) -> Tuple[int, int, int, int]:
+        """Return the first and last + 1 rows and columns of a cluster."""
+        size = self.cluster_size
+        r, c = divmod(cluster, self.__stride)
+        return (
+            r * size,
+            min((r + 1) * size, self.rows),
+            c * size,
+            min((c + 1) * size, self.cols),
+        )
+
+    def neighbours(self, cell: int) -> List[Tuple[int, str]]:
+        """Return the cells reachable in one move, with the move name."""
+        maze = self.maze
+        r, c = divmod(cell, self.cols)
+        y, x = 2 * r + 1, 2 * c + 1
+        found = []
+        for name, d_r, d_c in MOVES:
+            n_r, n_c = r + d_r, c + d_c
+            if (
+                0 <= n_r < self.rows
+                and 0 <= n_c < self.cols
+                and maze[y + d_r][x + d_c] != 0
+            ):
+                found.append((n_r * self.cols + n_c, name))
+        return found
+
+    def flood(
+        self, source: int, cluster: int
+    ) -> Dict[int, Tuple[int, int, str]]:
+        """
+        Breadth-first search from `source` without leaving `cluster`.
+
+        Returns
+        -------
+        Dict[int, Tuple[int, int, str]]
+            Every reached cell, mapped to its distance, the previous cell
+            and the move from it (-1 and "" for the source).
+        """
+        top, bottom, left, right = self.bounds(cluster)
+        maze = self.maze
+        cols = self.cols
+        reached = {source: (0, -1, "")}
+        queue = deque([source])
+        while queue:
+            cell = queue.popleft()
+            r, c = divmod(cell, cols)
+            y, x = 2 * r + 1, 2 * c + 1
+            dist = reached[cell][0] + 1
+            line = maze[y]
+            for near, move, inside, wall in (
+                (cell - cols, "N", r > top, maze[y - 1][x]),
+                (cell + cols, "S", r + 1 < bottom, maze[y + 1][x]),
+                (cell - 1, "W", c > left, line[x - 1]),
+                (cell + 1, "E", c + 1 < right, line[x + 1]),
+            ):
+                if inside and wall != 0 and near not in reached:
+                    reached[near] = (dist, cell, move)
+                    queue.append(near)
+        return reached
+
+    def crossings(self, cell: int) -> List[Tuple[int, str]]:
+        """Return the open moves from `cell` into other clusters."""
+        own = self.cluster(cell)
+        return [
+            (near, move)
+            for near, move in self.neighbours(cell)
+            if self.cluster(near) != own
+        ]
+
+    def portals(self, cluster: int) -> List[int]:
+        """Return the cells of `cluster` that have a crossing."""
+        top, bottom, left, right = self.bounds(cluster)
+        border = set()
+        for c in range(left, right):
+            border.add(top * self.cols + c)
+            border.add((bottom - 1) * self.cols + c)
+        for r in range(top, bottom):
+            border.add(r * self.cols + left)
+            border.add(r * self.cols + right - 1)
+        return sorted(cell for cell in border if self.crossings(cell))
+
+    def portals_of(self, cluster: int) -> List[int]:
+        """Return the portals of a cluster, computed once and cached."""
+        portals = self.__portals.get(cluster)
+        if portals is None:
+            portals = self.__portals[cluster] = self.portals(cluster)
+        return portals
+
+    def distances(self, portal: int) -> Dict[int, int]:
+        """
+        Return the intra-cluster distances from a portal to the other
+        portals of its cluster.
+
+        Computed by one breadth-first search the first time the portal is
+        expanded, then cached.
+        """
+        table = self.__distances.get(portal)
+        if table is None:
+            cluster = self.cluster(portal)
+            reached = self.flood(portal, cluster)
+            table = self.__distances[portal] = {
+                other: reached[other][0]
+                for other in self.portals_of(cluster)
+                if other != portal and other in reached
+            }
+        return table
+
+    @property
+    def portals_built(self) -> int:
+        """Number of portals whose distances are cached."""
+        return len(self.__distances)
+
+
+class HierarchicalSolver:
+    """
+    Hierarchical (HPA*-style) shortest path solver.
+
+    A query connects the entry and the exit to the portals of their own
+    clusters, runs A* (Manhattan heuristic, ties broken towards the exit)
+    over the abstract graph of `ClusterGraph`, then refines each abstract
+    edge with a breadth-first search inside its cluster. Only the portals
+    on the search frontier are examined, and their distances are kept in
+    the solver's `graph`: pass the same `ClusterGraph` to the solvers of
+    later queries on the maze to reuse them. The graph lives on the solver
+    and is never shared behind the caller's back, so solvers on different
+    threads never contend on a global cache.
+
+    Mazes of at most `FALLBACK_CELLS` cells are handed to `DeadEndFiller`,
+    which is also exact. Animated solves, which have to show every
+    explored cell, are handed to `AStar`; its path is not always the
+    shortest on an imperfect maze.
+
+    Attributes
+    ----------
+    start : Tuple[int, int]
+        Entry position in grid units (row, col).
+    end : Tuple[int, int]
+        Exit position in grid units (row, col).
+    cluster_size : int
+        Side of a cluster, in cells.
+    graph : Optional[ClusterGraph]
+        The abstract graph of the last maze solved; built on the first
+        query, and rebuilt when another maze is given.
+    """
+
+    def __init__(
+        self,
+        start: Tuple[int, int],
+        end: Tuple[int, int],
+        cluster_size: int = 16,
+        graph: Optional[ClusterGraph] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        start : Tuple[int, int]
+            Entry coordinates (x, y) in cell units.
+        end : Tuple[int, int]
+            Exit coordinates (x, y) in cell units.
+        cluster_size : int, optional
+            Side of a cluster, in cells. Default is 16.
+        graph : Optional[ClusterGraph], optional
+            A graph of the maze to solve, e.g. from a previous solver, so
+            its portal distances are reused. Default is None.
+        """
+        self.__cells = (start, end)
+        self.start = (start[1] * 2 + 1, start[0] * 2 + 1)
+        self.end = (end[1] * 2 + 1, end[0] * 2 + 1)
+        self.cluster_size = cluster_size
+        self.graph = graph
+
+    def solve(
+        self,
+        maze: list[list[int]],
+        screen: Optional[Any] = None,
+        stats: Optional[Stats] = None,
+    ) -> list[str]:
+        """
+        Find a shortest path from start to end.
+
+        Parameters
+        ----------
+        maze : list[list[int]]
+            The maze grid; only read.
+        screen : Optional[Any], optional
+            When given, the solve is delegated to `AStar` to be animated.
+            Default is None.
+        stats : Optional[Stats], optional
+            Receives the number of expanded abstract nodes under
+            "solve.nodes_expanded". Default is None.
+
+        Returns
+        -------
+        list[str]
+            The moves (N, S, E, W) from start to end, or an empty list if the
+            end cannot be reached.
+        """
+        rows = len(maze) // 2
+        cols = len(maze[0]) // 2
+        if screen is not None:
+            return AStar(*self.__cells).solve(maze, screen, stats)
+        if rows * cols <= FALLBACK_CELLS:
+            return DeadEndFiller(*self.__cells).solve(maze, stats=stats)
+        graph = self.graph
+        if graph is None or graph.maze is not maze:
+            graph = ClusterGraph(maze, self.cluster_size)
+            self.graph = graph
+        source = self.start[0] // 2 * cols + self.start[1] // 2
+        goal = self.end[0] // 2 * cols + self.end[1] // 2
+        if source == goal:
+            return []
+        source_cluster = graph.cluster(source)
+        goal_cluster = graph.cluster(goal)
+        from_source = graph.flood(source, source_cluster)
+        to_goal = graph.flood(goal, goal_cluster)
+        goal_r, goal_c = divmod(goal, cols)
+
+        def heuristic(cell: int) -> int:
+            r, c = divmod(cell, cols)
+            return abs(r - goal_r) + abs(c - goal_c)
+
+        def edges(node: int) -> List[Tuple[int, int]]:
+            if node == SOURCE:
+                found = [
+                    (portal, from_source[portal][0])
+                    for portal in graph.portals_of(source_cluster)
+                    if portal in from_source
+                ]
+                if goal in from_source:
+                    found.append((GOAL, from_source[goal][0]))
+                return found
+            cluster = graph.cluster(node)
+            found = list(graph.distances(node).items())
+            found.extend((near, 1) for near, _ in graph.crossings(node))
+            if cluster == goal_cluster and node in to_goal:
+                found.append((GOAL, to_goal[node][0]))
+            return found
+
+        cost = {SOURCE: 0}
+        parent = {SOURCE: SOURCE}
+        heap = [(heuristic(source), 0, SOURCE)]
+        closed = set()
+        expanded = 0
+        while heap:
+            _, _, node = heapq.heappop(heap)
+            if node == GOAL:
+                break
+            if node in closed:
+                continue
+            closed.add(node)
+            expanded += 1
+            for near, weight in edges(node):
+                new_cost = cost[node] + weight
+                if near not in cost or new_cost < cost[near]:
+                    cost[near] = new_cost
+                    parent[near] = node
+                    estimate = 0 if near == GOAL else heuristic(near)
+                    heapq.heappush(
+                        heap, (new_cost + estimate, estimate, near)
+                    )
+        if stats is not None:
+            stats.count("solve.nodes_expanded", expanded)
+            stats.peak("hpa.portals_built", graph.portals_built)
+        if GOAL not in parent:
+            return []
+        chain = [GOAL]
+        while chain[-1] != SOURCE:
+            chain.append(parent[chain[-1]])
+        chain.reverse()
+        cells = [source] + chain[1:-1] + [goal]
+        return self.refine(graph, cells)
+
+    @staticmethod
+    def refine(graph: ClusterGraph, cells: List[int]) -> List[str]:
+        """
+        Expand a chain of abstract nodes into moves.
+
+        Consecutive cells of different clusters are joined by their
+        crossing; cells of the same cluster by a breadth-first search
+        inside it.
+        """
+        moves: List[str] = []
+        for a, b in zip(cells, cells[1:]):
+            cluster = graph.cluster(a)
+            if graph.cluster(b) != cluster:
+                moves.append(dict(graph.crossings(a))[b])
+                continue
+            reached = graph.flood(a, cluster)
+            segment = []
+            cell = b
+            while cell != a:
+                _, cell, move = reached[cell]
+                segment.append(move)
+            moves.extend(reversed(segment))
+        return moves
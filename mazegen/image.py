@@ -0,0 +1,243 @@
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import os
+import struct
+import zlib
+
+from constant import CELL
+from .ansi import DEFAULT_COLORS, OTHER_COLOR
+
+Point = Tuple[int, int]
+
+# RGB values of the 16 terminal colors (xterm defaults).
+TERMINAL_RGB = [
+    (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0),
+    (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+    (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+]
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Compressed bytes buffered before an IDAT chunk is written.
+IDAT_SIZE = 1 << 16
+
+
+def palette() -> List[Tuple[int, int, int]]:
+    """
+    Return the RGB color of every cell value from 0 to 15.
+
+    The colors follow the terminal renderers: empty cells, drawn in bold
+    white there, are bright white here.
+    """
+    colors = [
+        TERMINAL_RGB[DEFAULT_COLORS.get(value, OTHER_COLOR)]
+        for value in range(16)
+    ]
+    colors[CELL.EMPTY.value] = TERMINAL_RGB[15]
+    return colors
+
+
+def overlay(start: Point, path: Sequence[str]) -> Dict[int, List[int]]:
+    """
+    Compute the grid positions covered by a solution, grouped by row.
+
+    Args:
+        start (Point): The (row, col) grid position the path starts from.
+        path (Sequence[str]): The moves, as returned by the solvers.
+
+    Returns:
+        Dict[int, List[int]]: The columns to draw as path, per grid row,
+            walls in between included and both ends excluded.
+    """
+    from mazegen import STEPS
+
+    rows: Dict[int, List[int]] = {}
+    row, col = start
+    for move in path:
+        d_row, d_col = STEPS[move]
+        rows.setdefault(row + d_row, []).append(col + d_col)
+        row += 2 * d_row
+        col += 2 * d_col
+        rows.setdefault(row, []).append(col)
+    if path:
+        rows[row].pop()
+    return rows
+
+
+def scanlines(
+    maze: Sequence[Sequence[int]],
+    cell_size: int = 4,
+    path: Optional[Sequence[str]] = None,
+    start: Optional[Point] = None,
+) -> Iterator[bytes]:
+    """
+    Render a maze as RGB scanlines, one grid row at a time.
+
+    A grid row is converted to bytes, and each of its color channels is
+    produced by one `bytes.translate` and written into the scanline with a
+    strided slice assignment per pixel column of a cell, so the per-pixel
+    work runs in C. Only one scanline exists at a time: it is yielded
+    `cell_size` times.
+
+    Args:
+        maze (Sequence[Sequence[int]]): A grid returned by `maze_gen`.
+        cell_size (int, optional): Pixels per grid position, in both
+            directions. Defaults to 4.
+        path (Sequence[str], optional): Solution moves drawn over the maze
+            with the found-path color. Defaults to None.
+        start (Point, optional): The (row, col) grid position `path` starts
+            from; required with `path`. Defaults to None.
+
+    Yields:
+        bytes: One scanline, 3 bytes per pixel.
+
+    Raises:
+        ValueError: If `cell_size` is not positive or `path` is given
+            without `start`.
+    """
+    if cell_size < 1:
+        raise ValueError("cell_size must be at least 1")
+    marks: Dict[int, List[int]] = {}
+    if path is not None:
+        if start is None:
+            raise ValueError("A path needs its start position")
+        marks = overlay(start, path)
+    colors = palette() + [TERMINAL_RGB[OTHER_COLOR]] * 240
+    channels = [
+        bytes(color[channel] for color in colors) for channel in range(3)
+    ]
+    width = len(maze[0])
+    stride = 3 * cell_size
+    line = bytearray(stride * width)
+    for y, row in enumerate(maze):
+        cells = bytes(row)
+        if y in marks:
+            marked = bytearray(cells)
+            for x in marks[y]:
+                marked[x] = CELL.FIND.value
+            cells = bytes(marked)
+        for channel, table in enumerate(channels):
+            values = cells.translate(table)
+            for pixel in range(cell_size):
+                line[3 * pixel + channel::stride] = values
+        scanline = bytes(line)
+        for _ in range(cell_size):
+            yield scanline
+
+
+def write_ppm(
+    file: BinaryIO,
+    maze: Sequence[Sequence[int]],
+    cell_size: int = 4,
+    path: Optional[Sequence[str]] = None,
+    start: Optional[Point] = None,
+) -> None:
+    """Stream a binary PPM (P6) image of the maze to `file`."""
+    width = len(maze[0]) * cell_size
+    height = len(maze) * cell_size
+    file.write(b"P6\n%d %d\n255\n" % (width, height))
+    for scanline in scanlines(maze, cell_size, path, start):
+        file.write(scanline)
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    """Frame `data` as a PNG chunk: length, type, data and CRC."""
+    crc = zlib.crc32(data, zlib.crc32(kind))
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", crc)
+
+
+def write_png(
+    file: BinaryIO,
+    maze: Sequence[Sequence[int]],
+    cell_size: int = 4,
+    path: Optional[Sequence[str]] = None,
+    start: Optional[Point] = None,
+) -> None:
+    """
+    Stream an RGB PNG image of the maze to `file`.
+
+    Scanlines go through one `zlib.compressobj` as they are produced, and
+    the compressed stream is split into IDAT chunks of about IDAT_SIZE
+    bytes, so memory use does not depend on the size of the image.
+    """
+    width = len(maze[0]) * cell_size
+    height = len(maze) * cell_size
+    file.write(PNG_SIGNATURE)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    file.write(png_chunk(b"IHDR", header))
+    compressor = zlib.compressobj(6)
+    pending: List[bytes] = []
+    size = 0
+    for scanline in scanlines(maze, cell_size, path, start):
+        data = compressor.compress(b"\x00" + scanline)
+        if data:
+            pending.append(data)
+            size += len(data)
+        if size >= IDAT_SIZE:
+            file.write(png_chunk(b"IDAT", b"".join(pending)))
+            pending = []
+            size = 0
+    pending.append(compressor.flush())
+    file.write(png_chunk(b"IDAT", b"".join(pending)))
+    file.write(png_chunk(b"IEND", b""))
+
+
+def export(
+    maze: Sequence[Sequence[int]],
+    filename: str,
+    cell_size: int = 4,
+    path: Optional[Sequence[str]] = None,
+    start: Optional[Point] = None,
+) -> None:
+    """
+    Write an image of the maze, as PNG or PPM depending on the extension.
+
+    Args:
+        maze (Sequence[Sequence[int]]): A grid returned by `maze_gen`.
+        filename (str): The output file, ending in .png, .ppm or .pnm.
+        cell_size (int, optional): Pixels per grid position. Defaults to 4.
+        path (Sequence[str], optional): Solution moves to draw.
+            Defaults to None.
+        start (Point, optional): The (row, col) grid position `path` starts
+            from. Defaults to None.
+
+    Raises:
+        ValueError: If the extension is not supported.
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    writers = {".png": write_png, ".ppm": write_ppm, ".pnm": write_ppm}
+    if extension not in writers:
+        raise ValueError(f"Unsupported image format: {filename}")
+    with open(filename, "wb") as file:
+        writers[extension](file, maze, cell_size, path, start)
+
+
+def main() -> None:
+    """Entry point of `python -m mazegen.image`."""
+    from pydantic import ValidationError
+    from mazegen import MazeGenerator
+
+    parser = argparse.ArgumentParser(
+        prog="python -m mazegen.image",
+        description="Export a maze and its solution as a PNG or PPM image.",
+    )
+    parser.add_argument("config", help="config file")
+    parser.add_argument("output", help="image file (.png, .ppm or .pnm)")
+    parser.add_argument("--cell-size", type=int, default=4)
+    parser.add_argument("--no-path", action="store_true")
+    args = parser.parse_args()
+    try:
+        generator = MazeGenerator(args.config)
+        path = None if args.no_path else generator.path
+        export(
+            generator.maze, args.output, args.cell_size, path, generator.start
+        )
+    except ValidationError as e:
+        for error in e.errors():
+            print(error["msg"])
+    except ValueError as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    main()
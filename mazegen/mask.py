@@ -0,0 +1,263 @@
+from collections import deque
+from typing import List, Sequence, Tuple
+
+Point = Tuple[int, int]
+
+BLOCKED = 5
+
+# The mandatory "42", one character per cell.
+FORTY_TWO_TEXT = """\
+X...XXX
+X.....X
+XXX.XXX
+..X.X..
+..X.XXX
+"""
+
+
+class Mask:
+    """
+    A pattern of blocked cells stamped into a maze before carving.
+
+    Blocked cells are set to 5, like the "42" pattern, so the carvers never
+    enter them and the renderer draws them as obstacles. Masks are in cell
+    units: the mask cell (row, col) placed at offset (x, y) covers the maze
+    cell (y + row, x + col).
+
+    Attributes
+    ----------
+    rows : List[bytes]
+        One byte per cell, 1 when blocked, 0 when open.
+    height : int
+        Number of rows of the mask.
+    width : int
+        Number of columns of the mask.
+    """
+
+    def __init__(self, rows: Sequence[bytes]) -> None:
+        if not rows or not rows[0]:
+            raise ValueError("Empty mask")
+        if any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("Mask rows have different lengths")
+        self.rows = [bytes(row) for row in rows]
+        self.height = len(rows)
+        self.width = len(rows[0])
+        self.__stamps = [
+            row.translate(bytes.maketrans(b"\x01", bytes([BLOCKED])))
+            for row in self.rows
+        ]
+
+    @classmethod
+    def from_text(cls, text: str) -> "Mask":
+        """
+        Build a mask from text, one line per row and one character per cell.
+
+        '.', ' ' and '0' are open cells, any other character is blocked.
+        Shorter lines are padded with open cells; blank lines at the start
+        and the end are ignored.
+
+        Parameters
+        ----------
+        text : str
+            The mask drawing.
+
+        Returns
+        -------
+        Mask
+            The parsed mask.
+        """
+        lines = text.strip("\n").splitlines()
+        width = max((len(line) for line in lines), default=0)
+        return cls(
+            [
+                bytes(char not in ". 0" for char in line.ljust(width))
+                for line in lines
+            ]
+        )
+
+    @classmethod
+    def from_pbm(cls, data: bytes) -> "Mask":
+        """
+        Build a mask from a PBM bitmap, black pixels being blocked cells.
+
+        Both the plain (P1) and the raw (P4) variants are supported, so any
+        image editor (or `convert logo.png logo.pbm`) can produce masks.
+
+        Parameters
+        ----------
+        data : bytes
+            The content of the PBM file.
+
+        Returns
+        -------
+        Mask
+            The parsed mask.
+
+        Raises
+        ------
+        ValueError
+            If the data is not a PBM bitmap or is truncated.
+        """
+        fields: List[bytes] = []
+        pos = 0
+        while len(fields) < 3:
+            while pos < len(data) and data[pos:pos + 1].isspace():
+                pos += 1
+            if data[pos:pos + 1] == b"#":
+                pos = data.find(b"\n", pos)
+                if pos == -1:
+                    break
+                continue
+            end = pos
+            while end < len(data) and not data[end:end + 1].isspace():
+                end += 1
+            if end == pos:
+                break
+            fields.append(data[pos:end])
+            pos = end
+        if len(fields) < 3 or fields[0] not in (b"P1", b"P4"):
+            raise ValueError("Invalid PBM mask")
+        width, height = int(fields[1]), int(fields[2])
+        if fields[0] == b"P1":
+            bits = bytes(c - 48 for c in data[pos:] if c in b"01")
+            rows = [bits[i * width:(i + 1) * width] for i in range(height)]
+        else:
+            stride = (width + 7) // 8
+            raw = data[pos + 1:]
+            rows = [
+                bytes(
+                    raw[i * stride + j // 8] >> (7 - j % 8) & 1
+                    for j in range(width)
+                )
+                for i in range(height)
+                if len(raw) >= (i + 1) * stride
+            ]
+        if len(rows) != height or any(len(row) != width for row in rows):
+            raise ValueError("Truncated PBM mask")
+        return cls(rows)
+
+    @classmethod
+    def load(cls, filename: str) -> "Mask":
+        """
+        Read a mask file: a PBM bitmap if it starts with P1/P4, text
+        otherwise.
+
+        Raises
+        ------
+        ValueError
+            If the file cannot be read or parsed.
+        """
+        try:
+            with open(filename, "rb") as file:
+                data = file.read()
+        except OSError as e:
+            raise ValueError(f"Cannot read mask {filename}: {e}") from e
+        if data[:2] in (b"P1", b"P4"):
+            return cls.from_pbm(data)
+        return cls.from_text(data.decode())
+
+    def centered(self, height: int, width: int) -> Point:
+        """Return the (x, y) offset centering the mask in a maze."""
+        return (width - self.width) // 2, (height - self.height) // 2
+
+    def fits(self, height: int, width: int, offset: Point) -> bool:
+        """Tell whether the mask placed at `offset` lies inside the maze."""
+        x, y = offset
+        return (
+            0 <= x and x + self.width <= width
+            and 0 <= y and y + self.height <= height
+        )
+
+    def stamp(self, maze: List[List[int]], offset: Point) -> None:
+        """
+        Write the blocked cells into a fresh grid of walls.
+
+        Each mask row is written with one strided slice assignment over the
+        cell positions of its grid row, which works for lists and for
+        `MappedGrid` rows alike.
+
+        Parameters
+        ----------
+        maze : List[List[int]]
+            A grid of walls, in grid units (2 * cells + 1).
+        offset : Point
+            Position (x, y) of the mask in cell units.
+        """
+        x, y = offset
+        start = 2 * x + 1
+        stop = start + 2 * self.width
+        for row, stamp in enumerate(self.__stamps):
+            maze[2 * (y + row) + 1][start:stop:2] = stamp
+
+    def blocked(self, height: int, width: int, offset: Point) -> bytearray:
+        """
+        Rasterize the mask over a whole maze.
+
+        Returns
+        -------
+        bytearray
+            One byte per maze cell, row-major, 1 when blocked.
+        """
+        x, y = offset
+        cells = bytearray(height * width)
+        for row, bits in enumerate(self.rows):
+            start = (y + row) * width + x
+            cells[start:start + self.width] = bits
+        return cells
+
+
+def check(
+    blocked: bytearray, height: int, width: int, points: Sequence[Point]
+) -> None:
+    """
+    Validate a masked maze before anything is carved.
+
+    One breadth-first search over the open cells checks that they form a
+    single region, so every carver reaches all of them and any entry can
+    reach any exit.
+
+    Parameters
+    ----------
+    blocked : bytearray
+        The rasterized mask (see `Mask.blocked`).
+    height : int
+        Maze height in cells.
+    width : int
+        Maze width in cells.
+    points : Sequence[Point]
+        (x, y) cells that must be open, such as the entry and the exit.
+
+    Raises
+    ------
+    ValueError
+        If a point is blocked or the open cells are disconnected.
+    """
+    for x, y in points:
+        if blocked[y * width + x]:
+            raise ValueError(f"Cell {x},{y} is blocked by the mask")
+    try:
+        source = blocked.index(0)
+    except ValueError:
+        raise ValueError("The mask blocks every cell") from None
+    seen = bytearray(blocked)
+    seen[source] = 1
+    queue = deque([source])
+    reached = 1
+    while queue:
+        cell = queue.popleft()
+        r, c = divmod(cell, width)
+        for near, inside in (
+            (cell - width, r > 0),
+            (cell + width, r < height - 1),
+            (cell - 1, c > 0),
+            (cell + 1, c < width - 1),
+        ):
+            if inside and not seen[near]:
+                seen[near] = 1
+                reached += 1
+                queue.append(near)
+    if reached != blocked.count(0):
+        raise ValueError("The mask splits the maze into disconnected parts")
+
+
+FORTY_TWO = Mask.from_text(FORTY_TWO_TEXT)
@@ -0,0 +1,103 @@
+from typing import Any, Dict, Optional, Sequence
+
+
+def compute(
+    maze: Sequence[Sequence[int]], path: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Grade a maze in a single row-major pass over its cells.
+
+    Every cell is visited once, reading only its own grid row and the wall
+    rows just above and below it, so the cost is linear and a memory-mapped
+    grid is read sequentially. Straight corridors are followed with one
+    running counter for the current row and one per column.
+
+    Args:
+        maze (Sequence[Sequence[int]]): A grid returned by `maze_gen`;
+            START, EXIT and path markers count as open cells, walls (0) and
+            42-pattern cells (5) are ignored.
+        path (Sequence[str], optional): The solution moves, used for the
+            solution metrics. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: JSON-ready metrics:
+            cells: number of open cells.
+            dead_ends: cells with a single opening.
+            junctions: cells with three or four openings.
+            branching_factor: mean number of onward choices (openings minus
+                the one arrived from) over the cells that are not dead ends.
+            corridors: histogram {length: count} of the maximal straight
+                runs of at least two cells, horizontal and vertical.
+            mean_corridor / max_corridor: mean and longest run length.
+            river_factor: mean length, in moves, of the passages between
+                two decision points (dead ends and junctions): openings
+                over the openings of those cells. High for long winding
+                rivers, close to 1 for bushy mazes.
+            solution_length: number of moves of `path` (if given).
+            solution_ratio: solution length over the number of cells.
+    """
+    rows = len(maze) // 2
+    cols = len(maze[0]) // 2
+    cells = 0
+    dead_ends = 0
+    junctions = 0
+    choices = 0
+    passages = 0
+    openings = 0
+    branch_ends = 0
+    corridors: Dict[int, int] = {}
+    column = [0] * cols
+    for r in range(rows):
+        above = maze[2 * r]
+        line = maze[2 * r + 1]
+        below = maze[2 * r + 2]
+        run = 0
+        for c in range(cols):
+            y = 2 * c + 1
+            if line[y] == 0 or line[y] == 5:
+                continue
+            north = above[y] != 0
+            south = below[y] != 0
+            west = line[y - 1] != 0
+            east = line[y + 1] != 0
+            degree = north + south + west + east
+            cells += 1
+            openings += degree
+            if degree != 2:
+                branch_ends += degree
+            if degree == 1:
+                dead_ends += 1
+            elif degree > 1:
+                passages += 1
+                choices += degree - 1
+                if degree > 2:
+                    junctions += 1
+            run += 1
+            if not east:
+                if run > 1:
+                    corridors[run] = corridors.get(run, 0) + 1
+                run = 0
+            column[c] += 1
+            if not south:
+                if column[c] > 1:
+                    corridors[column[c]] = corridors.get(column[c], 0) + 1
+                column[c] = 0
+    runs = sum(corridors.values())
+    metrics: Dict[str, Any] = {
+        "cells": cells,
+        "dead_ends": dead_ends,
+        "junctions": junctions,
+        "branching_factor": choices / passages if passages else 0.0,
+        "corridors": dict(sorted(corridors.items())),
+        "mean_corridor": (
+            sum(k * v for k, v in corridors.items()) / runs if runs else 0.0
+        ),
+        "max_corridor": max(corridors, default=0),
+        "river_factor": (
+            openings / branch_ends if branch_ends else openings / 2
+        ),
+    }
+    if path is not None:
+        metrics["solution_length"] = len(path)
+        metrics["solution_ratio"] = len(path) / cells if cells else 0.0
+    return metrics
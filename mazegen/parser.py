@@ -0,0 +1,137 @@
+from typing import Any, Dict, Iterator, Tuple
+import json
+import os
+import sys
+
+CONFIG_KEYS = (
+    "HEIGHT",
+    "WIDTH",
+    "ENTRY",
+    "EXIT",
+    "PERFECT",
+    "SEED",
+    "OUTPUT_FILE",
+    "GRID_FILE",
+    "ALGORITHM",
+    "TILE_SIZE",
+    "MAX_FRONTIER",
+    "MASK",
+    "MASK_OFFSET",
+    "COMPRESSION",
+    "CHECKPOINT",
+    "CHECKPOINT_INTERVAL",
+)
+
+# Keys with a default in `Config`: only passed on when the file sets them.
+OPTIONAL_KEYS = (
+    "GRID_FILE",
+    "ALGORITHM",
+    "TILE_SIZE",
+    "MAX_FRONTIER",
+    "MASK",
+    "MASK_OFFSET",
+    "COMPRESSION",
+    "CHECKPOINT",
+    "CHECKPOINT_INTERVAL",
+)
+
+
+def parse_config_text(text: str) -> Dict[str, str]:
+    """
+    Parse the KEY=VALUE configuration format into a dictionary.
+
+    Blank lines and lines starting with '#' are ignored, an optional
+    'export ' prefix is dropped, values may be wrapped in single or double
+    quotes, and an unquoted value ends at ' #' (inline comment). Later
+    occurrences of a key override earlier ones. The process environment is
+    neither read nor modified.
+
+    Args:
+        text (str): The content of a configuration file.
+
+    Returns:
+        Dict[str, str]: Every key found, mapped to its raw string value.
+
+    Example:
+        >>> parse_config_text("# size\\nWIDTH=20\\nENTRY='0,0'  # top left")
+        {'WIDTH': '20', 'ENTRY': '0,0'}
+    """
+    values: Dict[str, str] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] == "#":
+            continue
+        if line.startswith("export "):
+            line = line[7:]
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        value = value.strip()
+        quote = value[:1]
+        if quote in ("'", '"') and value.find(quote, 1) != -1:
+            value = value[1:value.index(quote, 1)]
+        else:
+            comment = value.find(" #")
+            if comment != -1:
+                value = value[:comment].rstrip()
+        values[key.strip()] = value
+    return values
+
+
+def parse_config_file(filename: str) -> Dict[str, str]:
+    """
+    Read and parse one configuration file.
+
+    Args:
+        filename (str): Path to the configuration file.
+
+    Returns:
+        Dict[str, str]: The parsed keys, or an empty dictionary if the file
+            cannot be read.
+    """
+    try:
+        with open(filename, encoding="utf-8") as file:
+            return parse_config_text(file.read())
+    except OSError:
+        return {}
+
+
+def load_configs(source: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Lazily load many configurations for batch runs.
+
+    `source` may be a directory (every regular file in it is parsed as a
+    KEY=VALUE configuration, in name order), a JSONL file where each line is
+    a JSON object with the same keys, or '-' to read JSONL from stdin.
+
+    Args:
+        source (str): A directory, a .jsonl file or '-'.
+
+    Yields:
+        Tuple[str, Dict[str, Any]]: A name for the configuration (the file
+            name, or 'line-N' for JSONL input) and its keys.
+
+    Raises:
+        ValueError: If a JSONL line is not a JSON object.
+    """
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            path = os.path.join(source, name)
+            if os.path.isfile(path):
+                yield name, parse_config_file(path)
+        return
+    if source == "-":
+        yield from _load_jsonl(sys.stdin)
+        return
+    with open(source, encoding="utf-8") as stream:
+        yield from _load_jsonl(stream)
+
+
+def _load_jsonl(stream: Any) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        data = json.loads(line)
+        if not isinstance(data, dict):
+            raise ValueError(f"line {number}: expected a JSON object")
+        yield f"line-{number}", data
@@ -0,0 +1,281 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import json
+
+# The only configuration keys a client may send: anything touching files
+# (OUTPUT_FILE, GRID_FILE, CHECKPOINT, MASK) stays under the server's control.
+REQUEST_KEYS = (
+    "WIDTH",
+    "HEIGHT",
+    "ENTRY",
+    "EXIT",
+    "PERFECT",
+    "SEED",
+    "ALGORITHM",
+)
+
+Result = Tuple[List[str], List[str], Tuple[int, int], Tuple[int, int]]
+
+
+def build_maze(params: Dict[str, Any], encode: bool = True) -> Result:
+    """
+    Generate, solve and encode one maze; runs inside a worker process.
+
+    Parameters
+    ----------
+    params : Dict[str, Any]
+        Configuration fields, keyed by their config file names (WIDTH,
+        HEIGHT, ENTRY, EXIT, PERFECT, SEED, OUTPUT_FILE, ...).
+    encode : bool, optional
+        Encode the maze rows; a "solve" request does not need them.
+        Default is True.
+
+    Returns
+    -------
+    Result
+        The hex rows of the maze (empty when `encode` is False), the A*
+        solution path, and the entry and exit (which differ from ENTRY/EXIT
+        when they are "auto").
+    """
+    from mazegen import Config, MazeGenerator
+
+    generator = MazeGenerator(config=Config(**params))
+    rows: List[str] = []
+    if encode:
+        rows = list(generator.iter_hex_maze(generator.maze))
+    return rows, generator.path, generator.start_pos, generator.end_pos
+
+
+class MazeServer:
+    """
+    asyncio front-end serving maze generation over a local TCP socket.
+
+    The protocol is newline-delimited JSON. Each request is one object with
+    an "action" ("generate" or "solve") and the config file keys listed in
+    `REQUEST_KEYS`; the keys naming files are rejected:
+
+        {"action": "generate", "WIDTH": 20, "HEIGHT": 15, "ENTRY": "0,0",
+         "EXIT": "19,14", "PERFECT": true, "SEED": 42}
+
+    A "generate" request is answered with one {"row": "..."} line per maze
+    row, written once the worker has returned the encoded rows, followed by
+    a final {"entry": [x, y], "exit": [x, y], "path": "..."} line. A "solve"
+    request only gets the final line. Failures are reported as
+    {"error": "..."}.
+
+    Generation, solving and hex encoding run in a process pool, so the event
+    loop only writes the encoded rows. At most `max_pending` jobs
+    are submitted to the pool at once, slow readers are throttled through
+    `drain()`, and concurrent requests for the same seeded config share a
+    single job.
+
+    Attributes
+    ----------
+    pool : ProcessPoolExecutor
+        The worker processes doing the CPU-bound work.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: int = 64):
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.__slots = asyncio.Semaphore(max_pending)
+        self.__inflight: Dict[str, "asyncio.Future[Result]"] = {}
+
+    async def compute(
+        self, params: Dict[str, Any], encode: bool = True
+    ) -> Result:
+        """
+        Run `build_maze` in the pool, coalescing identical seeded requests.
+
+        Parameters
+        ----------
+        params : Dict[str, Any]
+            Validated configuration fields.
+        encode : bool, optional
+            Have the worker encode the hex rows. Default is True.
+
+        Returns
+        -------
+        Result
+            The hex rows, solution path, entry and exit.
+        """
+        if params.get("SEED") is None:
+            return await self.__submit(params, encode)
+        key = json.dumps([params, encode], sort_keys=True)
+        future = self.__inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.__submit(params, encode))
+            self.__inflight[key] = future
+            future.add_done_callback(lambda _: self.__inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def __submit(self, params: Dict[str, Any], encode: bool) -> Result:
+        async with self.__slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.pool, build_maze, params, encode
+            )
+
+    @staticmethod
+    def parse_request(line: bytes) -> Tuple[str, Dict[str, Any]]:
+        """
+        Decode and validate one request line.
+
+        Parameters
+        ----------
+        line : bytes
+            A JSON object terminated by a newline.
+
+        Returns
+        -------
+        Tuple[str, Dict[str, Any]]
+            The action and the normalized configuration fields: only the
+            keys of the request, with coordinates written back as "x,y".
+
+        Raises
+        ------
+        ValueError
+            If the line is not a JSON object, the action is unknown, a key
+            is not in `REQUEST_KEYS` or the configuration is invalid.
+        """
+        from mazegen import Config
+
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+        action = request.pop("action", "generate")
+        if action not in ("generate", "solve"):
+            raise ValueError(f"unknown action: {action}")
+        unknown = sorted(set(request) - set(REQUEST_KEYS))
+        if unknown:
+            raise ValueError(f"unsupported keys: {', '.join(unknown)}")
+        request["OUTPUT_FILE"] = "-"
+        config = Config(**request)
+        params = config.model_dump(by_alias=True, exclude_unset=True)
+        for key, value in params.items():
+            if isinstance(value, tuple):
+                params[key] = ",".join(map(str, value))
+        return action, params
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Serve the requests of one client connection until it closes.
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            The client input stream.
+        writer : asyncio.StreamWriter
+            The client output stream.
+        """
+        from pydantic import ValidationError
+
+        try:
+            while line := await reader.readline():
+                try:
+                    action, params = self.parse_request(line)
+                    rows, path, entry, end = await self.compute(
+                        params, action == "generate"
+                    )
+                except ValidationError as e:
+                    message = "; ".join(error["msg"] for error in e.errors())
+                    await self.send(writer, {"error": message})
+                    continue
+                except Exception as e:
+                    await self.send(writer, {"error": str(e)})
+                    continue
+                for row in rows:
+                    await self.send(writer, {"row": row})
+                footer = {
+                    "entry": list(entry),
+                    "exit": list(end),
+                    "path": "".join(path),
+                }
+                await self.send(writer, footer)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def send(writer: asyncio.StreamWriter, data: Dict[str, Any]) -> None:
+        """Write one response line, waiting while the client is behind."""
+        writer.write(json.dumps(data).encode() + b"\n")
+        await writer.drain()
+
+    async def serve(self, host: str, port: int) -> None:
+        """
+        Listen on host:port and serve clients forever.
+
+        Parameters
+        ----------
+        host : str
+            The address to bind, normally a loopback address.
+        port : int
+            The TCP port to bind.
+        """
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self.pool.shutdown(cancel_futures=True)
+
+
+async def request(
+    host: str, port: int, payload: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Minimal local client: send one request and collect its response lines.
+
+    Parameters
+    ----------
+    host : str
+        The server address.
+    port : int
+        The server port.
+    payload : Dict[str, Any]
+        The request object (see `MazeServer`).
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Every response line, up to and including the final or error line.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(json.dumps(payload).encode() + b"\n")
+    await writer.drain()
+    lines: List[Dict[str, Any]] = []
+    while True:
+        data: Dict[str, Any] = json.loads(await reader.readline())
+        lines.append(data)
+        if "row" not in data:
+            break
+    writer.close()
+    await writer.wait_closed()
+    return lines
+
+
+def main() -> None:
+    """Entry point of `python -m mazegen.serve`."""
+    parser = argparse.ArgumentParser(prog="python -m mazegen.serve")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4242)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-pending", type=int, default=64)
+    args = parser.parse_args()
+    server = MazeServer(args.workers, args.max_pending)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+from typing import Callable, Dict, Tuple
+from .astar import AStar, MazeSolver
+from .dead_end import DeadEndFiller
+from .dfs_path import DFS
+from .hpa import HierarchicalSolver
+from .wall_follower import WallFollower
+
+SolverFactory = Callable[[Tuple[int, int], Tuple[int, int]], MazeSolver]
+
+SOLVERS: Dict[str, SolverFactory] = {
+    "astar": AStar,
+    "dfs": DFS,
+    "hpa": HierarchicalSolver,
+    "dead_end": DeadEndFiller,
+    "wall_follower": WallFollower,
+}
+
+DEFAULT_SOLVER = "astar"
+
+
+def register_solver(name: str, factory: SolverFactory) -> None:
+    """
+    Make a solver available to the comparison harness and to the CLI.
+
+    Parameters
+    ----------
+    name : str
+        The name the solver is registered under, e.g. "astar".
+    factory : SolverFactory
+        A callable building the solver from the entry and exit coordinates
+        (in cell units, as in the configuration file). Solver classes whose
+        constructor takes (start, end) can be registered directly.
+
+    Raises
+    ------
+    ValueError
+        If a solver is already registered under `name`.
+    """
+    if name in SOLVERS:
+        raise ValueError(f"Solver already registered: {name}")
+    SOLVERS[name] = factory
+
+
+def make_solver(
+    start: Tuple[int, int], end: Tuple[int, int], name: str = DEFAULT_SOLVER
+) -> MazeSolver:
+    """
+    Build a registered solver.
+
+    Parameters
+    ----------
+    start : Tuple[int, int]
+        Entry coordinates (x, y) in cell units.
+    end : Tuple[int, int]
+        Exit coordinates (x, y) in cell units.
+    name : str, optional
+        The registered solver name. Default is DEFAULT_SOLVER.
+
+    Returns
+    -------
+    MazeSolver
+        The solver instance.
+
+    Raises
+    ------
+    ValueError
+        If no solver is registered under `name`.
+    """
+    try:
+        factory = SOLVERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown solver: {name}") from None
+    return factory(start, end)
@@ -0,0 +1,123 @@
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterator, List, Tuple
+import time
+
+_DISABLED: ContextManager[None] = nullcontext()
+
+
+class Stats:
+    """
+    Opt-in instrumentation: per-phase timers, counters and spans.
+
+    A disabled instance (the default) turns every call into a no-op: `phase`
+    returns a shared null context and `count`/`peak` return immediately, so
+    instrumented code pays almost nothing when profiling is off. Hot loops
+    should still accumulate into locals and report once at the end.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether measurements are recorded.
+    timings : Dict[str, int]
+        Total nanoseconds spent in each phase.
+    counters : Dict[str, int]
+        Event counters (summed with `count`, maximised with `peak`).
+    spans : List[Tuple[str, int, int, int]]
+        Every recorded phase as (name, thread id, start ns, duration ns).
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.timings: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+        self.spans: List[Tuple[str, int, int, int]] = []
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """
+        Time a block of code under `name`.
+
+        Parameters
+        ----------
+        name : str
+            Phase name, e.g. "carve" or "solve".
+
+        Returns
+        -------
+        ContextManager[None]
+            A context manager measuring its body with `perf_counter_ns`.
+        """
+        if not self.enabled:
+            return _DISABLED
+        return self.__measure(name)
+
+    @contextmanager
+    def __measure(self, name: str) -> Iterator[None]:
+        import threading
+
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - start
+            self.timings[name] = self.timings.get(name, 0) + duration
+            self.spans.append((name, threading.get_ident(), start, duration))
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add `value` to the counter `name`."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def peak(self, name: str, value: int) -> None:
+        """Keep the largest `value` ever reported for the counter `name`."""
+        if self.enabled:
+            self.counters[name] = max(self.counters.get(name, 0), value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the timings (in nanoseconds) and counters."""
+        return {
+            "timings_ns": dict(self.timings),
+            "counters": dict(self.counters),
+        }
+
+    def report(self) -> str:
+        """Return a human readable summary, one line per phase or counter."""
+        lines = [
+            f"{name:<24} {ns / 1e6:>12.3f} ms"
+            for name, ns in sorted(self.timings.items())
+        ]
+        lines += [
+            f"{name:<24} {value:>12}"
+            for name, value in sorted(self.counters.items())
+        ]
+        return "\n".join(lines)
+
+    def export_spans(self, filename: str) -> None:
+        """
+        Write the recorded spans in the Chrome trace event format.
+
+        The file can be opened with chrome://tracing or Perfetto.
+
+        Parameters
+        ----------
+        filename : str
+            Destination JSON file.
+        """
+        import json
+        import os
+
+        pid = os.getpid()
+        events = [
+            {
+                "name": name,
+                "ph": "X",
+                "pid": pid,
+                "tid": tid,
+                "ts": start / 1000,
+                "dur": duration / 1000,
+            }
+            for name, tid, start, duration in self.spans
+        ]
+        with open(filename, "w") as file:
+            json.dump(
+                {"traceEvents": events, "otherData": self.counters}, file
+            )
@@ -0,0 +1,105 @@
+from typing import Any, Dict, List, Sequence
+
+
+def find(parent: List[int], cell: int) -> int:
+    """Return the root of `cell`, halving the path on the way."""
+    while parent[cell] != cell:
+        parent[cell] = parent[parent[cell]]
+        cell = parent[cell]
+    return cell
+
+
+def verify(maze: Sequence[Sequence[int]]) -> Dict[str, Any]:
+    """
+    Check the structure of a maze with a union-find over its cells.
+
+    The grid is read once in row-major order. Every open cell is a node and
+    every open wall between two open cells an edge; each edge unions its two
+    cells (union by size, path halving), which costs near-constant amortized
+    time, so the whole check is near-linear in the number of cells.
+
+    Args:
+        maze (Sequence[Sequence[int]]): A grid returned by `maze_gen`;
+            START, EXIT and path markers count as open cells, walls (0) and
+            42-pattern cells (5) are ignored.
+
+    Returns:
+        Dict[str, Any]: JSON-ready results:
+            cells: number of open cells.
+            edges: number of passages between open cells.
+            components: number of connected regions of open cells.
+            cycles: number of independent loops, edges - cells + components
+                (0 for a forest).
+            is_tree: the open cells are connected and without loops, which
+                is what a perfect maze must be.
+    """
+    rows = len(maze) // 2
+    cols = len(maze[0]) // 2
+    parent = list(range(rows * cols))
+    size = [1] * (rows * cols)
+    cells = 0
+    edges = 0
+    components = 0
+    for r in range(rows):
+        line = maze[2 * r + 1]
+        below = maze[2 * r + 2]
+        following = maze[2 * r + 3] if r + 1 < rows else None
+        base = r * cols
+        for c in range(cols):
+            y = 2 * c + 1
+            if line[y] == 0 or line[y] == 5:
+                continue
+            cells += 1
+            components += 1
+            cell = base + c
+            neighbours = []
+            if c + 1 < cols and line[y + 1] not in (0, 5):
+                if line[y + 2] not in (0, 5):
+                    neighbours.append(cell + 1)
+            if following is not None and below[y] not in (0, 5):
+                if following[y] not in (0, 5):
+                    neighbours.append(cell + cols)
+            for near in neighbours:
+                edges += 1
+                a = find(parent, cell)
+                b = find(parent, near)
+                if a == b:
+                    continue
+                if size[a] < size[b]:
+                    a, b = b, a
+                parent[b] = a
+                size[a] += size[b]
+                components -= 1
+    cycles = edges - cells + components
+    return {
+        "cells": cells,
+        "edges": edges,
+        "components": components,
+        "cycles": cycles,
+        "is_tree": components == 1 and cycles == 0,
+    }
+
+
+def check(maze: Sequence[Sequence[int]], perfect: bool) -> Dict[str, Any]:
+    """
+    Verify a maze and raise if it breaks the generator's guarantees.
+
+    Args:
+        maze (Sequence[Sequence[int]]): A grid returned by `maze_gen`.
+        perfect (bool): The maze must be a tree, not only connected.
+
+    Returns:
+        Dict[str, Any]: The result of `verify`.
+
+    Raises:
+        ValueError: If the open cells are not connected, or if a perfect
+            maze has loops.
+    """
+    report = verify(maze)
+    if report["components"] > 1:
+        raise ValueError(
+            f"Maze is not connected: {report['components']} components"
+        )
+    if perfect and report["cycles"]:
+        raise ValueError(f"Perfect maze has {report['cycles']} cycles")
+    return report
@@ -0,0 +1,163 @@
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+from constant import CELL
+from .stats import Stats
+from .frames import FrameScheduler
+from .dead_end import DeadEndFiller
+
+# Headings in clockwise order: a right turn is +1, a left turn -1.
+HEADINGS = (("N", -1, 0), ("E", 0, 1), ("S", 1, 0), ("W", 0, -1))
+OPPOSITE = {"N": "S", "S": "N", "E": "W", "W": "E"}
+
+
+class WallFollower:
+    start: Tuple[int, int]
+    end: Tuple[int, int]
+
+    def __init__(self, start: Tuple[int, int], end: Tuple[int, int]) -> None:
+        """
+        Initialize the right-hand wall follower.
+
+        Parameters
+        ----------
+        start : Tuple[int, int]
+            Entry coordinates (x, y) in cell units.
+        end : Tuple[int, int]
+            Exit coordinates (x, y) in cell units.
+
+        Notes
+        -----
+        The coordinates are stored in grid units as (row, col), like
+        `AStar`.
+        """
+        self.start = (start[1] * 2 + 1, start[0] * 2 + 1)
+        self.end = (end[1] * 2 + 1, end[0] * 2 + 1)
+
+    def walk(self, maze: Sequence[Sequence[int]]) -> Iterator[str]:
+        """
+        Follow the wall on the right hand from the entry to the exit.
+
+        The walker keeps only its position and heading: at each step it
+        turns right if it can, else goes straight, else left, else back.
+        Only the walls around the current cell are read, so the walk works
+        on grids streamed from disk (`MappedGrid`) with constant memory.
+
+        The walk stops at the exit, or when it leaves the entry in the same
+        direction as the first time: it would then repeat itself, as the
+        exit is not on the walls the walker can follow (it is unreachable,
+        or surrounded by a loop of an imperfect maze).
+
+        Parameters
+        ----------
+        maze : Sequence[Sequence[int]]
+            The maze grid; only read.
+
+        Yields
+        ------
+        str
+            Every move (N, E, S, W) of the walk, dead ends included.
+        """
+        row, col = self.start
+        if (row, col) == self.end:
+            return
+        heading = 0
+        initial = -1
+        while True:
+            for turn in (1, 0, 3, 2):
+                name, d_r, d_c = HEADINGS[(heading + turn) % 4]
+                if maze[row + d_r][col + d_c] != 0:
+                    heading = (heading + turn) % 4
+                    break
+            else:
+                return
+            if (row, col) == self.start:
+                if heading == initial:
+                    return
+                if initial == -1:
+                    initial = heading
+            row += 2 * d_r
+            col += 2 * d_c
+            yield name
+            if (row, col) == self.end:
+                return
+
+    def solve(
+        self,
+        maze: list[list[int]],
+        screen: Optional[Any] = None,
+        stats: Optional[Stats] = None,
+    ) -> list[str]:
+        """
+        Solve the maze by following the right-hand wall.
+
+        The search itself needs O(1) memory (see `walk`). The moves of the
+        walk are reduced on the fly by cancelling every move followed by its
+        opposite, which removes the dead ends explored: in a perfect maze
+        the result is the unique, hence shortest, path; in an imperfect one
+        it is a valid path that may be longer than the shortest.
+
+        In an imperfect maze the walk only reaches the exit when both
+        endpoints are on the wall it follows. When it would repeat itself
+        instead, the maze is solved by `DeadEndFiller`, which needs memory
+        linear in the number of cells but always finds the (shortest) path
+        if there is one.
+
+        Parameters
+        ----------
+        maze : list[list[int]]
+            A 2D list representing the maze grid.
+        screen : Optional[Any], optional
+            A curses screen, or a `FrameScheduler` wrapping one: every cell
+            walked on is marked as explored and the walk is animated, then
+            the path is marked as found. Default is None.
+        stats : Optional[Stats], optional
+            Receives the number of moves walked under
+            "solve.nodes_expanded", plus the cells expanded by the
+            fallback. Default is None.
+
+        Returns
+        -------
+        list[str]
+            The moves (N, S, E, W) from start to end, or an empty list if the
+            end cannot be reached.
+
+        Notes
+        -----
+        Without a screen `maze` is only read.
+        """
+        if screen is not None:
+            screen = FrameScheduler.of(screen)
+        steps = {name: (d_r, d_c) for name, d_r, d_c in HEADINGS}
+        path: List[str] = []
+        walked = 0
+        row, col = self.start
+        for move in self.walk(maze):
+            walked += 1
+            if path and path[-1] == OPPOSITE[move]:
+                path.pop()
+            else:
+                path.append(move)
+            d_r, d_c = steps[move]
+            row += 2 * d_r
+            col += 2 * d_c
+            if screen is not None:
+                if maze[row][col] == CELL.EMPTY.value:
+                    maze[row][col] = CELL.PATH.value
+                screen.step(maze)
+        if stats is not None:
+            stats.count("solve.nodes_expanded", walked)
+        if (row, col) != self.end:
+            cells = [(c // 2, r // 2) for r, c in (self.start, self.end)]
+            fallback = DeadEndFiller(cells[0], cells[1])
+            return fallback.solve(maze, screen, stats)
+        if screen is not None:
+            row, col = self.start
+            for move in path:
+                d_r, d_c = steps[move]
+                maze[row + d_r][col + d_c] = CELL.FIND.value
+                row += 2 * d_r
+                col += 2 * d_c
+                if maze[row][col] == CELL.PATH.value:
+                    maze[row][col] = CELL.FIND.value
+                screen.step(maze)
+            screen.flush(maze)
+        return path
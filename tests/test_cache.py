@@ -0,0 +1,91 @@
+import os
+from typing import Any, Dict, List
+
+import mazegen
+from mazegen import Config
+from mazegen.cache import CacheEntry, ResultCache
+
+PARAMS: Dict[str, Any] = {
+    "WIDTH": 8,
+    "HEIGHT": 6,
+    "ENTRY": "0,0",
+    "EXIT": "7,5",
+    "PERFECT": True,
+    "SEED": 1,
+    "OUTPUT_FILE": "-",
+}
+
+
+def make_entry(n: int) -> CacheEntry:
+    maze = [[n % 8] * 9 for _ in range(7)]
+    return CacheEntry(tuple(map(bytes, maze)), [f"{n:x}" * 4] * 3, "NESW")
+
+
+def disk_size(directory: Any) -> int:
+    return sum(item.stat().st_size for item in os.scandir(directory))
+
+
+def test_key_follows_mask_content_and_version(
+    tmp_path: Any, monkeypatch: Any
+) -> None:
+    mask = tmp_path / "mask.txt"
+    mask.write_text("#.\n.#\n")
+    config = Config(**PARAMS, MASK=str(mask))
+    first = ResultCache.key(config)
+    assert ResultCache.key(config) == first
+    mask.write_text("##\n..\n")
+    assert ResultCache.key(config) != first
+    second = ResultCache.key(config)
+    monkeypatch.setattr(mazegen, "__version__", "0.0.0-test")
+    assert ResultCache.key(config) != second
+
+
+def test_put_get_round_trips_through_pack(tmp_path: Any) -> None:
+    entry = make_entry(3)
+    assert ResultCache.unpack(ResultCache.pack(entry)) == entry
+    cache = ResultCache(str(tmp_path))
+    key = ResultCache.key(Config(**PARAMS))
+    maze = [list(row) for row in entry.maze]
+    stored = cache.put(key, maze, entry.hex_rows, list(entry.path))
+    assert stored == entry
+    # A new cache only has the file: the entry is read back through mmap.
+    reloaded = ResultCache(str(tmp_path)).get(key)
+    assert reloaded is not None
+    assert [bytes(row) for row in reloaded.maze] == list(entry.maze)
+    assert reloaded.hex_rows == entry.hex_rows
+    assert reloaded.path == entry.path
+
+
+def test_disk_lru_stays_under_max_bytes(tmp_path: Any) -> None:
+    entry = make_entry(0)
+    size = len(ResultCache.pack(entry))
+    cache = ResultCache(str(tmp_path), max_bytes=3 * size)
+    keys: List[str] = [f"k{n}" for n in range(6)]
+    for key in keys[:3]:
+        cache.put(key, entry.maze, entry.hex_rows, entry.path)
+    # A memory hit also makes the file the most recently used.
+    cache.get(keys[0])
+    for key in keys[3:5]:
+        cache.put(key, entry.maze, entry.hex_rows, entry.path)
+        assert disk_size(tmp_path) <= 3 * size
+    names = sorted(item.name for item in os.scandir(tmp_path))
+    assert names == ["k0.mzc", "k3.mzc", "k4.mzc"]
+    # The index is rebuilt from the directory by a new cache.
+    reopened = ResultCache(str(tmp_path), max_bytes=3 * size)
+    reopened.put(keys[5], entry.maze, entry.hex_rows, entry.path)
+    assert disk_size(tmp_path) <= 3 * size
+    assert len(os.listdir(tmp_path)) == 3
+
+
+def test_memory_lru_stays_under_memory_bytes(tmp_path: Any) -> None:
+    size = make_entry(0).size()
+    cache = ResultCache(str(tmp_path), memory_bytes=2 * size)
+    for n in range(3):
+        entry = make_entry(n)
+        cache.put(f"k{n}", entry.maze, entry.hex_rows, entry.path)
+    for item in os.scandir(tmp_path):
+        os.remove(item.path)
+    # Only the two most recent entries fit in memory.
+    assert cache.get("k0") is None
+    assert cache.get("k1") == make_entry(1)
+    assert cache.get("k2") == make_entry(2)
@@ -0,0 +1,98 @@
+import json
+import os
+from typing import Any, Dict, List
+
+import pytest
+
+from mazegen import Config, MazeGenerator
+from mazegen.batch import finished, run
+from mazegen.checkpoint import CARVE, Checkpointer
+
+
+def hex_output(checkpoint: str = "") -> List[str]:
+    params: Dict[str, Any] = {
+        "WIDTH": 120,
+        "HEIGHT": 90,
+        "ENTRY": "0,0",
+        "EXIT": "119,89",
+        "PERFECT": False,
+        "SEED": 11,
+        "OUTPUT_FILE": "-",
+    }
+    if checkpoint:
+        params["CHECKPOINT"] = checkpoint
+        params["CHECKPOINT_INTERVAL"] = 1e-9
+    generator = MazeGenerator(config=Config(**params))
+    return list(generator.iter_hex_maze(generator.maze))
+
+
+def test_resumed_generation_matches_uninterrupted_run(
+    tmp_path: Any, monkeypatch: Any
+) -> None:
+    checkpoint = str(tmp_path / "maze.ckpt")
+    save = Checkpointer.save
+
+    def interrupt(self: Checkpointer, phase: int, *args: Any) -> None:
+        save(self, phase, *args)
+        if phase == CARVE and self.saves == 2:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(Checkpointer, "save", interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        hex_output(checkpoint)
+    monkeypatch.undo()
+    assert os.path.exists(checkpoint)
+
+    load = Checkpointer.load
+    resumed: List[int] = []
+
+    def record(self: Checkpointer, maze: Any) -> Any:
+        state = load(self, maze)
+        resumed.append(state.phase if state is not None else 0)
+        return state
+
+    monkeypatch.setattr(Checkpointer, "load", record)
+    assert hex_output(checkpoint) == hex_output()
+    assert resumed == [CARVE]
+    assert not os.path.exists(checkpoint)
+
+
+def test_batch_rerun_rebuilds_only_missing_mazes(tmp_path: Any) -> None:
+    source = tmp_path / "configs.jsonl"
+    with open(source, "w") as file:
+        for size in range(4, 10):
+            config = {
+                "WIDTH": size,
+                "HEIGHT": size,
+                "ENTRY": "0,0",
+                "EXIT": f"{size - 1},{size - 1}",
+                "PERFECT": True,
+            }
+            file.write(json.dumps(config) + "\n")
+    output = tmp_path / "out"
+    checkpoints = str(tmp_path / "ckpt")
+    metadata = output / "metadata.jsonl"
+    records = list(run(str(source), str(output), seed=5))
+    with open(metadata, "w") as file:
+        for record in records:
+            file.write(json.dumps(record) + "\n")
+    contents = {
+        record["file"]: (output / record["file"]).read_bytes()
+        for record in records
+    }
+
+    # A crash cut the metadata inside the fifth record, and the output of
+    # the second maze was lost.
+    lines = metadata.read_text().splitlines(keepends=True)
+    metadata.write_text("".join(lines[:4]) + lines[4][:20])
+    os.remove(output / records[1]["file"])
+
+    done = finished(str(output), str(metadata))
+    assert sorted(done) == sorted(records[i]["name"] for i in (0, 2, 3))
+    rebuilt = list(run(str(source), str(output), 1, 5, checkpoints, done))
+    assert [record["name"] for record in rebuilt] == [
+        records[i]["name"] for i in (1, 4, 5)
+    ]
+    assert rebuilt == [records[i] for i in (1, 4, 5)]
+    for name, data in contents.items():
+        assert (output / name).read_bytes() == data
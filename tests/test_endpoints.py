@@ -0,0 +1,29 @@
+from typing import Any, Dict
+
+from mazegen import Config, MazeGenerator
+
+
+def make_generator(entry: str, end: str, perfect: bool) -> MazeGenerator:
+    params: Dict[str, Any] = {
+        "WIDTH": 20,
+        "HEIGHT": 14,
+        "ENTRY": entry,
+        "EXIT": end,
+        "PERFECT": perfect,
+        "SEED": 7,
+        "OUTPUT_FILE": "-",
+    }
+    return MazeGenerator(config=Config(**params))
+
+
+def test_auto_endpoints_keep_the_maze_stable_across_calls() -> None:
+    for entry, end in (("auto", "auto"), ("0,0", "auto"), ("auto", "5,5")):
+        for perfect in (True, False):
+            generator = make_generator(entry, end, perfect)
+            first = generator.snapshot(generator.maze)
+            endpoints = (generator.start_pos, generator.end_pos)
+            for _ in range(3):
+                maze = generator.maze_gen()
+                assert generator.snapshot(maze) == first
+                assert (generator.start_pos, generator.end_pos) == endpoints
+                assert generator.generate()[0] == first
@@ -0,0 +1,37 @@
+import os
+import time
+from typing import Any, Dict
+
+from mazegen import Config, MazeGenerator
+from mazegen.ansi import AnsiRenderer
+from mazegen.frames import FrameScheduler
+
+
+def make_generator(size: int) -> MazeGenerator:
+    params: Dict[str, Any] = {
+        "WIDTH": size,
+        "HEIGHT": size,
+        "ENTRY": "0,0",
+        "EXIT": f"{size - 1},{size - 1}",
+        "PERFECT": True,
+        "SEED": 3,
+        "OUTPUT_FILE": "-",
+    }
+    return MazeGenerator(config=Config(**params))
+
+
+def test_large_maze_animates_in_bounded_time() -> None:
+    generator = make_generator(100)
+    expected = generator.snapshot(generator.maze)
+    fd = os.open(os.devnull, os.O_WRONLY)
+    try:
+        frames = FrameScheduler(AnsiRenderer(fd), fps=60, speed=1)
+        started = time.perf_counter()
+        maze = generator.maze_gen(frames)
+        elapsed = time.perf_counter() - started
+    finally:
+        os.close(fd)
+    assert generator.snapshot(maze) == expected
+    # 10 000 cells at one frame per 1/60 s would take about three minutes.
+    assert elapsed < 20
+    assert frames.frames <= 60 * elapsed + 2
@@ -0,0 +1,36 @@
+from typing import Any, Dict
+
+from mazegen import Config, MazeGenerator
+from mazegen.grid import MappedGrid
+
+
+def test_creating_a_grid_file_keeps_earlier_grids(tmp_path: Any) -> None:
+    path = str(tmp_path / "maze.grid")
+    first = MappedGrid.create(path, 3, 4)
+    first[1][2] = 7
+    second = MappedGrid.create(path, 2, 2)
+    assert bytes(first[1]) == bytes([0, 0, 7, 0])
+    with MappedGrid.open(path) as reopened:
+        assert (reopened.height, reopened.width) == (2, 2)
+    second.close()
+    first.close()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["maze.grid"]
+
+
+def test_generate_with_grid_file_keeps_the_first_maze(tmp_path: Any) -> None:
+    params: Dict[str, Any] = {
+        "WIDTH": 12,
+        "HEIGHT": 9,
+        "ENTRY": "0,0",
+        "EXIT": "11,8",
+        "PERFECT": False,
+        "SEED": 4,
+        "OUTPUT_FILE": "-",
+        "GRID_FILE": str(tmp_path / "maze.grid"),
+    }
+    generator = MazeGenerator(config=Config(**params))
+    first = generator.snapshot(generator.maze)
+    generator.seed = 5
+    second = generator.snapshot(generator.maze_gen())
+    assert second != first
+    assert generator.snapshot(generator.maze) == first
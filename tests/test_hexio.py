@@ -0,0 +1,40 @@
+from typing import Any, Dict
+
+import pytest
+
+from mazegen import Config, MazeGenerator
+from mazegen.hexio import EXTENSIONS, read, write
+
+
+def make_generator() -> MazeGenerator:
+    params: Dict[str, Any] = {
+        "WIDTH": 25,
+        "HEIGHT": 17,
+        "ENTRY": "0,0",
+        "EXIT": "24,16",
+        "PERFECT": False,
+        "SEED": 9,
+        "OUTPUT_FILE": "-",
+    }
+    return MazeGenerator(config=Config(**params))
+
+
+@pytest.mark.parametrize("compression", ["gzip", "lzma"])
+def test_compressed_output_reads_back_as_plain(
+    tmp_path: Any, compression: str
+) -> None:
+    generator = make_generator()
+    rows = generator.convert_hex_maze(generator.maze)
+    args = (rows, generator.start_pos, generator.end_pos, generator.path)
+    plain = tmp_path / "maze.txt"
+    packed = tmp_path / f"maze.txt{EXTENSIONS[compression]}"
+    write(str(plain), *args)
+    write(str(packed), *args, compression)
+    assert packed.read_bytes() != plain.read_bytes()
+    assert read(str(packed)) == read(str(plain))
+    assert read(str(plain)) == (
+        rows,
+        generator.start_pos,
+        generator.end_pos,
+        "".join(generator.path),
+    )
@@ -0,0 +1,38 @@
+from pathlib import Path
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+LAZY = ("pydantic", "dotenv", "curses")
+
+
+def test_import_mazegen_does_not_load_heavy_modules() -> None:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mazegen"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    imported = {
+        line.rsplit("|", 1)[-1].strip().split(".")[0]
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert imported, "no -X importtime output"
+    assert not imported & set(LAZY)
+
+
+def test_lazy_modules_absent_from_sys_modules() -> None:
+    code = (
+        "import sys, mazegen; "
+        f"print(sorted(set({LAZY!r}) & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,32 @@
+from typing import Any, Dict
+
+import pytest
+
+from mazegen import Config, MazeGenerator
+
+
+def make_generator(mask: str, offset: str) -> MazeGenerator:
+    params: Dict[str, Any] = {
+        "WIDTH": 10,
+        "HEIGHT": 6,
+        "ENTRY": "0,0",
+        "EXIT": "9,5",
+        "PERFECT": True,
+        "SEED": 2,
+        "OUTPUT_FILE": "-",
+        "MASK": mask,
+        "MASK_OFFSET": offset,
+    }
+    return MazeGenerator(config=Config(**params))
+
+
+def test_mask_splitting_the_grid_is_rejected(tmp_path: Any) -> None:
+    wall = tmp_path / "wall.txt"
+    wall.write_text("X\n" * 6)
+    with pytest.raises(ValueError, match="disconnected"):
+        make_generator(str(wall), "4,0")
+    # With one gap the same wall leaves a connected maze.
+    wall.write_text("X\n" * 5 + ".\n")
+    generator = make_generator(str(wall), "4,0")
+    assert generator.maze[1][9] == 5
+    assert generator.path
@@ -0,0 +1,49 @@
+from typing import Any, Dict, List
+import asyncio
+
+from mazegen import Config, MazeGenerator
+from mazegen.serve import MazeServer, request
+
+PARAMS: Dict[str, Any] = {
+    "WIDTH": 16,
+    "HEIGHT": 10,
+    "ENTRY": "0,0",
+    "EXIT": "15,9",
+    "PERFECT": False,
+    "SEED": 5,
+}
+
+
+async def exchange(payloads: List[Dict[str, Any]]) -> List[Any]:
+    maze_server = MazeServer(workers=1)
+    server = await asyncio.start_server(maze_server.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        return [await request("127.0.0.1", port, p) for p in payloads]
+    finally:
+        server.close()
+        await server.wait_closed()
+        maze_server.close()
+
+
+def test_generate_and_solve_round_trip() -> None:
+    generator = MazeGenerator(config=Config(OUTPUT_FILE="-", **PARAMS))
+    generate, solve = asyncio.run(
+        exchange(
+            [
+                {"action": "generate", **PARAMS},
+                {"action": "solve", **PARAMS, "ENTRY": [0, 0]},
+            ]
+        )
+    )
+    path = "".join(generator.path)
+    footer = {"entry": [0, 0], "exit": [15, 9], "path": path}
+    rows = generator.convert_hex_maze(generator.maze)
+    assert generate == [{"row": row} for row in rows] + [footer]
+    assert solve == [footer]
+
+
+def test_file_keys_are_rejected() -> None:
+    for key in ("GRID_FILE", "CHECKPOINT", "MASK", "OUTPUT_FILE"):
+        (lines,) = asyncio.run(exchange([{**PARAMS, key: "/tmp/x"}]))
+        assert len(lines) == 1 and key in lines[0]["error"]
@@ -0,0 +1,59 @@
+from typing import Any, Dict, List, Sequence, Tuple
+
+from mazegen import Config, MazeGenerator
+from mazegen.solvers import SOLVERS, make_solver
+from mazegen.wall_follower import WallFollower
+
+MOVES = {"N": (-1, 0), "E": (0, 1), "S": (1, 0), "W": (0, -1)}
+
+
+def make_generator(seed: int, end: str) -> MazeGenerator:
+    params: Dict[str, Any] = {
+        "WIDTH": 15,
+        "HEIGHT": 11,
+        "ENTRY": "0,0",
+        "EXIT": end,
+        "PERFECT": False,
+        "SEED": seed,
+        "OUTPUT_FILE": "-",
+    }
+    return MazeGenerator(config=Config(**params))
+
+
+def reaches(
+    maze: Sequence[Sequence[int]],
+    start: Tuple[int, int],
+    end: Tuple[int, int],
+    path: List[str],
+) -> bool:
+    # DFS moves one grid position at a time, the other solvers one cell.
+    for step in (2, 1):
+        row, col = start[1] * 2 + 1, start[0] * 2 + 1
+        for move in path:
+            d_r, d_c = MOVES[move]
+            row, col = row + step * d_r, col + step * d_c
+            if maze[row - d_r][col - d_c] in (0, 5):
+                break
+            if maze[row][col] in (0, 5):
+                break
+        else:
+            if (row, col) == (end[1] * 2 + 1, end[0] * 2 + 1):
+                return True
+    return False
+
+
+def test_every_solver_finds_a_path_in_braided_mazes() -> None:
+    fallbacks = 0
+    for seed in range(12):
+        for end in ("14,10", "7,5", "3,8"):
+            generator = make_generator(seed, end)
+            maze = generator.maze
+            start, exit_ = generator.start_pos, generator.end_pos
+            walk = list(WallFollower(start, exit_).walk(maze))
+            fallbacks += not reaches(maze, start, exit_, walk)
+            for name in SOLVERS:
+                grid = [list(row) for row in maze]
+                path = make_solver(start, exit_, name).solve(grid)
+                assert reaches(maze, start, exit_, path), (name, seed, end)
+    # Some exits sit inside a loop the right hand never touches.
+    assert fallbacks
@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from mazegen import Config, MazeGenerator
+
+Result = Tuple[Tuple[Tuple[int, ...], ...], List[str]]
+
+
+def make_generator(seed: int, perfect: bool) -> MazeGenerator:
+    params: Dict[str, Any] = {
+        "WIDTH": 24,
+        "HEIGHT": 18,
+        "ENTRY": "0,0",
+        "EXIT": "23,17",
+        "PERFECT": perfect,
+        "SEED": seed,
+        "OUTPUT_FILE": "-",
+    }
+    return MazeGenerator(config=Config(**params))
+
+
+def build(seed: int) -> Result:
+    return make_generator(seed, seed % 2 == 0).generate()
+
+
+def test_32_threads_with_distinct_seeds_match_single_threaded() -> None:
+    seeds = range(32)
+    expected = [build(seed) for seed in seeds]
+    with ThreadPoolExecutor(32) as pool:
+        results = list(pool.map(build, seeds))
+    assert results == expected
+    assert len({result[0] for result in results}) == 32
+
+
+def test_32_threads_sharing_one_generator_match_single_threaded() -> None:
+    generator = make_generator(42, False)
+    expected = generator.generate()
+    with ThreadPoolExecutor(32) as pool:
+        results = list(pool.map(lambda _: generator.generate(), range(32)))
+    assert all(result == expected for result in results)